@@ -1,6 +1,7 @@
 """Utiliza o módulo sys para para poder passar argumentos de linha de comando
 ao QApplication e inicializar a aplicação FinController."""
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -8,6 +9,8 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtCore import Qt
 
+from src.models.enums import StorageFormat
+from src.models.worker_pool import get_default_workers
 from src.ui.gui.main_window import MainWindow
 
 
@@ -22,9 +25,46 @@ QSS_FILE_NAME = "fincontroller_dark.qss"
 QSS_FILE_PATH = get_qss_file_path() / QSS_FILE_NAME
 
 
+def parse_arguments() -> tuple[argparse.Namespace, list[str]]:
+    """Separa os argumentos do FinController dos argumentos repassados ao Qt."""
+    parser = argparse.ArgumentParser(description="FinController - controle de finanças pessoais (GUI)")
+    parser.add_argument(
+        "--formato",
+        type=StorageFormat,
+        choices=list(StorageFormat),
+        default=StorageFormat.JSON,
+        metavar="{json,jsonl}",
+        help="Formato do arquivo de dados (padrão: json). jsonl adiciona transações "
+        "sem reescrever o arquivo",
+    )
+    parser.add_argument(
+        "--processos",
+        type=int,
+        default=get_default_workers(),
+        metavar="N",
+        help="Processos usados na carga e nas estatísticas de arquivos grandes "
+        "(padrão: um por núcleo, até 8; 1 desativa o paralelismo)",
+    )
+    parser.add_argument(
+        "--arquivo",
+        type=Path,
+        default=None,
+        help="Abre um arquivo colunar de transações em modo somente leitura",
+    )
+    parser.add_argument(
+        "--aproximado",
+        action="store_true",
+        help="Estima medianas e percentis por amostragem, em memória constante "
+        "(para arquivos muito grandes)",
+    )
+    arguments, qt_arguments = parser.parse_known_args()
+    return arguments, [sys.argv[0], *qt_arguments]
+
+
 def main():
     """Inicia o Qt Application e a Main Window."""
-    app = QApplication(sys.argv)
+    arguments, qt_arguments = parse_arguments()
+    app = QApplication(qt_arguments)
     app.setStyle("Fusion")
     palette = QPalette()
     palette.setColor(QPalette.Window, QColor("#101214"))
@@ -41,7 +81,12 @@ def main():
     with open(QSS_FILE_PATH, encoding="utf-8") as style_file:
         app.setStyleSheet(style_file.read())
 
-    main_window = MainWindow()
+    main_window = MainWindow(
+        storage_format=arguments.formato,
+        archive_path=arguments.arquivo,
+        load_workers=arguments.processos,
+        approximate_statistics=arguments.aproximado,
+    )
     main_window.show()
     app.exec()
 
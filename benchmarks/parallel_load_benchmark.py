@@ -0,0 +1,80 @@
+"""
+Compara a carga sequencial com a carga paralela (src.models.parallel_loader) usando 1, 2, 4 e 8 processos.
+
+Gera um arquivo sintético em um diretório temporário, nos formatos JSON e JSONL, e mede apenas a conversão e
+validação dos registros (o snapshot binário não é usado aqui).
+
+Uso:
+python -m benchmarks.parallel_load_benchmark [quantidade_de_transacoes]
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.models.transaction import Transaction
+from src.models.enums import IncomeCategory, ExpenseCategory
+import src.models.jsonl_storage as jsonl_storage
+import src.models.parallel_loader as parallel_loader
+
+
+WORKER_COUNTS = (1, 2, 4, 8)
+DEFAULT_TRANSACTION_COUNT = 200_000
+
+
+def build_records(transaction_count: int) -> list[dict]:
+    random_generator = random.Random(42)
+    first_date = date(2015, 1, 1)
+    records = []
+    for transaction_id in range(1, transaction_count + 1):
+        is_income = random_generator.random() < 0.3
+        category = random_generator.choice(list(IncomeCategory if is_income else ExpenseCategory))
+        transaction_date = first_date + timedelta(days=random_generator.randrange(3650))
+        records.append({
+            "amount": round(random_generator.uniform(1, 5000), 2),
+            "transaction_type": "receita" if is_income else "despesa",
+            "transaction_date": transaction_date.strftime("%d/%m/%Y"),
+            "category": category.value,
+            "description": f"Descrição {random_generator.randrange(5000)}",
+            "transaction_id": transaction_id,
+        })
+
+    return records
+
+
+def measure(function, *args) -> float:
+    Transaction.reset_transaction_counter()
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    transaction_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TRANSACTION_COUNT
+    records = build_records(transaction_count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = Path(directory) / "transactions.json"
+        jsonl_path = Path(directory) / "transactions.jsonl"
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(records, file, indent=4, ensure_ascii=False)
+        jsonl_storage.write_lines(jsonl_path, records)
+
+        print(f"{transaction_count} transações\n")
+        print(f"{'Processos':>9} | {'JSON (s)':>9} | {'JSONL (s)':>9}")
+        print("-" * 33)
+        for workers in WORKER_COUNTS:
+            json_time = measure(
+                lambda: parallel_loader.load_records_parallel(
+                    json.loads(json_path.read_text(encoding="utf-8")), workers
+                )
+            )
+            jsonl_time = measure(parallel_loader.load_jsonl_parallel, jsonl_path, workers)
+            print(f"{workers:>9} | {json_time:>9.2f} | {jsonl_time:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,86 @@
+import argparse
+from pathlib import Path
+
+from src.models.enums import StorageFormat
+from src.models.worker_pool import get_default_workers
+from src.service.transaction_service import TransactionService
 from src.ui.cli.user_interface import UserInterface
 
 
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='FinController - controle de finanças pessoais (CLI)')
+    parser.add_argument(
+        '--formato',
+        type=StorageFormat,
+        choices=list(StorageFormat),
+        default=StorageFormat.JSON,
+        metavar='{json,jsonl}',
+        help='Formato do arquivo de dados (padrão: json). jsonl adiciona transações sem reescrever o arquivo'
+    )
+    parser.add_argument(
+        '--migrar-para',
+        type=StorageFormat,
+        choices=list(StorageFormat),
+        default=None,
+        metavar='{json,jsonl}',
+        help='Copia o arquivo de dados do formato de --formato para o formato indicado e encerra'
+    )
+    parser.add_argument(
+        '--processos',
+        type=int,
+        default=get_default_workers(),
+        metavar='N',
+        help='Processos usados na carga e nas estatísticas de arquivos grandes (padrão: um por núcleo, até 8; '
+             '1 desativa o paralelismo)'
+    )
+    parser.add_argument(
+        '--arquivo',
+        type=Path,
+        default=None,
+        help='Abre um arquivo colunar de transações em modo somente leitura'
+    )
+    parser.add_argument(
+        '--gerar-arquivo',
+        type=Path,
+        default=None,
+        metavar='DESTINO',
+        help='Grava as transações atuais em um arquivo colunar (para abrir depois com --arquivo) e encerra'
+    )
+    parser.add_argument(
+        '--aproximado',
+        action='store_true',
+        help='Estima medianas e percentis por amostragem, em memória constante (para arquivos muito grandes)'
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
-    user_interface = UserInterface()
+    arguments = parse_arguments()
+    if arguments.migrar_para is not None:
+        try:
+            target_path = TransactionService.migrate_storage(arguments.formato, arguments.migrar_para)
+        except ValueError as e:
+            print(e)
+            return
+
+        print(f'Dados copiados para {target_path}. Use --formato {arguments.migrar_para.value} para abri-lo.')
+        return
+
+    if arguments.gerar_arquivo is not None:
+        service = TransactionService(arguments.formato, load_workers=arguments.processos)
+        service.export_archive(arguments.gerar_arquivo)
+        service.close()
+        print(f'Arquivo colunar gravado em {arguments.gerar_arquivo}')
+        return
+
+    user_interface = UserInterface(
+        arguments.formato,
+        archive_path=arguments.arquivo,
+        load_workers=arguments.processos,
+        approximate_statistics=arguments.aproximado
+    )
     user_interface.run()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,98 @@
+"""
+Histograma exato dos valores: quantas transações tiveram cada valor.
+
+Serve de resumo de quantis que pode ser combinado: o histograma de dois blocos de transações é a soma dos dois, e
+a mediana ou qualquer percentil da união é lido percorrendo os valores distintos em ordem. Como valores em
+dinheiro se repetem muito (assinaturas, contas fixas, compras recorrentes), o número de valores distintos costuma
+ser bem menor que o de transações, e o resultado é o mesmo de ordenar todos os valores.
+
+O histograma é exato e não tem limite de memória: guarda um contador por valor distinto, então, no pior caso
+(nenhum valor repetido), ocupa tanto quanto a lista de valores. Por isso os resumos guardados por mês no cubo de
+agregados não levam histogramas (with_histograms=False), e o modo de estatísticas aproximadas troca o histograma
+por uma amostra de tamanho fixo (ver reservoir_sample), com memória constante e margem de erro conhecida.
+"""
+from collections import Counter
+from collections.abc import Iterable
+
+from src.models.order_statistics import get_median
+
+
+class AmountHistogram:
+    """Contagem exata de cada valor; a memória cresce com o número de valores distintos."""
+    def __init__(self, amounts: Iterable[int | float] = ()) -> None:
+        self._counts: Counter[int | float] = Counter(amounts)
+        self._count: int = self._counts.total()
+        # Valores distintos em ordem, reaproveitados entre consultas enquanto o histograma não muda
+        self._sorted_amounts: list[int | float] | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, amount: int | float, count: int = 1) -> None:
+        if amount not in self._counts:
+            self._sorted_amounts = None
+        self._counts[amount] += count
+        self._count += count
+
+    def remove(self, amount: int | float) -> None:
+        count = self._counts.get(amount, 0)
+        if not count:
+            return
+
+        if count == 1:
+            del self._counts[amount]
+            self._sorted_amounts = None
+        else:
+            self._counts[amount] = count - 1
+        self._count -= 1
+
+    def merge(self, other: 'AmountHistogram') -> None:
+        self._counts.update(other._counts)
+        self._count += other._count
+        self._sorted_amounts = None
+
+    def items(self) -> Iterable[tuple[int | float, int]]:
+        return self._counts.items()
+
+    # Quantis --------------------------------------------------------------------------------------------------------
+    def get_median(self) -> int | float:
+        """Mesmo resultado de statistics.median sobre todos os valores."""
+        middle = self._count // 2
+        return get_median(self._get_values_at(middle - 1 if self._count % 2 == 0 else middle, middle))
+
+    def get_percentile(self, percentage: float) -> int | float:
+        """Percentil com interpolação linear, como order_statistics.get_percentile."""
+        if not 0 <= percentage <= 100:
+            raise ValueError('O percentil deve estar entre 0 e 100!')
+
+        if not self._count:
+            return 0
+
+        rank = (self._count - 1) * percentage / 100
+        lower = int(rank)
+        fraction = rank - lower
+        values = self._get_values_at(lower, min(lower + 1, self._count - 1))
+        if not fraction:
+            return values[0]
+
+        return values[0] + (values[1] - values[0]) * fraction
+
+    def _get_values_at(self, first_position: int, last_position: int) -> list[int | float]:
+        """Valores nas posições first_position..last_position (inclusive) da lista ordenada de todos os valores."""
+        if not self._count:
+            return []
+
+        if self._sorted_amounts is None:
+            self._sorted_amounts = sorted(self._counts)
+
+        values = []
+        seen = 0
+        for amount in self._sorted_amounts:
+            seen += self._counts[amount]
+            while first_position < seen and first_position <= last_position:
+                values.append(amount)
+                first_position += 1
+            if first_position > last_position:
+                break
+
+        return values
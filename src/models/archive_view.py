@@ -0,0 +1,212 @@
+"""
+Visão preguiçosa e somente leitura sobre um arquivo colunar (mesmo formato do snapshot binário).
+
+Usada no modo de consulta de arquivos históricos: filtros, ordenações e estatísticas operam direto sobre as
+colunas mapeadas em memória, e uma Transaction só é construída quando uma linha é de fato exibida.
+"""
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple, overload
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory, SortField
+from src.models.snapshot import (
+    SnapshotColumns, TYPE_CODES, INCOME_CATEGORY_CODES, EXPENSE_CATEGORY_CODES, FLAG_INTEGER_AMOUNT
+)
+
+
+class ReadOnlyArchiveError(ValueError):
+    """Levantada quando uma operação de escrita é tentada sobre um arquivo aberto em modo somente leitura."""
+
+
+class ArchiveRow(NamedTuple):
+    """Linha leve (sem descrição) usada para estatísticas, evitando construir objetos Transaction."""
+    id: int
+    amount: float | int
+    transaction_type: TransactionType
+    transaction_date: date
+    category: IncomeCategory | ExpenseCategory
+
+
+class ArchiveTransactionList(Sequence[Transaction]):
+    """
+    Sequência de transações apoiada nas colunas de um arquivo mapeado em memória.
+
+    Guarda apenas os índices das linhas selecionadas; filtrar ou ordenar devolve uma nova visão sobre as
+    mesmas colunas, sem decodificar nenhuma linha. Implementa o protocolo TransactionView (ver transaction_view).
+    """
+
+    def __init__(self, columns: SnapshotColumns, rows: Sequence[int] | None = None) -> None:
+        self._columns: SnapshotColumns = columns
+        self._rows: Sequence[int] = range(len(columns)) if rows is None else rows
+        self._row_by_id: dict[int, int] | None = None
+
+    @classmethod
+    def open(cls, archive_path: Path) -> ArchiveTransactionList:
+        return cls(SnapshotColumns(archive_path))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Transaction: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ArchiveTransactionList: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ArchiveTransactionList(self._columns, self._rows[index])
+
+        return self._columns.get_row(self._rows[index])
+
+    def __iter__(self) -> Iterator[Transaction]:
+        for row in self._rows:
+            yield self._columns.get_row(row)
+
+    def __add__(self, other: ArchiveTransactionList) -> ArchiveTransactionList:
+        return ArchiveTransactionList(self._columns, array("I", self._rows) + array("I", other._rows))
+
+    def copy(self) -> ArchiveTransactionList:
+        # As colunas são imutáveis, então a "cópia" só precisa compartilhar os mesmos índices.
+        return ArchiveTransactionList(self._columns, self._rows)
+
+    def get_by_id(self, transaction_id: int) -> Transaction:
+        # O mapa id -> linha é montado na primeira busca; as consultas paginadas buscam muitas linhas por id.
+        if self._row_by_id is None:
+            ids = self._columns.ids
+            self._row_by_id = {ids[row]: row for row in self._rows}
+
+        row = self._row_by_id.get(transaction_id)
+        if row is None:
+            raise ValueError(f"ID {transaction_id} não encontrado!")
+
+        return self._columns.get_row(row)
+
+    def get_sort_keys(self, sort_field: SortField) -> list[tuple[int | float, int]]:
+        """Chaves (valor, id) das linhas selecionadas, em ordem crescente, lidas das colunas sem decodificar linhas."""
+        ids = self._columns.ids
+        match sort_field:
+            case SortField.ID:
+                values = ids
+            case SortField.DATE:
+                values = self._columns.ordinals
+            case SortField.AMOUNT:
+                values = self._columns.amounts
+            case _:
+                raise ValueError(f"{sort_field} não é um campo de ordenação válido!")
+
+        return sorted((values[row], ids[row]) for row in self._rows)
+
+    def iter_rows(self) -> Iterator[ArchiveRow]:
+        """Gera as linhas selecionadas como tuplas leves, uma por vez, sem decodificar as descrições."""
+        columns = self._columns
+        income_code = TYPE_CODES.index(TransactionType.INCOME)
+        ids = columns.ids
+        amounts = columns.amounts
+        ordinals = columns.ordinals
+        type_codes = columns.type_codes
+        category_codes = columns.category_codes
+        flags = columns.flags
+        dates: dict[int, date] = {}
+        for row in self._rows:
+            ordinal = ordinals[row]
+            transaction_date = dates.get(ordinal)
+            if transaction_date is None:
+                transaction_date = dates[ordinal] = date.fromordinal(ordinal)
+
+            type_code = type_codes[row]
+            category_table = INCOME_CATEGORY_CODES if type_code == income_code else EXPENSE_CATEGORY_CODES
+            amount = amounts[row]
+            yield ArchiveRow(
+                ids[row],
+                int(amount) if flags[row] & FLAG_INTEGER_AMOUNT else amount,
+                TYPE_CODES[type_code],
+                transaction_date,
+                category_table[category_codes[row]],
+            )
+
+    # Filtros sobre as colunas -----------------------------------------------------------------------------------
+    def filter_by_amount_range(self, start_amount: int | float, end_amount: int | float) -> ArchiveTransactionList:
+        amounts = self._columns.amounts
+        return self._select(row for row in self._rows if start_amount <= amounts[row] <= end_amount)
+
+    def filter_by_type(self, transaction_type: TransactionType) -> ArchiveTransactionList:
+        type_code = TYPE_CODES.index(transaction_type)
+        type_codes = self._columns.type_codes
+        return self._select(row for row in self._rows if type_codes[row] == type_code)
+
+    def filter_by_date_range(self, start_date: date, end_date: date) -> ArchiveTransactionList:
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
+        ordinals = self._columns.ordinals
+        return self._select(row for row in self._rows if start_ordinal <= ordinals[row] <= end_ordinal)
+
+    def filter_by_category(self, category: IncomeCategory | ExpenseCategory) -> ArchiveTransactionList:
+        if isinstance(category, IncomeCategory):
+            type_code = TYPE_CODES.index(TransactionType.INCOME)
+            category_code = INCOME_CATEGORY_CODES.index(category)
+        else:
+            type_code = TYPE_CODES.index(TransactionType.EXPENSE)
+            category_code = EXPENSE_CATEGORY_CODES.index(category)
+
+        type_codes = self._columns.type_codes
+        category_codes = self._columns.category_codes
+        return self._select(
+            row for row in self._rows
+            if type_codes[row] == type_code and category_codes[row] == category_code
+        )
+
+    def filter_by_ids(self, transaction_ids: set[int]) -> ArchiveTransactionList:
+        ids = self._columns.ids
+        return self._select(row for row in self._rows if ids[row] in transaction_ids)
+
+    # Ordenações e extremos sobre as colunas ---------------------------------------------------------------------
+    def sort_by_amount(self, reverse: bool) -> ArchiveTransactionList:
+        return self._sorted_by(self._columns.amounts, reverse)
+
+    def sort_by_date(self, reverse: bool) -> ArchiveTransactionList:
+        return self._sorted_by(self._columns.ordinals, reverse)
+
+    def sort_by_id(self, reverse: bool) -> ArchiveTransactionList:
+        return self._sorted_by(self._columns.ids, reverse)
+
+    def get_min_date(self) -> date:
+        ordinals = self._columns.ordinals
+        return date.fromordinal(min(ordinals[row] for row in self._rows))
+
+    def get_max_date(self) -> date:
+        ordinals = self._columns.ordinals
+        return date.fromordinal(max(ordinals[row] for row in self._rows))
+
+    def get_min_amount(self) -> int | float:
+        return self._columns.get_amount(min(self._rows, key=self._columns.amounts.__getitem__))
+
+    def get_max_amount(self) -> int | float:
+        return self._columns.get_amount(max(self._rows, key=self._columns.amounts.__getitem__))
+
+    def top_k(self, k: int, transaction_type: TransactionType | None = None) -> list[Transaction]:
+        """As k maiores transações, escolhidas pela coluna de valores; só as k linhas escolhidas são decodificadas."""
+        return self._select_extremes(heapq.nlargest, k, transaction_type)
+
+    def bottom_k(self, k: int, transaction_type: TransactionType | None = None) -> list[Transaction]:
+        return self._select_extremes(heapq.nsmallest, k, transaction_type)
+
+    # Métodos auxiliares -----------------------------------------------------------------------------------------
+    def _select(self, rows: Iterator[int]) -> ArchiveTransactionList:
+        return ArchiveTransactionList(self._columns, array("I", rows))
+
+    def _sorted_by(self, column: memoryview, reverse: bool) -> ArchiveTransactionList:
+        return ArchiveTransactionList(
+            self._columns, array("I", sorted(self._rows, key=column.__getitem__, reverse=reverse))
+        )
+
+    def _select_extremes(self, select, k: int, transaction_type: TransactionType | None) -> list[Transaction]:
+        rows = self._rows if transaction_type is None else self.filter_by_type(transaction_type)._rows
+        selected_rows = select(k, rows, key=self._columns.amounts.__getitem__)
+        return [self._columns.get_row(row) for row in selected_rows]
@@ -0,0 +1,129 @@
+"""
+Índice de saldo por data: uma árvore de Fenwick (binary indexed tree) com a soma dos valores de cada dia, receitas
+positivas e despesas negativas.
+
+O saldo até uma data é uma soma de prefixo, e o saldo entre duas datas é a diferença de dois prefixos; ambos custam
+O(log d), em que d é o número de dias cobertos pelo índice, assim como registrar ou desfazer uma transação. Os
+valores são guardados em centavos inteiros, então somar e subtrair repetidamente não acumula erro de arredondamento.
+"""
+from collections.abc import Iterable
+from datetime import date
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+from src.models.transaction_view import as_view
+
+
+# Folga mínima, em dias, acrescentada quando uma data cai fora do intervalo coberto
+MIN_MARGIN_DAYS = 366
+
+
+def get_signed_cents(transaction: Transaction) -> int:
+    cents = round(transaction.amount * 100)
+    return -cents if transaction.transaction_type == TransactionType.EXPENSE else cents
+
+
+class BalanceIndex:
+    """
+    Índice mantido pelo TransactionManager (add/remove a cada alteração da lista).
+
+    A posição i da árvore corresponde ao dia first_ordinal + i - 1. Quando uma transação cai fora dos dias
+    cobertos, o intervalo é ampliado (com folga, para que isso seja raro) e a árvore é reconstruída em O(d).
+    """
+    def __init__(self, transaction_list: Iterable[Transaction] = ()) -> None:
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        cents_by_ordinal: dict[int, int] = {}
+        for transaction in transaction_list:
+            ordinal = transaction.transaction_date.toordinal()
+            cents_by_ordinal[ordinal] = cents_by_ordinal.get(ordinal, 0) + get_signed_cents(transaction)
+
+        self._first_ordinal: int = min(cents_by_ordinal, default=0)
+        self._tree: list[int] = [0]
+        if cents_by_ordinal:
+            day_values = [0] * (max(cents_by_ordinal) - self._first_ordinal + 1)
+            for ordinal, cents in cents_by_ordinal.items():
+                day_values[ordinal - self._first_ordinal] = cents
+            self._build(self._first_ordinal, day_values)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        self._update(transaction.transaction_date.toordinal(), get_signed_cents(transaction))
+
+    def remove(self, transaction: Transaction) -> None:
+        self._update(transaction.transaction_date.toordinal(), -get_signed_cents(transaction))
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def get_balance_as_of(self, as_of_date: date) -> float:
+        """Saldo de todas as transações até as_of_date (inclusive)."""
+        return self._get_prefix_cents(as_of_date.toordinal()) / 100
+
+    def get_balance(self, start_date: date, end_date: date) -> float:
+        """Saldo das transações entre start_date e end_date (inclusive)."""
+        if start_date > end_date:
+            return 0.0
+
+        cents = self._get_prefix_cents(end_date.toordinal()) - self._get_prefix_cents(start_date.toordinal() - 1)
+        return cents / 100
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _get_prefix_cents(self, ordinal: int) -> int:
+        position = min(ordinal - self._first_ordinal + 1, len(self._tree) - 1)
+        cents = 0
+        while position > 0:
+            cents += self._tree[position]
+            position &= position - 1
+
+        return cents
+
+    def _update(self, ordinal: int, cents: int) -> None:
+        self._ensure_covers(ordinal)
+        tree = self._tree
+        position = ordinal - self._first_ordinal + 1
+        while position < len(tree):
+            tree[position] += cents
+            position += position & -position
+
+    def _ensure_covers(self, ordinal: int) -> None:
+        day_count = len(self._tree) - 1
+        if day_count and self._first_ordinal <= ordinal < self._first_ordinal + day_count:
+            return
+
+        day_values = self._get_day_values()
+        margin = max(day_count, MIN_MARGIN_DAYS)
+        if not day_count:
+            first_ordinal, last_ordinal = ordinal, ordinal + margin
+        elif ordinal < self._first_ordinal:
+            first_ordinal, last_ordinal = ordinal - margin, self._first_ordinal + day_count - 1
+        else:
+            first_ordinal, last_ordinal = self._first_ordinal, ordinal + margin
+
+        first_ordinal = max(first_ordinal, date.min.toordinal())
+        last_ordinal = min(last_ordinal, date.max.toordinal())
+        new_values = [0] * (last_ordinal - first_ordinal + 1)
+        offset = self._first_ordinal - first_ordinal
+        new_values[offset:offset + day_count] = day_values
+        self._build(first_ordinal, new_values)
+
+    def _build(self, first_ordinal: int, day_values: list[int]) -> None:
+        """Monta a árvore a partir dos valores de cada dia em O(d)."""
+        tree = [0, *day_values]
+        size = len(tree)
+        for position in range(1, size):
+            parent = position + (position & -position)
+            if parent < size:
+                tree[parent] += tree[position]
+
+        self._first_ordinal = first_ordinal
+        self._tree = tree
+
+    def _get_day_values(self) -> list[int]:
+        """Desfaz _build: recupera o valor de cada dia a partir da árvore, também em O(d)."""
+        values = self._tree.copy()
+        size = len(values)
+        for position in range(size - 1, 0, -1):
+            parent = position + (position & -position)
+            if parent < size:
+                values[parent] -= values[position]
+
+        return values[1:]
@@ -68,6 +68,58 @@ def parse_from_json(transaction_json: list[SerializedTransaction]) -> list[Parse
 
     return parsed_transaction_dict_list
 
+# Métodos de conversão em lote ------------------------------------------------------------------------------------
+"""
+As versões em lote não levantam exceção no primeiro valor inválido: retornam a lista de valores convertidos
+(None nas posições inválidas) e um dicionário {posição no lote: mensagem de erro}. Valores repetidos dentro do
+lote, muito comuns em extratos bancários (datas, categorias), são convertidos uma única vez.
+"""
+def to_valid_amounts(amount_str_list: list[str]) -> tuple[list[float | None], dict[int, str]]:
+    return _convert_batch(amount_str_list, to_valid_amount)
+
+def to_valid_transaction_types(
+        transaction_type_str_list: list[str]
+        ) -> tuple[list[TransactionType | None], dict[int, str]]:
+    return _convert_batch(transaction_type_str_list, to_valid_transaction_type)
+
+def to_valid_transaction_dates(
+        transaction_date_str_list: list[str],
+        date_format: str
+        ) -> tuple[list[date | None], dict[int, str]]:
+    return _convert_batch(
+        transaction_date_str_list,
+        lambda transaction_date_str: to_valid_transaction_date(transaction_date_str, date_format)
+    )
+
+def to_valid_categories(
+        category_str_list: list[str | None]
+        ) -> tuple[list[IncomeCategory | ExpenseCategory | None], dict[int, str]]:
+    return _convert_batch(category_str_list, to_valid_category)
+
+def _convert_batch(raw_value_list: list, converter) -> tuple[list, dict[int, str]]:
+    converted_cache: dict = {}
+    error_cache: dict = {}
+    converted_list = []
+    errors: dict[int, str] = {}
+    for index, raw_value in enumerate(raw_value_list):
+        if raw_value in error_cache:
+            converted_list.append(None)
+            errors[index] = error_cache[raw_value]
+            continue
+
+        if raw_value not in converted_cache:
+            try:
+                converted_cache[raw_value] = converter(raw_value)
+            except (ValueError, AttributeError) as e:
+                error_cache[raw_value] = str(e)
+                converted_list.append(None)
+                errors[index] = error_cache[raw_value]
+                continue
+
+        converted_list.append(converted_cache[raw_value])
+
+    return converted_list, errors
+
 # Métodos individuais de conversão --------------------------------------------------------------------------------
 def to_valid_amount(amount_str: str) -> float:
     try:
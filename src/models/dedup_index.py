@@ -0,0 +1,106 @@
+"""
+Índice de duplicatas usado na importação de extratos.
+
+Cada transação é reduzida a uma impressão digital normalizada (data, valor em centavos, tipo, descrição), guardada
+em um Counter. Assim, verificar se uma linha importada já existe no livro custa O(1), em vez de comparar cada linha
+com todas as transações existentes.
+"""
+import unicodedata
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+
+
+Fingerprint = tuple[date, int, TransactionType, str]
+
+DEFAULT_DESCRIPTION = 'Descrição não adicionada'
+NEAR_DUPLICATE_DAY_TOLERANCE = 1
+
+
+def normalize_description(description: str | None) -> str:
+    """Ignora maiúsculas, acentos e espaços repetidos. A descrição padrão equivale a uma descrição vazia."""
+    if not description or description == DEFAULT_DESCRIPTION:
+        return ''
+
+    decomposed = unicodedata.normalize('NFKD', description)
+    without_accents = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(without_accents.casefold().split())
+
+
+def make_fingerprint(
+        amount: float,
+        transaction_type: TransactionType,
+        transaction_date: date,
+        description: str | None
+        ) -> Fingerprint:
+    return transaction_date, round(amount * 100), transaction_type, normalize_description(description)
+
+
+def get_fingerprint(transaction: Transaction) -> Fingerprint:
+    return make_fingerprint(
+        transaction.amount, transaction.transaction_type, transaction.transaction_date, transaction.description
+    )
+
+
+class DedupIndex:
+    """
+    Conta quantas vezes cada impressão digital aparece no livro.
+
+    Além do índice exato, mantém um índice sem a descrição (data, valor, tipo), usado para apontar possíveis
+    duplicatas: mesma data, valor e tipo com descrição diferente, ou mesma transação lançada com um dia de
+    diferença (comum quando o banco usa a data de compensação).
+
+    O TransactionManager chama add/remove a cada alteração da lista, então o índice é construído uma única vez.
+    """
+    def __init__(self, transaction_list: Iterable[Transaction] = ()) -> None:
+        self._fingerprints: Counter[Fingerprint] = Counter()
+        self._without_description: Counter[tuple[date, int, TransactionType]] = Counter()
+        for transaction in transaction_list:
+            self.add(transaction)
+
+    def __len__(self) -> int:
+        return self._fingerprints.total()
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        fingerprint = get_fingerprint(transaction)
+        self._fingerprints[fingerprint] += 1
+        self._without_description[fingerprint[:3]] += 1
+
+    def remove(self, transaction: Transaction) -> None:
+        fingerprint = get_fingerprint(transaction)
+        self._decrement(self._fingerprints, fingerprint)
+        self._decrement(self._without_description, fingerprint[:3])
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def count(self, fingerprint: Fingerprint) -> int:
+        """Quantas transações do livro têm exatamente esta impressão digital."""
+        return self._fingerprints.get(fingerprint, 0)
+
+    def find_near_duplicate(self, fingerprint: Fingerprint) -> str | None:
+        """Retorna o motivo pelo qual a transação parece duplicada, ou None se não houver semelhante no livro."""
+        transaction_date, amount, transaction_type, description = fingerprint
+        exact_count = self.count(fingerprint)
+        if exact_count:
+            return f'Transação idêntica já lançada {exact_count} vez(es) no livro'
+
+        if self._without_description.get((transaction_date, amount, transaction_type), 0):
+            return 'Mesma data, valor e tipo de uma transação existente, com descrição diferente'
+
+        for offset in range(1, NEAR_DUPLICATE_DAY_TOLERANCE + 1):
+            for near_date in (transaction_date - timedelta(days=offset), transaction_date + timedelta(days=offset)):
+                if self.count((near_date, amount, transaction_type, description)):
+                    return f'Transação idêntica lançada em {near_date.strftime("%d/%m/%Y")}'
+
+        return None
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _decrement(self, counter: Counter, key: tuple) -> None:
+        remaining = counter.get(key, 0) - 1
+        if remaining > 0:
+            counter[key] = remaining
+        else:
+            counter.pop(key, None)
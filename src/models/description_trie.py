@@ -0,0 +1,153 @@
+"""
+Árvore de prefixos (trie) das descrições já usadas, para sugerir descrições enquanto o usuário digita.
+
+Cada nó guarda as TOP_K descrições mais frequentes da sua subárvore. Uma sugestão só precisa descer pelos
+caracteres do prefixo e devolver a lista pronta do nó, então o custo não depende do tamanho do livro.
+"""
+import heapq
+from collections import Counter
+from collections.abc import Iterable
+
+from src.models.transaction import Transaction
+from src.models.dedup_index import DEFAULT_DESCRIPTION
+
+
+TOP_K = 10
+
+
+class _TrieNode:
+    __slots__ = ('children', 'count', 'description', 'top')
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.count: int = 0                 # Quantas transações usam exatamente esta descrição
+        self.description: str | None = None  # Descrição como foi digitada na primeira vez
+        self.top: list[tuple[int, str]] = []  # (frequência, descrição), da mais para a menos frequente
+
+
+class DescriptionTrie:
+    """
+    Trie das descrições, sem diferenciar maiúsculas, com a frequência de uso de cada uma.
+
+    O TransactionManager chama add/remove a cada alteração da lista. Cada alteração recalcula as listas de
+    mais frequentes apenas nos nós do caminho da descrição afetada.
+    """
+    def __init__(self, transaction_list: Iterable[Transaction] = ()) -> None:
+        self._root = _TrieNode()
+        self._build(transaction_list)
+
+    # Manutenção da árvore ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        if not self._is_suggestible(transaction.description):
+            return
+
+        path = self._get_path(transaction.description.casefold(), create=True)
+        leaf = path[-1]
+        leaf.count += 1
+        if leaf.description is None:
+            leaf.description = transaction.description
+
+        self._refresh_top(path)
+
+    def remove(self, transaction: Transaction) -> None:
+        if not self._is_suggestible(transaction.description):
+            return
+
+        path = self._get_path(transaction.description.casefold(), create=False)
+        if path is None or path[-1].count == 0:
+            return
+
+        leaf = path[-1]
+        leaf.count -= 1
+        if leaf.count == 0:
+            leaf.description = None
+
+        self._prune(path, transaction.description.casefold())
+        self._refresh_top(path)
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def suggest(self, prefix: str, limit: int = TOP_K) -> list[str]:
+        """Retorna até limit descrições que começam com prefix, das mais usadas para as menos usadas."""
+        if not prefix:
+            return []
+
+        node = self._root
+        for char in prefix.casefold():
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        return [description for _, description in node.top[:limit]]
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _build(self, transaction_list: Iterable[Transaction]) -> None:
+        """Insere cada descrição distinta uma única vez e calcula as listas de mais frequentes em uma só passada."""
+        counts: Counter[str] = Counter()
+        first_spelling: dict[str, str] = {}
+        for transaction in transaction_list:
+            description = transaction.description
+            if not self._is_suggestible(description):
+                continue
+
+            key = description.casefold()
+            counts[key] += 1
+            first_spelling.setdefault(key, description)
+
+        for key, count in counts.items():
+            leaf = self._get_path(key, create=True)[-1]
+            leaf.count = count
+            leaf.description = first_spelling[key]
+
+        self._compute_top_recursively(self._root)
+
+    def _compute_top_recursively(self, root: _TrieNode) -> None:
+        # Pós-ordem iterativa: descrições longas gerariam recursão profunda demais.
+        stack: list[tuple[_TrieNode, bool]] = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if children_done:
+                self._compute_top(node)
+                continue
+
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children.values())
+
+    def _compute_top(self, node: _TrieNode) -> None:
+        candidates = [item for child in node.children.values() for item in child.top]
+        if node.count:
+            candidates.append((node.count, node.description))
+
+        node.top = heapq.nlargest(TOP_K, candidates, key=lambda item: item[0])
+
+    def _refresh_top(self, path: list[_TrieNode]) -> None:
+        for node in reversed(path):
+            self._compute_top(node)
+
+    def _get_path(self, key: str, create: bool) -> list[_TrieNode] | None:
+        node = self._root
+        path = [node]
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+
+                child = node.children[char] = _TrieNode()
+
+            node = child
+            path.append(node)
+
+        return path
+
+    def _prune(self, path: list[_TrieNode], key: str) -> None:
+        """Remove do final do caminho os nós que ficaram sem descrição e sem filhos."""
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.count or node.children:
+                break
+
+            del path[depth - 1].children[key[depth - 1]]
+            path.pop()
+
+    def _is_suggestible(self, description: str | None) -> bool:
+        return bool(description) and description != DEFAULT_DESCRIPTION
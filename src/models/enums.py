@@ -70,4 +70,72 @@ class ExpenseCategory(Enum):
     @classmethod
     def get_all_values(cls):
         """Retorna uma lista com todos os valores possíveis de categoria."""
-        return [expense.value for expense in cls]
\ No newline at end of file
+        return [expense.value for expense in cls]
+
+class StorageFormat(Enum):
+    """
+    Enumeração que representa os formatos de armazenamento suportados pelo repositório de transações.
+
+    Valores:
+    JSON : lista JSON única e indentada, reescrita por completo a cada gravação ('json')
+    JSONL : JSON Lines, um registro compacto por linha, permitindo adicionar transações sem reescrever
+    o arquivo ('jsonl')
+    """
+    JSON = 'json'
+    JSONL = 'jsonl'
+
+
+class ExportFormat(Enum):
+    """
+    Enumeração que representa os formatos de exportação de listas de transações.
+
+    Valores:
+    CSV : planilha separada por ';', no mesmo layout aceito pela importação de extratos ('csv')
+    JSONL : JSON Lines, um registro por linha, no mesmo formato do armazenamento ('jsonl')
+    MARKDOWN : tabela Markdown, para colar em documentos e relatórios ('md')
+    """
+    CSV = 'csv'
+    JSONL = 'jsonl'
+    MARKDOWN = 'md'
+
+
+class SortField(Enum):
+    """
+    Enumeração que representa os campos pelos quais uma consulta paginada pode ser ordenada.
+
+    Valores:
+    ID : ordem de criação das transações ('id')
+    DATE : data da transação ('data')
+    AMOUNT : valor da transação ('valor')
+    """
+    ID = 'id'
+    DATE = 'data'
+    AMOUNT = 'valor'
+
+
+class TimeBucket(Enum):
+    """
+    Enumeração que representa os períodos usados para agrupar transações em séries temporais.
+
+    Valores:
+    DAY : um dia ('dia')
+    WEEK : semana de segunda a domingo ('semana')
+    MONTH : mês do calendário ('mês')
+    YEAR : ano do calendário ('ano')
+    """
+    DAY = 'dia'
+    WEEK = 'semana'
+    MONTH = 'mês'
+    YEAR = 'ano'
+
+
+class SeriesGroup(Enum):
+    """
+    Enumeração que representa como as transações de cada período são divididas em séries.
+
+    Valores:
+    TYPE : uma série por tipo de transação ('tipo')
+    CATEGORY : uma série por categoria ('categoria')
+    """
+    TYPE = 'tipo'
+    CATEGORY = 'categoria'
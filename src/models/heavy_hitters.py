@@ -0,0 +1,168 @@
+"""
+Descrições de despesa com mais gastos e mais transações, acompanhadas em memória limitada (algoritmo Space-Saving).
+
+Cada ranking guarda no máximo `capacity` contadores. Uma descrição nova, com os contadores cheios, assume o contador
+de menor valor e herda esse valor como erro. Assim a estimativa de cada descrição acompanhada nunca é menor que o
+valor real e o excede em no máximo o erro registrado, e qualquer descrição com mais de total / capacity do peso
+total está garantidamente entre as acompanhadas, por mais descrições distintas que existam.
+
+As descrições são comparadas já normalizadas (sem acentos, maiúsculas ou espaços repetidos, como no DedupIndex);
+o relatório mostra a descrição como foi digitada na primeira vez.
+"""
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+from src.models.dedup_index import normalize_description, DEFAULT_DESCRIPTION
+
+
+DEFAULT_CAPACITY = 200
+DEFAULT_TOP_COUNT = 10
+
+
+class HeavyHitter(NamedTuple):
+    key: str
+    estimate: int | float
+    error: int | float
+
+
+class SpaceSavingSketch:
+    """
+    Contadores Space-Saving com pesos. O menor contador é encontrado em um heap com remoção preguiçosa: entradas
+    desatualizadas são descartadas quando chegam ao topo, e o heap é refeito se acumular entradas demais.
+    """
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity <= 0:
+            raise ValueError('A capacidade deve ser positiva!')
+
+        self._capacity = capacity
+        self._counters: dict[str, list[int | float]] = {}  # chave -> [estimativa, erro]
+        self._heap: list[tuple[int | float, str]] = []
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counters
+
+    def add(self, key: str, weight: int | float = 1) -> str | None:
+        """Soma weight ao contador de key. Retorna a chave descartada para abrir espaço, se houver."""
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+            self._push(counter[0], key)
+            return None
+
+        evicted_key = None
+        error: int | float = 0
+        if len(self._counters) >= self._capacity:
+            evicted_key, error = self._pop_min()
+
+        self._counters[key] = [error + weight, error]
+        self._push(error + weight, key)
+        return evicted_key
+
+    def remove(self, key: str, weight: int | float = 1) -> None:
+        """
+        Desconta weight de key, se ela estiver sendo acompanhada. O contador não fica abaixo do erro herdado, e
+        as garantias continuam valendo em relação ao peso total incluído.
+        """
+        counter = self._counters.get(key)
+        if counter is None:
+            return
+
+        counter[0] = max(counter[0] - weight, counter[1])
+        self._push(counter[0], key)
+
+    def get_top(self, count: int) -> list[HeavyHitter]:
+        """Maiores contadores; os zerados por remoções ficam de fora."""
+        top = heapq.nlargest(count, self._counters.items(), key=lambda item: item[1][0])
+        return [HeavyHitter(key, estimate, error) for key, (estimate, error) in top if estimate > 0]
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _push(self, estimate: int | float, key: str) -> None:
+        heapq.heappush(self._heap, (estimate, key))
+        if len(self._heap) > 4 * self._capacity:
+            self._heap = [(estimate, key) for key, (estimate, _) in self._counters.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> tuple[str, int | float]:
+        """Remove o contador de menor estimativa e retorna a chave e a estimativa dele."""
+        while True:
+            estimate, key = heapq.heappop(self._heap)
+            counter = self._counters.get(key)
+            if counter is not None and counter[0] == estimate:
+                del self._counters[key]
+                return key, estimate
+
+
+@dataclass
+class DescriptionTotal:
+    description: str
+    estimate: int | float
+    # A estimativa excede o valor real em no máximo error (0: valor exato)
+    error: int | float
+
+
+@dataclass
+class TopDescriptions:
+    by_amount: list[DescriptionTotal] = field(default_factory=list)
+    by_count: list[DescriptionTotal] = field(default_factory=list)
+
+
+class DescriptionHeavyHitters:
+    """Índice mantido pelo TransactionManager (add/remove a cada alteração da lista), só com despesas."""
+    def __init__(self, transaction_list: Iterable[Transaction] = (), capacity: int = DEFAULT_CAPACITY) -> None:
+        self._by_amount = SpaceSavingSketch(capacity)
+        self._by_count = SpaceSavingSketch(capacity)
+        # Descrição como foi digitada, apenas das chaves acompanhadas por algum dos rankings
+        self._descriptions: dict[str, str] = {}
+        for transaction in transaction_list:
+            self.add(transaction)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        key = self._get_key(transaction)
+        if key is None:
+            return
+
+        self._descriptions.setdefault(key, transaction.description)
+        for evicted_key in (
+            self._by_amount.add(key, transaction.amount),
+            self._by_count.add(key),
+        ):
+            self._forget_if_untracked(evicted_key)
+
+    def remove(self, transaction: Transaction) -> None:
+        key = self._get_key(transaction)
+        if key is None:
+            return
+
+        self._by_amount.remove(key, transaction.amount)
+        self._by_count.remove(key)
+
+    # Consultas --------------------------------------------------------------------------------------------------
+    def get_top(self, count: int = DEFAULT_TOP_COUNT) -> TopDescriptions:
+        return TopDescriptions(
+            self._to_totals(self._by_amount.get_top(count)),
+            self._to_totals(self._by_count.get_top(count)),
+        )
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _get_key(self, transaction: Transaction) -> str | None:
+        if transaction.transaction_type != TransactionType.EXPENSE:
+            return None
+        if not transaction.description or transaction.description == DEFAULT_DESCRIPTION:
+            return None
+
+        return normalize_description(transaction.description)
+
+    def _forget_if_untracked(self, key: str | None) -> None:
+        if key is not None and key not in self._by_amount and key not in self._by_count:
+            self._descriptions.pop(key, None)
+
+    def _to_totals(self, heavy_hitters: list[HeavyHitter]) -> list[DescriptionTotal]:
+        return [
+            DescriptionTotal(self._descriptions[key], estimate, error)
+            for key, estimate, error in heavy_hitters
+        ]
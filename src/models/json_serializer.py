@@ -1,29 +1,82 @@
+import json
+import textwrap
+
 from src.models.transaction import Transaction
+from src.models.enums import StorageFormat
 from src.models.typed_dicts import SerializedTransaction
+import src.models.jsonl_storage as jsonl_storage
 
 
 """Serializa um objeto Transaction em dados JSON"""
 
 def to_JSON(transaction_list: list[Transaction]) -> list[SerializedTransaction]:
+    return [to_serialized_dict(transaction) for transaction in transaction_list]
+
+def to_serialized_dict(transaction: Transaction) -> SerializedTransaction:
     DATE_FORMAT = "%d/%m/%Y"
-    transaction_json = []
-    for transaction in transaction_list:
-        amount = transaction.amount
-        transaction_type = transaction.transaction_type.value
-        transaction_date = transaction.transaction_date.strftime(DATE_FORMAT)
-        category = transaction.category.value
-        description = transaction.description
-        transaction_id = transaction.id
-
-        transaction_dict = {
-            "amount" : amount,
-            "transaction_type" : transaction_type,
-            "transaction_date" : transaction_date,
-            "category" : category,
-            "description" : description,
-            "transaction_id" : transaction_id
-        }
-
-        transaction_json.append(transaction_dict)
-
-    return transaction_json
\ No newline at end of file
+    amount = transaction.amount
+    transaction_type = transaction.transaction_type.value
+    transaction_date = transaction.transaction_date.strftime(DATE_FORMAT)
+    category = transaction.category.value
+    description = transaction.description
+    transaction_id = transaction.id
+
+    return {
+        "amount" : amount,
+        "transaction_type" : transaction_type,
+        "transaction_date" : transaction_date,
+        "category" : category,
+        "description" : description,
+        "transaction_id" : transaction_id
+    }
+
+
+class SerializationCache:
+    """
+    Guarda a forma já codificada (bytes) de cada transação, indexada pelo ID.
+
+    Em uma gravação, apenas as transações novas ou marcadas como alteradas (Transaction.is_dirty) são
+    codificadas de novo; as demais reaproveitam os bytes do cache. Assim o custo de uma gravação acompanha
+    o número de alterações, e não o tamanho do arquivo.
+
+    No formato JSON cada registro é guardado já indentado como elemento da lista, de modo que o arquivo
+    final é idêntico ao gerado por json.dump(..., indent=4).
+    """
+    JSON_INDENT = 4
+
+    def __init__(self, storage_format: StorageFormat = StorageFormat.JSON) -> None:
+        self._storage_format: StorageFormat = storage_format
+        self._encoded: dict[int, bytes] = {}
+
+    def encode(self, transaction: Transaction) -> bytes:
+        encoded = self._encoded.get(transaction.id)
+        if encoded is None or transaction.is_dirty:
+            encoded = self._encoded[transaction.id] = self._encode_record(to_serialized_dict(transaction))
+            transaction.mark_clean()
+
+        return encoded
+
+    def encode_all(self, transaction_list: list[Transaction]) -> list[bytes]:
+        encoded_list = [self.encode(transaction) for transaction in transaction_list]
+        if len(self._encoded) > len(transaction_list):
+            # Houve exclusões: descarta as entradas de IDs que não existem mais
+            self._encoded = {transaction.id: self._encoded[transaction.id] for transaction in transaction_list}
+
+        return encoded_list
+
+    def join(self, encoded_list: list[bytes]) -> bytes:
+        """Junta os registros codificados no conteúdo final do arquivo."""
+        if self._storage_format == StorageFormat.JSONL:
+            return b"".join(encoded_list)
+
+        if not encoded_list:
+            return b"[]"
+
+        return b"[\n" + b",\n".join(encoded_list) + b"\n]"
+
+    def _encode_record(self, transaction_dict: SerializedTransaction) -> bytes:
+        if self._storage_format == StorageFormat.JSONL:
+            return jsonl_storage.to_jsonl_line(transaction_dict).encode("utf-8")
+
+        record = json.dumps(transaction_dict, indent=self.JSON_INDENT, ensure_ascii=False)
+        return textwrap.indent(record, " " * self.JSON_INDENT).encode("utf-8")
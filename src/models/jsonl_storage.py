@@ -0,0 +1,113 @@
+"""Funções de leitura e escrita de transações no formato JSON Lines (um registro compacto por linha)."""
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from src.models.typed_dicts import SerializedTransaction
+
+
+class JsonlChunk(NamedTuple):
+    """Conteúdo lido de um intervalo do arquivo. record_offsets[i] é o deslocamento (em bytes) de records[i]."""
+    records: list[SerializedTransaction]
+    record_offsets: list[int]
+    corrupted_offsets: list[int]
+
+
+def to_jsonl_line(transaction_dict: SerializedTransaction) -> str:
+    """Converte um registro serializado em uma linha JSON compacta, já terminada em quebra de linha."""
+    return json.dumps(transaction_dict, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def write_lines(file_path: Path, transaction_json: list[SerializedTransaction]) -> None:
+    """Reescreve o arquivo inteiro, um registro por linha."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.writelines(to_jsonl_line(transaction_dict) for transaction_dict in transaction_json)
+
+
+def append_lines(file_path: Path, encoded_lines: bytes) -> None:
+    """
+    Adiciona linhas já codificadas (ver to_jsonl_line) ao final do arquivo sem reescrevê-lo.
+
+    Se a última linha do arquivo tiver ficado incompleta (ex: queda de energia durante uma gravação),
+    uma quebra de linha é inserida antes, para que o novo registro não seja colado à linha corrompida.
+    """
+    needs_newline = False
+    if file_path.exists() and file_path.stat().st_size > 0:
+        with open(file_path, "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            needs_newline = file.read(1) != b"\n"
+
+    with open(file_path, "ab") as file:
+        if needs_newline:
+            file.write(b"\n")
+        file.write(encoded_lines)
+
+
+def split_into_chunks(file_path: Path, chunk_count: int) -> list[tuple[int, int]]:
+    """
+    Divide o arquivo em até chunk_count intervalos de bytes (início, fim) alinhados a quebras de linha.
+
+    Cada intervalo contém apenas linhas completas e pode ser lido de forma independente por read_chunk,
+    o que permite processar o arquivo em paralelo.
+    """
+    file_size = file_path.stat().st_size
+    if file_size == 0:
+        return []
+
+    chunk_count = max(1, chunk_count)
+    approximate_size = max(1, file_size // chunk_count)
+    boundaries = [0]
+    with open(file_path, "rb") as file:
+        for index in range(1, chunk_count):
+            position = max(index * approximate_size, boundaries[-1])
+            if position >= file_size:
+                break
+
+            file.seek(position)
+            file.readline()  # Avança até o fim da linha atual
+            boundary = file.tell()
+            if boundary >= file_size:
+                break
+
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+    boundaries.append(file_size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def read_chunk(file_path: Path, start: int, end: int) -> JsonlChunk:
+    """
+    Lê as linhas contidas no intervalo de bytes [start, end).
+
+    Returns:
+    JsonlChunk com os registros lidos, o deslocamento (em bytes) de cada um deles e os deslocamentos das
+    linhas corrompidas, que são ignoradas sem afetar o restante do arquivo.
+    """
+    records: list[SerializedTransaction] = []
+    record_offsets: list[int] = []
+    corrupted_offsets: list[int] = []
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        offset = start
+        while offset < end:
+            line = file.readline()
+            if not line:
+                break
+
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                    record_offsets.append(offset)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    corrupted_offsets.append(offset)
+
+            offset += len(line)
+
+    return JsonlChunk(records, record_offsets, corrupted_offsets)
+
+
+def read_lines(file_path: Path) -> JsonlChunk:
+    """Lê o arquivo inteiro (ver read_chunk)."""
+    return read_chunk(file_path, 0, file_path.stat().st_size)
@@ -0,0 +1,81 @@
+"""
+Estatísticas de ordem (mediana e percentis) dos valores de cada tipo de transação.
+
+Os valores de receitas e de despesas ficam em listas ordenadas, mantidas com busca binária: incluir ou excluir
+uma transação custa uma busca O(log n) mais o deslocamento da lista, e qualquer percentil é lido por posição em
+O(1), sem copiar nem ordenar os valores de novo a cada atualização das estatísticas.
+"""
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Sequence
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+from src.models.transaction_view import as_view
+
+
+def get_median(sorted_amounts: Sequence[int | float]) -> int | float:
+    """Mesmo resultado de statistics.median, mas sobre valores já ordenados."""
+    if not sorted_amounts:
+        return 0
+
+    middle = len(sorted_amounts) // 2
+    if len(sorted_amounts) % 2:
+        return sorted_amounts[middle]
+
+    return (sorted_amounts[middle - 1] + sorted_amounts[middle]) / 2
+
+
+def get_percentile(sorted_amounts: Sequence[int | float], percentage: float) -> int | float:
+    """Percentil com interpolação linear entre as duas posições mais próximas (0 <= percentage <= 100)."""
+    if not 0 <= percentage <= 100:
+        raise ValueError('O percentil deve estar entre 0 e 100!')
+
+    if not sorted_amounts:
+        return 0
+
+    rank = (len(sorted_amounts) - 1) * percentage / 100
+    lower = int(rank)
+    fraction = rank - lower
+    if not fraction:
+        return sorted_amounts[lower]
+
+    return sorted_amounts[lower] + (sorted_amounts[lower + 1] - sorted_amounts[lower]) * fraction
+
+
+class OrderStatisticsIndex:
+    """
+    Índice mantido pelo TransactionManager (add/remove a cada alteração da lista). Também pode ser montado
+    sobre uma lista qualquer, como as transações de um período: a ordenação é feita uma vez e serve à mediana
+    e a todos os percentis.
+    """
+    def __init__(self, transaction_list: Iterable[Transaction] = ()) -> None:
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        self._amounts: dict[TransactionType, list[int | float]] = {
+            transaction_type: [] for transaction_type in TransactionType
+        }
+        for transaction in transaction_list:
+            self._amounts[transaction.transaction_type].append(transaction.amount)
+
+        for amounts in self._amounts.values():
+            amounts.sort()
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        insort(self._amounts[transaction.transaction_type], transaction.amount)
+
+    def remove(self, transaction: Transaction) -> None:
+        amounts = self._amounts[transaction.transaction_type]
+        position = bisect_left(amounts, transaction.amount)
+        if position < len(amounts) and amounts[position] == transaction.amount:
+            del amounts[position]
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def get_count(self, transaction_type: TransactionType) -> int:
+        return len(self._amounts[transaction_type])
+
+    def get_median(self, transaction_type: TransactionType) -> int | float:
+        return get_median(self._amounts[transaction_type])
+
+    def get_percentile(self, transaction_type: TransactionType, percentage: float) -> int | float:
+        return get_percentile(self._amounts[transaction_type], percentage)
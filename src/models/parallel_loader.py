@@ -0,0 +1,97 @@
+"""
+Carga paralela de arquivos grandes de transações.
+
+Os registros são divididos em blocos, convertidos e validados em um ProcessPoolExecutor, e os resultados são
+reunidos na ordem original. O contador de IDs de Transaction é recalculado uma única vez ao final, já que os
+objetos chegam dos processos filhos sem passar pelo __init__ no processo principal.
+Abaixo dos limites definidos aqui a carga continua em um único processo, onde o custo de criar processos
+e serializar os resultados não compensa.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.models.transaction import Transaction
+from src.models.typed_dicts import SerializedTransaction
+import src.models.data_parser as parser
+import src.models.jsonl_storage as jsonl_storage
+from src.models.worker_pool import CHUNKS_PER_WORKER, get_chunk_size
+
+
+PARALLEL_LOAD_MIN_RECORDS = 20_000
+PARALLEL_LOAD_MIN_BYTES = 4 * 1024 * 1024
+
+
+def parse_records(records: list[SerializedTransaction]) -> list[Transaction]:
+    """Converte e valida uma lista de registros em um único processo. Um registro inválido invalida a carga."""
+    parsed_transaction_dict_list = parser.parse_from_json(records)
+    return Transaction.from_json(parsed_transaction_dict_list)
+
+
+def parse_records_individually(
+    records: list[SerializedTransaction], record_offsets: list[int]
+) -> tuple[list[Transaction], list[int]]:
+    """
+    Converte os registros um a um, descartando apenas os inválidos em vez do arquivo inteiro.
+
+    Returns:
+    Tupla com as transações válidas e os deslocamentos dos registros que falharam na validação
+    (ex: valor negativo), para que sejam reportados junto com as linhas corrompidas.
+    """
+    transaction_list = []
+    invalid_offsets = []
+    for transaction_dict, offset in zip(records, record_offsets):
+        try:
+            transaction_list.extend(parse_records([transaction_dict]))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            invalid_offsets.append(offset)
+
+    return transaction_list, invalid_offsets
+
+
+def load_records_parallel(records: list[SerializedTransaction], workers: int) -> list[Transaction]:
+    """Versão paralela de parse_records para registros já lidos de um arquivo JSON."""
+    if workers <= 1 or len(records) < PARALLEL_LOAD_MIN_RECORDS:
+        return parse_records(records)
+
+    chunk_size = get_chunk_size(len(records), workers)
+    chunks = [records[start:start + chunk_size] for start in range(0, len(records), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(parse_records, chunks))
+
+    return _merge(results)
+
+
+def load_jsonl_parallel(file_path: Path, workers: int) -> tuple[list[Transaction], list[int]]:
+    """
+    Carrega um arquivo JSONL dividindo-o em intervalos de bytes alinhados a quebras de linha.
+    Cada processo lê e valida o próprio intervalo, então apenas o resultado é serializado entre processos.
+
+    Returns:
+    Tupla com as transações e os deslocamentos, em ordem, das linhas ignoradas (corrompidas ou inválidas).
+    """
+    if workers <= 1 or file_path.stat().st_size < PARALLEL_LOAD_MIN_BYTES:
+        return _load_jsonl_chunk(file_path, 0, file_path.stat().st_size)
+
+    ranges = jsonl_storage.split_into_chunks(file_path, workers * CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_load_jsonl_chunk, file_path, start, end) for start, end in ranges]
+        results = [future.result() for future in futures]
+
+    corrupted_offsets = [offset for _, chunk_offsets in results for offset in chunk_offsets]
+    return _merge([transaction_list for transaction_list, _ in results]), corrupted_offsets
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _load_jsonl_chunk(file_path: Path, start: int, end: int) -> tuple[list[Transaction], list[int]]:
+    chunk = jsonl_storage.read_chunk(file_path, start, end)
+    transaction_list, invalid_offsets = parse_records_individually(chunk.records, chunk.record_offsets)
+    return transaction_list, sorted(chunk.corrupted_offsets + invalid_offsets)
+
+
+def _merge(results: list[list[Transaction]]) -> list[Transaction]:
+    transaction_list = [transaction for chunk in results for transaction in chunk]
+    max_id = max((transaction.id for transaction in transaction_list), default=0)
+    if max_id > Transaction.get_transaction_counter():
+        Transaction.set_transaction_counter(max_id)
+
+    return transaction_list
@@ -0,0 +1,184 @@
+"""
+Agregados parciais das estatísticas, que podem ser combinados.
+
+Um PartialStatistics resume um bloco qualquer de transações: soma, contagem e maior valor por tipo e categoria, e
+um histograma dos valores de cada tipo (para mediana e percentis). Combinar os resumos de dois blocos dá o mesmo
+resultado de resumir os dois juntos, então as estatísticas podem ser calculadas por partes (blocos processados em
+paralelo, ou os meses do cubo de agregados) e reunidas no final.
+
+Em listas grandes, summarize_parallel divide as transações em blocos resumidos em um ProcessPoolExecutor, como na
+carga paralela. Só o tipo, a categoria e o valor de cada transação são enviados aos processos, e só os resumos
+voltam deles.
+"""
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory
+from src.models.transaction_view import as_view
+from src.models.amount_histogram import AmountHistogram
+from src.models.worker_pool import get_chunk_size
+
+
+PARALLEL_STATISTICS_MIN_TRANSACTIONS = 200_000
+
+AmountRecord = tuple[TransactionType, IncomeCategory | ExpenseCategory, int | float]
+CategoryKey = tuple[TransactionType, IncomeCategory | ExpenseCategory]
+
+
+@dataclass(slots=True)
+class AggregateCell:
+    total: int | float = 0
+    count: int = 0
+    highest: int | float = 0
+
+    def add(self, amount: int | float) -> None:
+        self.total += amount
+        self.count += 1
+        if self.count == 1 or amount > self.highest:
+            self.highest = amount
+
+    def merge(self, other: 'AggregateCell') -> None:
+        if other.count == 0:
+            return
+
+        self.highest = other.highest if self.count == 0 else max(self.highest, other.highest)
+        self.total += other.total
+        self.count += other.count
+
+
+@dataclass
+class PartialStatistics:
+    """Com with_histograms=False só as células são mantidas: basta para somas e contagens, e custa menos."""
+    cells: dict[CategoryKey, AggregateCell] = field(default_factory=dict)
+    histograms: dict[TransactionType, AmountHistogram] = field(default_factory=dict)
+    with_histograms: bool = True
+
+    @classmethod
+    def from_transactions(
+            cls,
+            transaction_list: Iterable[Transaction],
+            with_histograms: bool = True
+            ) -> 'PartialStatistics':
+        partial = cls(with_histograms=with_histograms)
+        partial.add_all(transaction_list)
+        return partial
+
+    def __bool__(self) -> bool:
+        return bool(self.cells)
+
+    # Inclusão e exclusão --------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        self.add_amount(transaction.transaction_type, transaction.category, transaction.amount)
+
+    def add_all(self, transaction_list: Iterable[Transaction]) -> None:
+        # Em um arquivo, linhas leves lidas das colunas; as descrições não são necessárias aqui
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        for transaction in transaction_list:
+            self.add_amount(transaction.transaction_type, transaction.category, transaction.amount)
+
+    def add_amount(
+            self,
+            transaction_type: TransactionType,
+            category: IncomeCategory | ExpenseCategory,
+            amount: int | float
+            ) -> None:
+        cell = self.cells.get((transaction_type, category))
+        if cell is None:
+            cell = self.cells[(transaction_type, category)] = AggregateCell()
+        cell.add(amount)
+        if not self.with_histograms:
+            return
+
+        histogram = self.histograms.get(transaction_type)
+        if histogram is None:
+            histogram = self.histograms[transaction_type] = AmountHistogram()
+        histogram.add(amount)
+
+    def remove(self, transaction: Transaction) -> None:
+        """
+        Desfaz add. O maior valor da célula não é recalculado: se a transação excluída era a de maior valor,
+        cabe a quem mantém o resumo recalculá-lo (ver RollupCube).
+        """
+        key = (transaction.transaction_type, transaction.category)
+        cell = self.cells.get(key)
+        if cell is None:
+            return
+
+        cell.total -= transaction.amount
+        cell.count -= 1
+        if cell.count == 0:
+            del self.cells[key]
+        if self.with_histograms:
+            self.histograms[transaction.transaction_type].remove(transaction.amount)
+
+    def merge(self, other: 'PartialStatistics') -> None:
+        """Acrescenta os agregados de other a este resumo (other não é alterado)."""
+        for key, other_cell in other.cells.items():
+            cell = self.cells.get(key)
+            if cell is None:
+                cell = self.cells[key] = AggregateCell()
+            cell.merge(other_cell)
+
+        if not self.with_histograms:
+            return
+
+        for transaction_type, other_histogram in other.histograms.items():
+            histogram = self.histograms.get(transaction_type)
+            if histogram is None:
+                histogram = self.histograms[transaction_type] = AmountHistogram()
+            histogram.merge(other_histogram)
+
+    # Quantis --------------------------------------------------------------------------------------------------------
+    def get_median(self, transaction_type: TransactionType) -> int | float:
+        histogram = self.histograms.get(transaction_type)
+        return 0 if histogram is None else histogram.get_median()
+
+    def get_percentile(self, transaction_type: TransactionType, percentage: float) -> int | float:
+        histogram = self.histograms.get(transaction_type)
+        return 0 if histogram is None else histogram.get_percentile(percentage)
+
+
+def merge_all(partials: Iterable[PartialStatistics], with_histograms: bool = True) -> PartialStatistics:
+    merged = PartialStatistics(with_histograms=with_histograms)
+    for partial in partials:
+        merged.merge(partial)
+
+    return merged
+
+
+def summarize_parallel(
+        transaction_list: Iterable[Transaction],
+        workers: int,
+        with_histograms: bool = True
+        ) -> PartialStatistics:
+    """Mesmo resultado de PartialStatistics.from_transactions, com os blocos resumidos em paralelo."""
+    if not isinstance(transaction_list, list):
+        transaction_list = list(as_view(transaction_list).iter_rows())
+
+    if workers <= 1 or len(transaction_list) < PARALLEL_STATISTICS_MIN_TRANSACTIONS:
+        return PartialStatistics.from_transactions(transaction_list, with_histograms)
+
+    chunk_size = get_chunk_size(len(transaction_list), workers)
+    chunks = [
+        [
+            (transaction.transaction_type, transaction.category, transaction.amount)
+            for transaction in transaction_list[start:start + chunk_size]
+        ]
+        for start in range(0, len(transaction_list), chunk_size)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_summarize_chunk, chunks, repeat(with_histograms))
+        return merge_all(results, with_histograms)
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _summarize_chunk(records: list[AmountRecord], with_histograms: bool) -> PartialStatistics:
+    partial = PartialStatistics(with_histograms=with_histograms)
+    for transaction_type, category, amount in records:
+        partial.add_amount(transaction_type, category, amount)
+
+    return partial
@@ -0,0 +1,153 @@
+"""
+Estruturas das consultas paginadas por chave (keyset pagination).
+
+Cada página termina em uma chave (valor do campo de ordenação, id). A próxima página começa logo depois dessa
+chave, e não em uma posição da lista; por isso transações adicionadas ou excluídas entre uma página e outra não
+fazem linhas se repetirem ou serem puladas. A chave viaja entre as camadas como um token de texto opaco.
+"""
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory, SortField
+
+
+SortKey = tuple[int | float, int]
+Limit = int | float | date
+
+
+@dataclass(frozen=True)
+class QueryCriteria:
+    """
+    Filtros de uma consulta. Campos None não filtram; os intervalos incluem os extremos.
+    search é a busca enquanto digita: cada termo precisa aparecer na descrição ou no nome da categoria.
+    """
+    start_amount: int | float | None = None
+    end_amount: int | float | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    transaction_type: TransactionType | None = None
+    category: IncomeCategory | ExpenseCategory | None = None
+    description: str | None = None
+    search: str | None = None
+
+    @property
+    def is_date_range_only(self) -> bool:
+        """Indica se o único filtro (se houver) é o intervalo de datas."""
+        return self == QueryCriteria(start_date=self.start_date, end_date=self.end_date)
+
+    def matches(self, transaction: Transaction) -> bool:
+        """Confere todos os filtros, exceto a descrição e a busca, que usam o índice de descrições."""
+        if self.start_amount is not None and transaction.amount < self.start_amount:
+            return False
+        if self.end_amount is not None and transaction.amount > self.end_amount:
+            return False
+        if self.start_date is not None and transaction.transaction_date < self.start_date:
+            return False
+        if self.end_date is not None and transaction.transaction_date > self.end_date:
+            return False
+        if self.transaction_type is not None and transaction.transaction_type != self.transaction_type:
+            return False
+        if self.category is not None and not self._matches_category(transaction.category):
+            return False
+
+        return True
+
+    def combine(self, other: 'QueryCriteria') -> 'QueryCriteria':
+        """
+        Critérios que exigem os dois conjuntos de filtros ao mesmo tempo (ex: um filtro aplicado sobre outro):
+        os intervalos são intersectados e os termos de busca, somados. Levanta ValueError se os tipos ou as
+        categorias forem diferentes, já que nenhuma transação atenderia aos dois.
+        """
+        if None not in (self.transaction_type, other.transaction_type) and (
+                self.transaction_type != other.transaction_type):
+            raise ValueError('Nenhuma transação atende a este tipo junto com o filtro ativo!')
+
+        if None not in (self.category, other.category) and not self._matches_category(other.category):
+            raise ValueError('Nenhuma transação atende a esta categoria junto com o filtro ativo!')
+
+        return QueryCriteria(
+            start_amount=_combine_limits(max, self.start_amount, other.start_amount),
+            end_amount=_combine_limits(min, self.end_amount, other.end_amount),
+            start_date=_combine_limits(max, self.start_date, other.start_date),
+            end_date=_combine_limits(min, self.end_date, other.end_date),
+            transaction_type=self.transaction_type or other.transaction_type,
+            category=self.category or other.category,
+            description=_combine_terms(self.description, other.description),
+            search=_combine_terms(self.search, other.search)
+        )
+
+    def _matches_category(self, category: IncomeCategory | ExpenseCategory) -> bool:
+        # 'outros' existe nos dois tipos e, como em filter_by_category, casa com ambos.
+        if self.category in (IncomeCategory.OTHERS, ExpenseCategory.OTHERS):
+            return category in (IncomeCategory.OTHERS, ExpenseCategory.OTHERS)
+
+        return category == self.category
+
+
+@dataclass(frozen=True)
+class QuerySort:
+    field: SortField = SortField.ID
+    reverse: bool = False
+
+
+@dataclass
+class QueryPage:
+    """Uma página de resultados. next_key é None quando não há mais páginas."""
+    transactions: list[Transaction]
+    next_key: str | None = None
+
+
+def get_sort_key(transaction: Transaction, sort_field: SortField) -> SortKey:
+    """O id desempata valores iguais, então cada transação tem uma chave única."""
+    match sort_field:
+        case SortField.ID:
+            return transaction.id, transaction.id
+
+        case SortField.DATE:
+            return transaction.transaction_date.toordinal(), transaction.id
+
+        case SortField.AMOUNT:
+            return transaction.amount, transaction.id
+
+    raise ValueError(f'{sort_field} não é um campo de ordenação válido!')
+
+
+def encode_key(sort: QuerySort, key: SortKey) -> str:
+    payload = json.dumps([sort.field.value, sort.reverse, *key], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_key(sort: QuerySort, token: str) -> SortKey:
+    """Levanta ValueError se o token estiver corrompido ou tiver sido gerado para outra ordenação."""
+    try:
+        field_value, reverse, value, transaction_id = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError, TypeError, ValueError):
+        raise ValueError('Token de continuação inválido!') from None
+
+    if field_value != sort.field.value or reverse != sort.reverse:
+        raise ValueError('O token de continuação pertence a outra ordenação!')
+
+    if not isinstance(value, (int, float)) or not isinstance(transaction_id, int):
+        raise ValueError('Token de continuação inválido!')
+
+    return value, transaction_id
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _combine_limits(choose: Callable[[Limit, Limit], Limit], first: Limit | None, second: Limit | None) -> Limit | None:
+    if first is None or second is None:
+        return second if first is None else first
+
+    return choose(first, second)
+
+
+def _combine_terms(first: str | None, second: str | None) -> str | None:
+    if first is None or second is None:
+        return second if first is None else first
+
+    return f'{first} {second}'
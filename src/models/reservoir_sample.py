@@ -0,0 +1,161 @@
+"""
+Estatísticas de ordem aproximadas por amostragem de reservatório.
+
+Uma amostra uniforme de tamanho fixo é mantida enquanto as transações passam uma única vez (algoritmo L de Li, que
+sorteia quantas transações pular até a próxima substituição, em vez de sortear a cada transação). A memória não
+depende do número de transações, e mediana e percentis são lidos da amostra ordenada.
+
+O erro é dado pela desigualdade de Dvoretzky-Kiefer-Wolfowitz: com a confiança indicada, a posição relativa de
+qualquer quantil da amostra difere da posição na população em no máximo sqrt(ln(2 / (1 - confiança)) / (2k)), em
+que k é o tamanho da amostra. Enquanto todas as transações cabem no reservatório, os valores são exatos.
+"""
+import math
+import random
+from collections.abc import Iterable
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+from src.models.transaction_view import as_view
+from src.models.order_statistics import get_median, get_percentile
+from src.models.partial_statistics import PartialStatistics
+
+
+DEFAULT_SAMPLE_SIZE = 10_000
+DEFAULT_CONFIDENCE = 0.95
+
+
+class ReservoirSample:
+    def __init__(self, capacity: int = DEFAULT_SAMPLE_SIZE, seed: int | None = None) -> None:
+        if capacity <= 0:
+            raise ValueError('O tamanho da amostra deve ser positivo!')
+
+        self._capacity = capacity
+        self._random = random.Random(seed)
+        self._values: list[int | float] = []
+        self._seen: int = 0
+        self._sorted_values: list[int | float] | None = None
+        # Algoritmo L: peso corrente e posição (a partir de 0) do próximo valor a entrar na amostra, que parte da
+        # última posição preenchida ao completar o reservatório
+        self._weight: float = 1.0
+        self._next_position: int = capacity - 1
+
+    def __len__(self) -> int:
+        """Número de valores vistos (não o tamanho da amostra)."""
+        return self._seen
+
+    @property
+    def sample_size(self) -> int:
+        return len(self._values)
+
+    @property
+    def is_exact(self) -> bool:
+        return self._seen <= self._capacity
+
+    def add(self, amount: int | float) -> None:
+        position = self._seen
+        self._seen += 1
+        if position < self._capacity:
+            self._values.append(amount)
+            self._sorted_values = None
+            if position == self._capacity - 1:
+                self._advance()
+            return
+
+        if position == self._next_position:
+            self._values[self._random.randrange(self._capacity)] = amount
+            self._sorted_values = None
+            self._advance()
+
+    # Quantis --------------------------------------------------------------------------------------------------------
+    def get_median(self) -> int | float:
+        return get_median(self._get_sorted_values())
+
+    def get_percentile(self, percentage: float) -> int | float:
+        return get_percentile(self._get_sorted_values(), percentage)
+
+    def get_rank_error(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        """Erro máximo da posição relativa (0 a 1) de um quantil estimado, com a confiança indicada."""
+        if self.is_exact:
+            return 0.0
+
+        return math.sqrt(math.log(2 / (1 - confidence)) / (2 * len(self._values)))
+
+    def get_percentile_bounds(
+            self,
+            percentage: float,
+            confidence: float = DEFAULT_CONFIDENCE
+            ) -> tuple[int | float, int | float]:
+        """Intervalo que contém o percentil da população com a confiança indicada."""
+        error = self.get_rank_error(confidence) * 100
+        return (
+            self.get_percentile(max(percentage - error, 0)),
+            self.get_percentile(min(percentage + error, 100)),
+        )
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _advance(self) -> None:
+        """Sorteia a próxima posição a substituir um valor da amostra."""
+        self._weight *= math.exp(math.log(self._random.random() or 1e-300) / self._capacity)
+        skip = math.floor(math.log(self._random.random() or 1e-300) / math.log1p(-self._weight))
+        self._next_position += skip + 1
+
+    def _get_sorted_values(self) -> list[int | float]:
+        if self._sorted_values is None:
+            self._sorted_values = sorted(self._values)
+
+        return self._sorted_values
+
+
+class SampledQuantiles:
+    """Uma amostra por tipo de transação, com a mesma interface de consulta do OrderStatisticsIndex."""
+    def __init__(self, capacity: int = DEFAULT_SAMPLE_SIZE, seed: int | None = None) -> None:
+        self._samples: dict[TransactionType, ReservoirSample] = {
+            transaction_type: ReservoirSample(capacity, seed) for transaction_type in TransactionType
+        }
+
+    @classmethod
+    def from_transactions(
+            cls,
+            transaction_list: Iterable[Transaction],
+            capacity: int = DEFAULT_SAMPLE_SIZE,
+            seed: int | None = None
+            ) -> 'SampledQuantiles':
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        quantiles = cls(capacity, seed)
+        for transaction in transaction_list:
+            quantiles.add(transaction.transaction_type, transaction.amount)
+
+        return quantiles
+
+    def add(self, transaction_type: TransactionType, amount: int | float) -> None:
+        self._samples[transaction_type].add(amount)
+
+    def get_sample(self, transaction_type: TransactionType) -> ReservoirSample:
+        return self._samples[transaction_type]
+
+    def get_median(self, transaction_type: TransactionType) -> int | float:
+        return self._samples[transaction_type].get_median()
+
+    def get_percentile(self, transaction_type: TransactionType, percentage: float) -> int | float:
+        return self._samples[transaction_type].get_percentile(percentage)
+
+
+def summarize_with_sample(
+        transaction_list: Iterable[Transaction],
+        capacity: int = DEFAULT_SAMPLE_SIZE,
+        seed: int | None = None
+        ) -> tuple[PartialStatistics, SampledQuantiles]:
+    """
+    Uma única passada, em memória constante: contadores exatos por tipo e categoria (sem histogramas) e uma
+    amostra de valores por tipo para mediana e percentis.
+    """
+    transaction_list = as_view(transaction_list).iter_rows()
+
+    partial = PartialStatistics(with_histograms=False)
+    quantiles = SampledQuantiles(capacity, seed)
+    for transaction in transaction_list:
+        partial.add_amount(transaction.transaction_type, transaction.category, transaction.amount)
+        quantiles.add(transaction.transaction_type, transaction.amount)
+
+    return partial, quantiles
@@ -0,0 +1,214 @@
+"""
+Somas móveis de receitas e despesas (ex: gasto dos últimos 30 dias), dia a dia, para várias larguras de janela.
+
+As transações são percorridas uma única vez em ordem de data, com dois ponteiros por janela: o da direita inclui
+cada transação na soma, e o da esquerda retira as que saíram da janela quando o dia avança. Cada transação entra e
+sai de cada soma uma única vez, em vez de refiltrar o intervalo de datas a cada posição da janela. As somas são
+feitas em centavos, então retirar valores não acumula erro de arredondamento.
+
+Transações com data a partir do último dia processado estendem as séries sem refazer a passada (o caso comum:
+incluir a despesa de hoje). Uma transação anterior a esse dia, ou uma exclusão, marca o índice como desatualizado,
+e a passada é refeita na próxima consulta.
+"""
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+from src.models.transaction_view import as_view
+
+
+DEFAULT_WINDOW_DAYS: tuple[int, ...] = (7, 30, 90)
+
+# Posição de cada tipo nas somas [receitas, despesas] de uma janela
+_INCOME_SLOT = 0
+_EXPENSE_SLOT = 1
+# Entradas que já saíram de todas as janelas são descartadas em blocos de pelo menos este tamanho
+_TRIM_THRESHOLD = 4096
+
+
+@dataclass
+class RollingSeries:
+    """
+    Somas da janela de window_days dias terminada em cada dia, de first_day em diante (uma posição por dia,
+    inclusive dias sem transações).
+    """
+    window_days: int
+    first_day: date | None = None
+    incomes: array = field(default_factory=lambda: array('d'))
+    expenses: array = field(default_factory=lambda: array('d'))
+
+    def __len__(self) -> int:
+        return len(self.expenses)
+
+    @property
+    def last_day(self) -> date | None:
+        if self.first_day is None:
+            return None
+
+        return self.first_day + timedelta(days=len(self) - 1)
+
+    def get_day(self, position: int) -> date:
+        """Dia em que termina a janela da posição indicada (negativas contam do fim)."""
+        if position < 0:
+            position += len(self)
+
+        return self.first_day + timedelta(days=position)
+
+    def get_previous_expenses(self) -> float | None:
+        """Despesas da janela imediatamente anterior à última, sem sobreposição; None se a série não a alcança."""
+        position = len(self) - 1 - self.window_days
+        return self.expenses[position] if position >= 0 else None
+
+    def get_expense_change(self) -> float | None:
+        """Variação percentual das despesas da última janela em relação à anterior; None sem base de comparação."""
+        previous = self.get_previous_expenses()
+        if not previous:
+            return None
+
+        return (self.expenses[-1] - previous) / previous * 100
+
+    def get_peak_expenses(self) -> tuple[date, float] | None:
+        """Maior gasto em uma janela e o dia em que essa janela termina."""
+        if not self.expenses:
+            return None
+
+        position = max(range(len(self.expenses)), key=self.expenses.__getitem__)
+        return self.get_day(position), self.expenses[position]
+
+
+class RollingWindows:
+    """Índice mantido pelo TransactionManager (add/remove a cada alteração da lista)."""
+    def __init__(
+            self,
+            transaction_list: Iterable[Transaction] = (),
+            window_days: Iterable[int] = DEFAULT_WINDOW_DAYS
+            ) -> None:
+        self._window_days: tuple[int, ...] = tuple(sorted(set(window_days)))
+        if not self._window_days or self._window_days[0] <= 0:
+            raise ValueError('As janelas devem ter pelo menos um dia!')
+
+        self.rebuild(transaction_list)
+
+    @property
+    def window_days(self) -> tuple[int, ...]:
+        return self._window_days
+
+    @property
+    def is_stale(self) -> bool:
+        """Indica se uma alteração fora de ordem exige refazer a passada (ver rebuild)."""
+        return self._is_stale
+
+    def rebuild(self, transaction_list: Iterable[Transaction]) -> None:
+        """Refaz as séries a partir da lista, em qualquer ordem."""
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        # (dia ordinal, posição do tipo, centavos) de cada transação ainda dentro de alguma janela, em ordem de data
+        self._entries: list[tuple[int, int, int]] = []
+        self._current_ordinal: int | None = None
+        self._left: dict[int, int] = {window_days: 0 for window_days in self._window_days}
+        self._sums: dict[int, list[int]] = {window_days: [0, 0] for window_days in self._window_days}
+        # Centavos do dia corrente ainda não somados às janelas (ver _flush_day)
+        self._day_sums: list[int] = [0, 0]
+        self._series: dict[int, RollingSeries] = {
+            window_days: RollingSeries(window_days) for window_days in self._window_days
+        }
+        self._is_stale: bool = False
+        self.extend(sorted(transaction_list, key=lambda transaction: transaction.transaction_date))
+
+    def extend(self, transaction_list: Iterable[Transaction]) -> None:
+        """Inclui transações em ordem de data, sem refazer a passada. Nenhuma pode ser anterior ao último dia."""
+        for transaction in transaction_list:
+            ordinal = transaction.transaction_date.toordinal()
+            if self._current_ordinal is None:
+                self._start(ordinal)
+            elif ordinal < self._current_ordinal:
+                raise ValueError('As transações devem estar em ordem de data, a partir do último dia processado!')
+
+            while self._current_ordinal < ordinal:
+                self._advance_day()
+
+            slot = _EXPENSE_SLOT if transaction.transaction_type == TransactionType.EXPENSE else _INCOME_SLOT
+            cents = round(transaction.amount * 100)
+            self._entries.append((ordinal, slot, cents))
+            self._day_sums[slot] += cents
+
+        self._flush_day()
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        if self._is_stale:
+            return
+
+        if self._current_ordinal is not None and transaction.transaction_date.toordinal() < self._current_ordinal:
+            self._is_stale = True
+            return
+
+        self.extend((transaction,))
+
+    def remove(self, transaction: Transaction) -> None:
+        self._is_stale = True
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def get_series(self, window_days: int) -> RollingSeries:
+        series = self._series.get(window_days)
+        if series is None:
+            raise ValueError(f'Janela de {window_days} dias não calculada!')
+
+        return series
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _start(self, ordinal: int) -> None:
+        self._current_ordinal = ordinal
+        for series in self._series.values():
+            series.first_day = date.fromordinal(ordinal)
+            series.incomes.append(0.0)
+            series.expenses.append(0.0)
+
+    def _advance_day(self) -> None:
+        """Avança um dia: retira das somas as transações que saíram de cada janela e abre a posição do novo dia."""
+        self._flush_day()
+        self._current_ordinal += 1
+        entries = self._entries
+        for window_days, sums in self._sums.items():
+            # Transações deste dia ou anteriores já não estão na janela terminada hoje
+            oldest_ordinal = self._current_ordinal - window_days
+            left = self._left[window_days]
+            while left < len(entries) and entries[left][0] <= oldest_ordinal:
+                _, slot, cents = entries[left]
+                sums[slot] -= cents
+                left += 1
+
+            self._left[window_days] = left
+            series = self._series[window_days]
+            series.incomes.append(sums[_INCOME_SLOT] / 100)
+            series.expenses.append(sums[_EXPENSE_SLOT] / 100)
+
+        self._trim()
+
+    def _flush_day(self) -> None:
+        """Soma às janelas as transações do dia corrente de uma só vez, em vez de uma a uma."""
+        day_income, day_expense = self._day_sums
+        if not day_income and not day_expense:
+            return
+
+        for window_days, sums in self._sums.items():
+            sums[_INCOME_SLOT] += day_income
+            sums[_EXPENSE_SLOT] += day_expense
+            series = self._series[window_days]
+            series.incomes[-1] = sums[_INCOME_SLOT] / 100
+            series.expenses[-1] = sums[_EXPENSE_SLOT] / 100
+
+        self._day_sums = [0, 0]
+
+    def _trim(self) -> None:
+        # A janela mais larga é a que retém mais entradas; tudo antes do ponteiro dela já saiu de todas
+        expired_count = self._left[self._window_days[-1]]
+        if expired_count < _TRIM_THRESHOLD or expired_count < len(self._entries) // 2:
+            return
+
+        del self._entries[:expired_count]
+        for window_days in self._window_days:
+            self._left[window_days] -= expired_count
@@ -0,0 +1,227 @@
+"""
+Cubo de agregados mês × tipo × categoria (soma, contagem e maior valor), gravado ao lado do arquivo de dados.
+
+Cada mês guarda um PartialStatistics só com as células de cada categoria. Um relatório sobre meses inteiros combina
+apenas os resumos do intervalo, sem percorrer as transações; só os meses das pontas, quando o intervalo começa ou
+termina no meio de um deles, são calculados a partir das linhas. Medianas e percentis não ficam no cubo: vêm do
+OrderStatisticsIndex (ver src.models.order_statistics), que já mantém os valores ordenados.
+
+O arquivo (<arquivo de dados>.rollup) é identificado pela mesma chave do snapshot (tamanho, mtime e hash do arquivo
+de origem) e reescrito em segundo plano após cada gravação; se não corresponder ao arquivo, o cubo é reconstruído.
+Só os meses alterados desde a gravação anterior são codificados de novo.
+"""
+import json
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from datetime import date
+from pathlib import Path
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
+from src.models.transaction_view import as_view
+from src.models.partial_statistics import PartialStatistics, AggregateCell, CategoryKey, merge_all
+import src.models.snapshot as snapshot
+
+
+ROLLUP_SUFFIX = '.rollup'
+
+
+def get_month_id(transaction_date: date) -> int:
+    """Número sequencial do mês (meses consecutivos têm números consecutivos)."""
+    return transaction_date.year * 12 + transaction_date.month - 1
+
+
+def get_month_start(month_id: int) -> date:
+    return date(month_id // 12, month_id % 12 + 1, 1)
+
+
+class RollupCube:
+    """
+    Índice mantido pelo TransactionManager (add/remove a cada alteração da lista).
+
+    Soma e contagem são atualizadas a cada alteração. O maior valor não pode ser desfeito por
+    subtração: ao excluir a transação de maior valor de uma célula, ela fica pendente e o valor é recalculado, a
+    partir da lista de origem, na próxima consulta.
+    """
+    def __init__(
+            self,
+            transaction_list: Iterable[Transaction] = (),
+            partials: dict[int, PartialStatistics] | None = None
+            ) -> None:
+        # Referência à lista do gerenciador, que é alterada no lugar; usada só para recalcular maiores valores
+        self._source = transaction_list
+        self._stale_keys: set[tuple[int, CategoryKey]] = set()
+        # Meses já codificados para gravação (ver get_month_records) e meses alterados desde então
+        self._records_by_month: dict[int, list] = {}
+        if partials is not None:
+            self._partials_by_month: dict[int, PartialStatistics] = partials
+            self._dirty_months: set[int] = set(partials)
+            return
+
+        self._dirty_months = set()
+
+        self._partials_by_month = {}
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        for transaction in transaction_list:
+            self.add(transaction)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        month_id = get_month_id(transaction.transaction_date)
+        partial = self._partials_by_month.get(month_id)
+        if partial is None:
+            partial = self._partials_by_month[month_id] = PartialStatistics(with_histograms=False)
+        partial.add(transaction)
+        self._dirty_months.add(month_id)
+
+    def remove(self, transaction: Transaction) -> None:
+        month_id = get_month_id(transaction.transaction_date)
+        partial = self._partials_by_month.get(month_id)
+        key = (transaction.transaction_type, transaction.category)
+        cell = None if partial is None else partial.cells.get(key)
+        if cell is None:
+            return
+
+        partial.remove(transaction)
+        self._dirty_months.add(month_id)
+        if key not in partial.cells:
+            self._stale_keys.discard((month_id, key))
+            if not partial:
+                del self._partials_by_month[month_id]
+        elif transaction.amount >= cell.highest:
+            self._stale_keys.add((month_id, key))
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def summarize(self, first_month_id: int, last_month_id: int) -> PartialStatistics:
+        """Agregados dos meses entre first_month_id e last_month_id (inclusive), combinados em um só resumo."""
+        return merge_all(
+            (partial for _, partial in self.iter_months(first_month_id, last_month_id)), with_histograms=False
+        )
+
+    def iter_months(self, first_month_id: int, last_month_id: int) -> Iterator[tuple[int, PartialStatistics]]:
+        """Resumo de cada mês com transações entre first_month_id e last_month_id; não devem ser alterados."""
+        self._refresh_stale_cells()
+        for month_id, partial in self._partials_by_month.items():
+            if first_month_id <= month_id <= last_month_id:
+                yield month_id, partial
+
+    def get_month_records(self) -> list[list]:
+        """
+        Resumos dos meses no formato do arquivo. Só os meses alterados desde a chamada anterior são codificados;
+        os registros dos demais são reaproveitados (e nunca alterados depois de criados).
+        """
+        self._refresh_stale_cells()
+        for month_id in self._dirty_months:
+            partial = self._partials_by_month.get(month_id)
+            if partial is None:
+                self._records_by_month.pop(month_id, None)
+            else:
+                self._records_by_month[month_id] = [
+                    month_id,
+                    [[*_encode_key(key), cell.total, cell.count, cell.highest] for key, cell in partial.cells.items()],
+                ]
+        self._dirty_months.clear()
+
+        return list(self._records_by_month.values())
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _refresh_stale_cells(self) -> None:
+        """Recalcula, em uma única passada pela lista de origem, os maiores valores pendentes."""
+        if not self._stale_keys:
+            return
+
+        highest_by_key: dict[tuple[int, CategoryKey], int | float] = {}
+        for transaction in self._source:
+            key = (get_month_id(transaction.transaction_date), (transaction.transaction_type, transaction.category))
+            if key not in self._stale_keys:
+                continue
+
+            highest = highest_by_key.get(key)
+            if highest is None or transaction.amount > highest:
+                highest_by_key[key] = transaction.amount
+
+        for month_id, key in self._stale_keys:
+            self._partials_by_month[month_id].cells[key].highest = highest_by_key.get((month_id, key), 0)
+
+        self._stale_keys.clear()
+
+
+# Persistência -------------------------------------------------------------------------------------------------------
+def get_rollup_path(source_path: Path) -> Path:
+    return source_path.with_name(source_path.name + ROLLUP_SUFFIX)
+
+
+def load(source_path: Path, transaction_list: Iterable[Transaction]) -> RollupCube | None:
+    """Lê o cubo gravado para source_path; None se ele não existir, estiver ilegível ou desatualizado."""
+    try:
+        with open(get_rollup_path(source_path), 'r', encoding='utf-8') as file:
+            content = json.load(file)
+
+        source_size, source_mtime_ns, source_hash = content['source']
+        key = snapshot.SnapshotKey(source_size, source_mtime_ns, bytes.fromhex(source_hash))
+        if not snapshot.matches_source(source_path, key):
+            return None
+
+        partials: dict[int, PartialStatistics] = {}
+        for month_id, cell_records in content['months']:
+            partial = partials[month_id] = PartialStatistics(with_histograms=False)
+            for type_code, category_code, total, count, highest in cell_records:
+                partial.cells[_decode_key(type_code, category_code)] = AggregateCell(total, count, highest)
+    except (OSError, ValueError, KeyError, TypeError, IndexError):
+        return None
+
+    return RollupCube(transaction_list, partials)
+
+
+def write_in_background(source_path: Path, cube: RollupCube, writer: snapshot.BackgroundWriter) -> None:
+    """
+    Agenda a gravação do cubo no writer. Os registros dos meses são obtidos agora (só os alterados são
+    codificados); o tamanho e o mtime do arquivo também, e, como no snapshot, a gravação é descartada se o
+    arquivo mudar enquanto o hash é calculado.
+    """
+    records = cube.get_month_records()
+    stat = source_path.stat()
+    writer.submit(
+        get_rollup_path(source_path), _write_ignoring_errors, source_path, records, stat.st_size, stat.st_mtime_ns
+    )
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _encode_key(key: CategoryKey) -> tuple[int, int]:
+    transaction_type, category = key
+    if transaction_type == TransactionType.INCOME:
+        return snapshot.TYPE_CODES.index(transaction_type), snapshot.INCOME_CATEGORY_CODES.index(category)
+
+    return snapshot.TYPE_CODES.index(transaction_type), snapshot.EXPENSE_CATEGORY_CODES.index(category)
+
+
+def _decode_key(type_code: int, category_code: int) -> CategoryKey:
+    transaction_type = snapshot.TYPE_CODES[type_code]
+    if transaction_type == TransactionType.INCOME:
+        return transaction_type, snapshot.INCOME_CATEGORY_CODES[category_code]
+
+    return transaction_type, snapshot.EXPENSE_CATEGORY_CODES[category_code]
+
+
+def _write_ignoring_errors(
+        source_path: Path,
+        records: list[list],
+        source_size: int,
+        source_mtime_ns: int) -> None:
+    # O cubo é apenas um cache: uma falha ao gravá-lo não deve afetar a aplicação.
+    try:
+        source_hash = snapshot.hash_file(source_path)
+        stat = source_path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (source_size, source_mtime_ns):
+            return
+
+        rollup_path = get_rollup_path(source_path)
+        temporary_path = rollup_path.with_name(f'{rollup_path.name}.{threading.get_ident()}.tmp')
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump({'source': [source_size, source_mtime_ns, source_hash.hex()], 'months': records}, file)
+
+        os.replace(temporary_path, rollup_path)
+    except (OSError, ValueError):
+        pass
@@ -0,0 +1,87 @@
+"""
+Saldo acumulado de cada transação: o saldo da conta logo após ela, percorrendo as transações por data (e por ID,
+entre transações do mesmo dia).
+
+Os saldos são calculados em uma única passada pela ordem de datas e guardados em uma lista alinhada às chaves
+(data, ID). Uma inclusão, exclusão ou edição muda apenas o saldo das transações a partir da sua posição; o índice
+guarda a menor posição alterada e recalcula somente esse sufixo, uma vez, na próxima consulta.
+"""
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from src.models.transaction import Transaction
+from src.models.enums import SortField
+from src.models.transaction_view import as_view
+from src.models.balance_index import get_signed_cents
+from src.models.query import SortKey, get_sort_key
+
+
+class RunningBalanceIndex:
+    """Índice mantido pelo TransactionManager (add/remove a cada alteração da lista)."""
+    def __init__(self, transaction_list: Iterable[Transaction] = ()) -> None:
+        transaction_list = as_view(transaction_list).iter_rows()
+
+        entries = sorted(
+            (get_sort_key(transaction, SortField.DATE), get_signed_cents(transaction))
+            for transaction in transaction_list
+        )
+        self._keys: list[SortKey] = [key for key, _ in entries]
+        self._cents: list[int] = [cents for _, cents in entries]
+        self._balances: list[int] = [0] * len(entries)
+        # Posições a partir de _dirty_from têm saldo desatualizado
+        self._dirty_from: int = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        key = get_sort_key(transaction, SortField.DATE)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return
+
+        self._keys.insert(position, key)
+        self._cents.insert(position, get_signed_cents(transaction))
+        self._balances.insert(position, 0)
+        self._dirty_from = min(self._dirty_from, position)
+
+    def remove(self, transaction: Transaction) -> None:
+        key = get_sort_key(transaction, SortField.DATE)
+        position = bisect_left(self._keys, key)
+        if position == len(self._keys) or self._keys[position] != key:
+            return
+
+        del self._keys[position]
+        del self._cents[position]
+        del self._balances[position]
+        self._dirty_from = min(self._dirty_from, position)
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def get_balances(self, transaction_list: Iterable[Transaction]) -> list[float | None]:
+        """Saldo acumulado de cada transação recebida, na mesma ordem; None para uma transação fora do índice."""
+        self._refresh()
+        keys = self._keys
+        balances: list[float | None] = []
+        for transaction in transaction_list:
+            key = get_sort_key(transaction, SortField.DATE)
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                balances.append(self._balances[position] / 100)
+            else:
+                balances.append(None)
+
+        return balances
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _refresh(self) -> None:
+        """Recalcula o saldo apenas das posições a partir da primeira alterada."""
+        start = self._dirty_from
+        cents = self._cents
+        balances = self._balances
+        balance = balances[start - 1] if start > 0 else 0
+        for position in range(start, len(cents)):
+            balance += cents[position]
+            balances[position] = balance
+
+        self._dirty_from = len(cents)
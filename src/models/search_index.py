@@ -0,0 +1,144 @@
+"""
+Índice de busca textual sobre as descrições das transações.
+
+As descrições se repetem muito (o mesmo estabelecimento aparece centenas de vezes), então o índice guarda cada
+descrição normalizada uma única vez, com o conjunto de IDs que a usam. Sobre essas descrições distintas há:
+
+- um índice invertido de palavras, usado para buscas por palavra inteira ou por prefixo (termos curtos);
+- um índice opcional de trigramas, usado para encontrar termos em qualquer posição da descrição.
+
+Uma busca percorre apenas as descrições candidatas, nunca a lista de transações inteira.
+"""
+import re
+from collections.abc import Iterable
+
+from src.models.transaction import Transaction
+from src.models.dedup_index import normalize_description
+
+
+TOKEN_PATTERN = re.compile(r'\w+')
+TRIGRAM_SIZE = 3
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Divide o texto normalizado (sem acentos, minúsculo) em palavras."""
+    return TOKEN_PATTERN.findall(normalize_description(text))
+
+
+def get_trigrams(text: str) -> set[str]:
+    return {text[index:index + TRIGRAM_SIZE] for index in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+class DescriptionIndex:
+    """
+    Índice de descrições mantido pelo TransactionManager (add/remove a cada alteração da lista).
+
+    Com use_trigrams=True, cada termo da busca com 3 ou mais caracteres casa com qualquer trecho da descrição
+    ("merc" encontra "Supermercado"). Sem trigramas, os termos casam apenas com palavras inteiras. Termos com
+    menos de 3 caracteres sempre casam pelo início das palavras.
+    """
+    def __init__(self, transaction_list: Iterable[Transaction] = (), use_trigrams: bool = True) -> None:
+        self._use_trigrams: bool = use_trigrams
+        self._ids_by_description: dict[str, set[int]] = {}
+        self._descriptions_by_token: dict[str, set[str]] = {}
+        self._descriptions_by_trigram: dict[str, set[str]] = {}
+        for transaction in transaction_list:
+            self.add(transaction)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        description = normalize_description(transaction.description)
+        if not description:
+            return
+
+        ids = self._ids_by_description.get(description)
+        if ids is None:
+            ids = self._ids_by_description[description] = set()
+            self._index_description(description)
+
+        ids.add(transaction.id)
+
+    def remove(self, transaction: Transaction) -> None:
+        description = normalize_description(transaction.description)
+        ids = self._ids_by_description.get(description)
+        if ids is None:
+            return
+
+        ids.discard(transaction.id)
+        if not ids:
+            del self._ids_by_description[description]
+            self._unindex_description(description)
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def search(self, query: str) -> set[int]:
+        """Retorna os IDs das transações cuja descrição contém todos os termos da busca."""
+        terms = tokenize(query)
+        if not terms:
+            return set()
+
+        # Os termos mais longos costumam ser os mais seletivos; começar por eles reduz as interseções seguintes.
+        matching_descriptions: set[str] | None = None
+        for term in sorted(set(terms), key=len, reverse=True):
+            candidates = self._find_descriptions(term)
+            matching_descriptions = candidates if matching_descriptions is None \
+                else matching_descriptions & candidates
+            if not matching_descriptions:
+                return set()
+
+        matching_ids: set[int] = set()
+        for description in matching_descriptions:
+            matching_ids |= self._ids_by_description[description]
+
+        return matching_ids
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _find_descriptions(self, term: str) -> set[str]:
+        if len(term) < TRIGRAM_SIZE:
+            return self._find_by_token_prefix(term)
+
+        if not self._use_trigrams:
+            return set(self._descriptions_by_token.get(term, ()))
+
+        candidates: set[str] | None = None
+        for trigram in sorted(get_trigrams(term), key=lambda gram: len(self._descriptions_by_trigram.get(gram, ()))):
+            postings = self._descriptions_by_trigram.get(trigram)
+            if not postings:
+                return set()
+
+            candidates = set(postings) if candidates is None else candidates & postings
+
+        # Os trigramas podem aparecer fora de ordem na descrição; a verificação final confirma o trecho.
+        return {description for description in candidates if term in description}
+
+    def _find_by_token_prefix(self, prefix: str) -> set[str]:
+        descriptions: set[str] = set()
+        for token, token_descriptions in self._descriptions_by_token.items():
+            if token.startswith(prefix):
+                descriptions |= token_descriptions
+
+        return descriptions
+
+    def _index_description(self, description: str) -> None:
+        for token in set(TOKEN_PATTERN.findall(description)):
+            self._descriptions_by_token.setdefault(token, set()).add(description)
+
+        if self._use_trigrams:
+            for trigram in get_trigrams(description):
+                self._descriptions_by_trigram.setdefault(trigram, set()).add(description)
+
+    def _unindex_description(self, description: str) -> None:
+        for token in set(TOKEN_PATTERN.findall(description)):
+            self._discard_posting(self._descriptions_by_token, token, description)
+
+        if self._use_trigrams:
+            for trigram in get_trigrams(description):
+                self._discard_posting(self._descriptions_by_trigram, trigram, description)
+
+    def _discard_posting(self, postings: dict[str, set[str]], key: str, description: str) -> None:
+        descriptions = postings.get(key)
+        if descriptions is None:
+            return
+
+        descriptions.discard(description)
+        if not descriptions:
+            del postings[key]
@@ -0,0 +1,424 @@
+"""
+Snapshot binário colunar das transações, gravado ao lado do arquivo de dados.
+
+O snapshot guarda cada campo em uma coluna empacotada com struct/array (IDs, valores, datas como ordinais,
+códigos de tipo e categoria) e as descrições em uma tabela de strings UTF-8. Ele é identificado pelo tamanho,
+mtime e hash do arquivo de origem: se o arquivo não mudou, a carga lê o snapshot via mmap e reconstrói as
+transações sem reinterpretar nem revalidar o JSON.
+
+Layout (cabeçalho little-endian, colunas na ordem de bytes nativa, já que o snapshot é um cache local):
+cabeçalho | ids (q) | valores (d) | offsets das descrições (I, n + 1) | datas (i) | tipos (B) | categorias (B)
+| flags (B) | tabela de strings
+"""
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory
+
+
+MAGIC = b"FCSNAP01"
+# magic, tamanho do arquivo de origem, mtime_ns, hash, quantidade de registros, tamanho da tabela de strings
+HEADER_FORMAT = "<8sQq16sQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SNAPSHOT_SUFFIX = ".snap"
+
+TYPE_CODES: list[TransactionType] = list(TransactionType)
+INCOME_CATEGORY_CODES: list[IncomeCategory] = list(IncomeCategory)
+EXPENSE_CATEGORY_CODES: list[ExpenseCategory] = list(ExpenseCategory)
+
+FLAG_INTEGER_AMOUNT = 1
+ROW_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True)
+class SnapshotKey:
+    """Identifica a versão do arquivo de origem a partir da qual o snapshot foi gerado."""
+    source_size: int
+    source_mtime_ns: int
+    source_hash: bytes
+
+
+def get_snapshot_path(source_path: Path) -> Path:
+    return source_path.with_name(source_path.name + SNAPSHOT_SUFFIX)
+
+
+def hash_file(file_path: Path) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.digest()
+
+
+def build_key(source_path: Path) -> SnapshotKey:
+    stat = source_path.stat()
+    return SnapshotKey(stat.st_size, stat.st_mtime_ns, hash_file(source_path))
+
+
+def read_key(snapshot_path: Path) -> SnapshotKey | None:
+    try:
+        with open(snapshot_path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+    except OSError:
+        return None
+
+    if len(header) < HEADER_SIZE:
+        return None
+
+    magic, source_size, source_mtime_ns, source_hash, _, _ = struct.unpack(HEADER_FORMAT, header)
+    if magic != MAGIC:
+        return None
+
+    return SnapshotKey(source_size, source_mtime_ns, source_hash)
+
+
+def is_valid(source_path: Path) -> bool:
+    """
+    Verifica se o snapshot corresponde ao arquivo de origem.
+
+    Tamanho e mtime iguais bastam (caminho rápido). Se apenas o mtime mudou, o hash do conteúdo decide,
+    evitando reconstruir o snapshot quando o arquivo foi só copiado ou tocado.
+    """
+    if not source_path.exists():
+        return False
+
+    key = read_key(get_snapshot_path(source_path))
+    if key is None:
+        return False
+
+    return matches_source(source_path, key)
+
+
+def matches_source(source_path: Path, key: SnapshotKey) -> bool:
+    """Compara a chave com o arquivo de origem atual, pelas mesmas regras de is_valid."""
+    if not source_path.exists():
+        return False
+
+    stat = source_path.stat()
+    if key.source_size != stat.st_size:
+        return False
+
+    if key.source_mtime_ns == stat.st_mtime_ns:
+        return True
+
+    return key.source_hash == hash_file(source_path)
+
+
+def write(source_path: Path, transaction_list: list[Transaction], key: SnapshotKey | None = None) -> None:
+    """Grava o snapshot do arquivo de origem de forma atômica (arquivo temporário + os.replace)."""
+    if key is None:
+        key = build_key(source_path)
+
+    write_columns(get_snapshot_path(source_path), transaction_list, key)
+
+
+def write_archive(archive_path: Path, transaction_list: list[Transaction]) -> None:
+    """Grava um arquivo colunar independente, sem arquivo de origem, para consulta em modo somente leitura."""
+    write_columns(archive_path, transaction_list, SnapshotKey(0, 0, bytes(16)))
+
+
+def write_columns(target_path: Path, transaction_list: list[Transaction], key: SnapshotKey) -> None:
+    ids = array("q")
+    amounts = array("d")
+    description_offsets = array("I", [0])
+    ordinals = array("i")
+    type_codes = bytearray()
+    category_codes = bytearray()
+    flags = bytearray()
+    string_table = bytearray()
+
+    for transaction in transaction_list:
+        ids.append(transaction.id)
+        amounts.append(transaction.amount)
+        ordinals.append(transaction.transaction_date.toordinal())
+        type_codes.append(TYPE_CODES.index(transaction.transaction_type))
+        category_codes.append(_encode_category(transaction))
+        flags.append(FLAG_INTEGER_AMOUNT if isinstance(transaction.amount, int) else 0)
+        string_table += transaction.description.encode("utf-8")
+        description_offsets.append(len(string_table))
+
+    header = struct.pack(
+        HEADER_FORMAT,
+        MAGIC,
+        key.source_size,
+        key.source_mtime_ns,
+        key.source_hash,
+        len(transaction_list),
+        len(string_table),
+    )
+
+    temporary_path = target_path.with_name(f"{target_path.name}.{threading.get_ident()}.tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(header)
+        for column in (ids, amounts, description_offsets, ordinals, type_codes, category_codes, flags):
+            file.write(column)
+        file.write(string_table)
+
+    os.replace(temporary_path, target_path)
+
+
+class BackgroundWriter:
+    """
+    Executa as gravações de cache (snapshot, cubo de agregados) em uma única thread daemon, uma de cada vez.
+
+    Um pedido para um destino que ainda aguarda na fila substitui o anterior, já que só o conteúdo mais recente
+    interessa. wait() aguarda a fila esvaziar (ex: ao encerrar o programa, para não deixar arquivos .tmp).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[Path, tuple[Callable[..., None], tuple]] = {}
+        self._thread: threading.Thread | None = None
+
+    def submit(self, target_path: Path, function: Callable[..., None], *args) -> None:
+        with self._lock:
+            self._pending[target_path] = (function, args)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def wait(self) -> None:
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+
+                target_path = next(iter(self._pending))
+                function, args = self._pending.pop(target_path)
+
+            function(*args)
+
+
+def write_in_background(source_path: Path, transaction_list: list[Transaction], writer: BackgroundWriter) -> None:
+    """
+    Agenda a reconstrução do snapshot no writer, sem bloquear a aplicação.
+
+    O tamanho e o mtime do arquivo são capturados agora, junto com a lista: se o arquivo mudar enquanto o hash
+    é calculado, o snapshot é descartado em vez de ser associado a um conteúdo diferente do que ele contém.
+    """
+    stat = source_path.stat()
+    writer.submit(
+        get_snapshot_path(source_path),
+        _write_ignoring_errors,
+        source_path,
+        transaction_list.copy(),
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
+
+
+def remove_temporary_files(target_path: Path) -> None:
+    """Apaga os arquivos temporários de gravações interrompidas de target_path (ex: programa encerrado no meio)."""
+    for temporary_path in target_path.parent.glob(f"{target_path.name}.*.tmp"):
+        try:
+            temporary_path.unlink()
+        except OSError:
+            pass
+
+
+def load(source_path: Path) -> list[Transaction]:
+    """Lê o snapshot via mmap e reconstrói todas as transações, atualizando o contador de IDs uma única vez."""
+    with SnapshotColumns(get_snapshot_path(source_path)) as columns:
+        transaction_list = columns.decode_all()
+        max_id = max(columns.ids, default=0)
+
+    if max_id > Transaction.get_transaction_counter():
+        Transaction.set_transaction_counter(max_id)
+
+    return transaction_list
+
+
+class SnapshotColumns:
+    """
+    Acesso somente leitura às colunas de um snapshot mapeado em memória.
+
+    As colunas são memoryviews sobre o mmap, então nada é copiado até que uma linha seja decodificada.
+    """
+
+    def __init__(self, snapshot_path: Path) -> None:
+        self._file = open(snapshot_path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Snapshot {snapshot_path} está vazio!")
+
+        buffer = memoryview(self._mmap)
+        magic, _, _, _, row_count, string_table_size = struct.unpack_from(HEADER_FORMAT, buffer)
+        if magic != MAGIC:
+            buffer.release()
+            self.close()
+            raise ValueError(f"{snapshot_path} não é um snapshot válido!")
+
+        self._row_count: int = row_count
+        self._row_cache: OrderedDict[int, Transaction] = OrderedDict()
+        offset = HEADER_SIZE
+        self.ids, offset = self._take(buffer, offset, "q", row_count)
+        self.amounts, offset = self._take(buffer, offset, "d", row_count)
+        self._description_offsets, offset = self._take(buffer, offset, "I", row_count + 1)
+        self.ordinals, offset = self._take(buffer, offset, "i", row_count)
+        self.type_codes, offset = self._take(buffer, offset, "B", row_count)
+        self.category_codes, offset = self._take(buffer, offset, "B", row_count)
+        self.flags, offset = self._take(buffer, offset, "B", row_count)
+        self._string_table = buffer[offset:offset + string_table_size]
+        self._views = [
+            self.ids, self.amounts, self._description_offsets, self.ordinals,
+            self.type_codes, self.category_codes, self.flags, self._string_table, buffer,
+        ]
+
+    def __len__(self) -> int:
+        return self._row_count
+
+    def __enter__(self) -> "SnapshotColumns":
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in getattr(self, "_views", []):
+            view.release()
+        self._views = []
+        self._mmap.close()
+        self._file.close()
+
+    def get_amount(self, row: int) -> float | int:
+        amount = self.amounts[row]
+        return int(amount) if self.flags[row] & FLAG_INTEGER_AMOUNT else amount
+
+    def get_transaction_type(self, row: int) -> TransactionType:
+        return TYPE_CODES[self.type_codes[row]]
+
+    def get_transaction_date(self, row: int) -> date:
+        return date.fromordinal(self.ordinals[row])
+
+    def get_category(self, row: int) -> IncomeCategory | ExpenseCategory:
+        code = self.category_codes[row]
+        if self.type_codes[row] == TYPE_CODES.index(TransactionType.INCOME):
+            return INCOME_CATEGORY_CODES[code]
+
+        return EXPENSE_CATEGORY_CODES[code]
+
+    def get_description(self, row: int) -> str:
+        start = self._description_offsets[row]
+        end = self._description_offsets[row + 1]
+        return str(self._string_table[start:end], "utf-8")
+
+    def decode_row(self, row: int) -> Transaction:
+        return Transaction.from_snapshot(
+            self.get_amount(row),
+            self.get_transaction_type(row),
+            self.get_transaction_date(row),
+            self.get_category(row),
+            self.get_description(row),
+            self.ids[row],
+        )
+
+    def get_row(self, row: int) -> Transaction:
+        """
+        Versão de decode_row com cache das linhas decodificadas mais recentes. As views pedem a mesma linha
+        várias vezes seguidas (uma vez por coluna e por papel), então o cache evita decodificá-la de novo.
+        """
+        transaction = self._row_cache.get(row)
+        if transaction is not None:
+            self._row_cache.move_to_end(row)
+            return transaction
+
+        transaction = self._row_cache[row] = self.decode_row(row)
+        if len(self._row_cache) > ROW_CACHE_SIZE:
+            self._row_cache.popitem(last=False)
+
+        return transaction
+
+    def decode_all(self) -> list[Transaction]:
+        """
+        Decodifica todas as linhas de uma vez. Converte cada coluna em lista uma única vez e reaproveita
+        os objetos date e as categorias repetidas, o que é bem mais rápido que chamar decode_row por linha.
+        """
+        ids = self.ids.tolist()
+        amounts = self.amounts.tolist()
+        ordinals = self.ordinals.tolist()
+        type_codes = self.type_codes.tolist()
+        category_codes = self.category_codes.tolist()
+        flags = self.flags.tolist()
+        offsets = self._description_offsets.tolist()
+        string_table = bytes(self._string_table)
+
+        income_code = TYPE_CODES.index(TransactionType.INCOME)
+        dates: dict[int, date] = {}
+        transaction_list = []
+        for row, transaction_id in enumerate(ids):
+            ordinal = ordinals[row]
+            transaction_date = dates.get(ordinal)
+            if transaction_date is None:
+                transaction_date = dates[ordinal] = date.fromordinal(ordinal)
+
+            type_code = type_codes[row]
+            if type_code == income_code:
+                category = INCOME_CATEGORY_CODES[category_codes[row]]
+            else:
+                category = EXPENSE_CATEGORY_CODES[category_codes[row]]
+
+            amount = amounts[row]
+            if flags[row] & FLAG_INTEGER_AMOUNT:
+                amount = int(amount)
+
+            transaction_list.append(Transaction.from_snapshot(
+                amount,
+                TYPE_CODES[type_code],
+                transaction_date,
+                category,
+                string_table[offsets[row]:offsets[row + 1]].decode("utf-8"),
+                transaction_id,
+            ))
+
+        return transaction_list
+
+    def _take(self, buffer: memoryview, offset: int, type_code: str, count: int) -> tuple[memoryview, int]:
+        size = struct.calcsize(type_code) * count
+        column = buffer[offset:offset + size]
+        if type_code != "B":
+            column = column.cast(type_code)
+        return column, offset + size
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _encode_category(transaction: Transaction) -> int:
+    if transaction.transaction_type == TransactionType.INCOME:
+        return INCOME_CATEGORY_CODES.index(transaction.category)
+
+    return EXPENSE_CATEGORY_CODES.index(transaction.category)
+
+
+def _write_ignoring_errors(
+        source_path: Path,
+        transaction_list: list[Transaction],
+        source_size: int,
+        source_mtime_ns: int) -> None:
+    # O snapshot é apenas um cache: uma falha ao gravá-lo não deve afetar a aplicação.
+    try:
+        key = SnapshotKey(source_size, source_mtime_ns, hash_file(source_path))
+        stat = source_path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (source_size, source_mtime_ns):
+            return
+
+        write(source_path, transaction_list, key)
+    except (OSError, ValueError):
+        pass
@@ -0,0 +1,96 @@
+"""
+Índice ordenado por um campo (id, data ou valor), usado pelas consultas paginadas.
+
+Guarda as chaves (valor, id) em uma lista ordenada; a busca da posição de início de uma página é uma busca
+binária, e cada página percorre apenas as chaves a partir dali, até completar o limite pedido.
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+
+from src.models.transaction import Transaction
+from src.models.enums import SortField
+from src.models.archive_view import ArchiveTransactionList
+from src.models.query import SortKey, get_sort_key
+
+
+class SortedIndex:
+    """
+    Índice mantido pelo TransactionManager (add/remove a cada alteração da lista).
+
+    Sobre um arquivo somente leitura, as chaves vêm direto das colunas e as transações só são decodificadas
+    quando a página que as contém é pedida.
+    """
+    def __init__(self, sort_field: SortField, transaction_list: Iterable[Transaction] = ()) -> None:
+        self._sort_field: SortField = sort_field
+        if isinstance(transaction_list, ArchiveTransactionList):
+            self._keys: list[SortKey] = transaction_list.get_sort_keys(sort_field)
+            self._transactions_by_id: dict[int, Transaction] = {}
+            self._archive: ArchiveTransactionList | None = transaction_list
+            return
+
+        self._transactions_by_id = {transaction.id: transaction for transaction in transaction_list}
+        self._keys = sorted(
+            get_sort_key(transaction, sort_field) for transaction in self._transactions_by_id.values()
+        )
+        self._archive = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        if transaction.id in self._transactions_by_id:
+            return
+
+        insort(self._keys, get_sort_key(transaction, self._sort_field))
+        self._transactions_by_id[transaction.id] = transaction
+
+    def remove(self, transaction: Transaction) -> None:
+        if self._transactions_by_id.pop(transaction.id, None) is None:
+            return
+
+        key = get_sort_key(transaction, self._sort_field)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def iter_keys_after(self, after_key: SortKey | None, reverse: bool) -> Iterator[SortKey]:
+        """
+        Percorre as chaves em ordem, começando logo depois de after_key (ou do início, se None).
+        O gerador deve ser consumido antes de a lista ser alterada.
+        """
+        keys = self._keys
+        if reverse:
+            start = len(keys) if after_key is None else bisect_left(keys, after_key)
+            positions = range(start - 1, -1, -1)
+        else:
+            start = 0 if after_key is None else bisect_right(keys, after_key)
+            positions = range(start, len(keys))
+
+        for position in positions:
+            yield keys[position]
+
+    def iter_range(self, low: int | float, high: int | float) -> Iterator[Transaction]:
+        """Transações cujo valor do campo está entre low e high (inclusive), em ordem crescente."""
+        keys = self._keys
+        start = bisect_left(keys, (low,))
+        end = bisect_right(keys, (high, float('inf')))
+        for position in range(start, end):
+            yield self.get_transaction(keys[position][1])
+
+    def get_range_ends(self, low: int | float, high: int | float) -> tuple[Transaction, Transaction] | None:
+        """Primeira e última transações de iter_range(low, high), por busca binária; None se não houver nenhuma."""
+        keys = self._keys
+        start = bisect_left(keys, (low,))
+        end = bisect_right(keys, (high, float('inf')))
+        if start >= end:
+            return None
+
+        return self.get_transaction(keys[start][1]), self.get_transaction(keys[end - 1][1])
+
+    def get_transaction(self, transaction_id: int) -> Transaction:
+        if self._archive is not None:
+            return self._archive.get_by_id(transaction_id)
+
+        return self._transactions_by_id[transaction_id]
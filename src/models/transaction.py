@@ -33,6 +33,8 @@ class Transaction():
                  category: IncomeCategory | ExpenseCategory = None, 
                  description: str = None,
                  transaction_id: int = None) -> None:
+        # Indica que a transação mudou desde a última serialização (ver json_serializer.SerializationCache)
+        self._is_dirty: bool = True
         self._validate_amount(amount)
         self._amount: float = amount
         self._validate_type(transaction_type)
@@ -128,6 +130,31 @@ class Transaction():
         
         return transaction_list
 
+    @classmethod
+    def from_snapshot(
+            cls,
+            amount: float | int,
+            transaction_type: TransactionType,
+            transaction_date: date,
+            category: IncomeCategory | ExpenseCategory,
+            description: str,
+            transaction_id: int) -> Transaction:
+        """
+        Reconstrói uma transação a partir de dados já validados (snapshot binário), sem repetir as validações
+        e sem alterar o contador de instâncias. Quem chama é responsável por atualizar o contador uma única vez
+        ao final da carga.
+        """
+        transaction = cls.__new__(cls)
+        transaction._amount = amount
+        transaction._transaction_type = transaction_type
+        transaction._transaction_date = transaction_date
+        transaction._category = category
+        transaction._description = description
+        transaction._id = transaction_id
+        transaction._is_dirty = True
+
+        return transaction
+
     #Propriedades públicas --------------------------------------------------------------------------------------------
     @property
     def transaction_type(self) -> TransactionType:
@@ -156,6 +183,7 @@ class Transaction():
             self._validate_category(new_category)
         
         self._category = new_category
+        self._is_dirty = True
 
     @property
     def description(self) -> str:
@@ -171,11 +199,21 @@ class Transaction():
                 raise ValueError('Descrição inválida! A descrição deve conter no máximo 90 caracteres')
     
         self._description = new_description
+        self._is_dirty = True
 
     @property
     def id(self):
         return self._id
 
+    @property
+    def is_dirty(self) -> bool:
+        """Indica se a transação foi criada ou alterada desde a última vez que foi serializada."""
+        return self._is_dirty
+
+    def mark_clean(self) -> None:
+        """Chamado pelo serializador após codificar a transação."""
+        self._is_dirty = False
+
     # Métodos para validação interna ----------------------------------------------------------------------------------
     def _validate_type(self, transaction_type: TransactionType) -> None:
         if not isinstance(transaction_type, TransactionType):
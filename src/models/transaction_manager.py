@@ -1,10 +1,39 @@
 import json
+import shutil
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from datetime import date, timedelta
 from pathlib import Path
 
 from src.models.transaction import Transaction, IncomeCategory, ExpenseCategory
-import src.models.data_parser as parser
+from src.models.enums import StorageFormat, SortField
 from src.models.typed_dicts import SerializedTransaction
 import src.models.json_serializer as serializer
+import src.models.jsonl_storage as jsonl_storage
+import src.models.snapshot as snapshot
+import src.models.parallel_loader as parallel_loader
+from src.models.archive_view import ArchiveTransactionList, ReadOnlyArchiveError
+from src.models.dedup_index import DedupIndex, normalize_description
+from src.models.search_index import DescriptionIndex
+from src.models.description_trie import DescriptionTrie
+from src.models.sorted_index import SortedIndex
+from src.models.query import QueryCriteria, QuerySort, QueryPage, encode_key, decode_key
+import src.models.rollup_cube as rollup_cube
+from src.models.rollup_cube import RollupCube
+from src.models.partial_statistics import PartialStatistics, merge_all
+from src.models.balance_index import BalanceIndex
+from src.models.running_balance import RunningBalanceIndex
+from src.models.order_statistics import OrderStatisticsIndex
+from src.models.heavy_hitters import DescriptionHeavyHitters
+from src.models.rolling_window import RollingWindows
+from src.models.unusual_expenses import UnusualExpenseDetector
+
+
+class IgnoredLinesError(ValueError):
+    """
+    Levantada quando uma operação reescreveria um arquivo JSONL que ainda tem linhas ignoradas na carga,
+    apagando-as do disco. Ver TransactionManager.discard_ignored_lines.
+    """
 
 
 class TransactionManager:
@@ -17,19 +46,129 @@ class TransactionManager:
     _transaction_list (list[Transaction]) = lista que contém todas as transações
     adicionadas.
     É iniciada como uma lista vazia.
+
+    Se archive_path for informado, o gerenciador abre o arquivo colunar em modo
+    somente leitura: as transações são decodificadas sob demanda e qualquer
+    operação de escrita levanta ReadOnlyArchiveError.
+
+    load_workers > 1 ativa a carga paralela de arquivos grandes (ver
+    src.models.parallel_loader).
+
+    Índices auxiliares (ex: DedupIndex) são construídos sob demanda e registrados
+    em _indexes; cada alteração da lista chama add/remove de todos eles, para que
+    nunca precisem ser reconstruídos.
     """
 
-    def __init__(self) -> None:
-        self._repository = TransactionRepository()
-        self._transaction_list: list[Transaction] = (
+    def __init__(
+        self,
+        storage_format: StorageFormat = StorageFormat.JSON,
+        archive_path: Path | None = None,
+        load_workers: int = 1,
+    ) -> None:
+        if archive_path is not None:
+            self._repository = ArchiveRepository(archive_path)
+        else:
+            self._repository = TransactionRepository(storage_format, load_workers)
+        self._transaction_list: list[Transaction] | ArchiveTransactionList = (
             self._repository.get_all_transactions()
         )
+        self._indexes: list[
+            DedupIndex
+            | DescriptionIndex
+            | DescriptionTrie
+            | SortedIndex
+            | RollupCube
+            | BalanceIndex
+            | RunningBalanceIndex
+            | OrderStatisticsIndex
+            | DescriptionHeavyHitters
+            | RollingWindows
+            | UnusualExpenseDetector
+        ] = []
+        self._dedup_index: DedupIndex | None = None
+        self._description_index: DescriptionIndex | None = None
+        self._description_trie: DescriptionTrie | None = None
+        self._sorted_indexes: dict[SortField, SortedIndex] = {}
+        self._rollup_cube: RollupCube | None = None
+        self._balance_index: BalanceIndex | None = None
+        self._running_balance_index: RunningBalanceIndex | None = None
+        self._order_statistics_index: OrderStatisticsIndex | None = None
+        self._heavy_hitters: DescriptionHeavyHitters | None = None
+        self._rolling_windows: RollingWindows | None = None
+        self._unusual_expense_detector: UnusualExpenseDetector | None = None
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._repository.is_read_only
+
+    @property
+    def ignored_line_offsets(self) -> list[int]:
+        """Deslocamentos das linhas do arquivo (corrompidas ou inválidas) que ficaram fora da lista."""
+        return self._repository.corrupted_offsets
+
+    def discard_ignored_lines(self) -> Path:
+        """
+        Autoriza gravações que reescrevem o arquivo, descartando as linhas ignoradas na carga.
+        Antes, o arquivo original é copiado; retorna o caminho da cópia.
+        """
+        self._ensure_writable()
+        return self._repository.discard_ignored_lines()
 
     # Métodos básicos de lista ---------------------------------------------------------
     def add_transaction(self, transaction: Transaction) -> None:
         """Adiciona uma (ou mais) transação nova à lista."""
-        self._transaction_list.append(transaction)
-        self._repository.save(self._transaction_list)
+        self.add_transactions([transaction])
+
+    def add_transactions(self, transaction_list: list[Transaction]) -> None:
+        """Adiciona várias transações de uma vez, com uma única gravação em disco."""
+        self._ensure_writable()
+        if not transaction_list:
+            return
+
+        self._transaction_list.extend(transaction_list)
+        self._notify_added(transaction_list)
+        if self._repository.supports_append:
+            # O snapshot e o cubo ficam para close (ou para a próxima carga)
+            self._repository.append(transaction_list)
+        else:
+            self._save()
+
+    def add_transaction_batches(self, batches: Iterable[list[Transaction]]) -> int:
+        """
+        Adiciona transações lote a lote (ex: um arquivo grande lido em fluxo), sem juntar os
+        lotes em memória. Cada lote é acrescentado ao arquivo quando o formato permite (o
+        snapshot e o cubo ficam para close); senão, o arquivo JSON inteiro é gravado uma
+        única vez, ao final.
+
+        O DedupIndex só recebe as transações novas ao final, para que durante a inclusão
+        continue refletindo o livro anterior, que é a referência das duplicatas de uma
+        importação. Retorna o número de transações adicionadas.
+        """
+        self._ensure_writable()
+        start = len(self._transaction_list)
+        dedup_index = self._dedup_index
+        if dedup_index is not None:
+            self._indexes.remove(dedup_index)
+
+        try:
+            for batch in batches:
+                if not batch:
+                    continue
+
+                self._transaction_list.extend(batch)
+                self._notify_added(batch)
+                if self._repository.supports_append:
+                    self._repository.append(batch)
+        finally:
+            if dedup_index is not None:
+                for transaction in islice(self._transaction_list, start, None):
+                    dedup_index.add(transaction)
+                self._indexes.append(dedup_index)
+
+            if len(self._transaction_list) > start and not self._repository.supports_append:
+                self._save()
+
+        return len(self._transaction_list) - start
 
     def get_all_transactions(self) -> list[Transaction]:
         """Retorna uma cópia da lista de todas as transações."""
@@ -38,6 +177,7 @@ class TransactionManager:
     def del_transaction(self, transaction_id: int) -> None:
         """Exclui uma transação (ou mais) da lista com base no ID dela.
         Levanta exceção caso não encontrar algum ID."""
+        self._ensure_rewritable()
         for transaction in self._transaction_list:
             if not any(
                 transaction.id == transaction_id
@@ -48,11 +188,15 @@ class TransactionManager:
         for transaction in self._transaction_list:
             if transaction.id == transaction_id:
                 self._transaction_list.remove(transaction)
+                self._notify_removed([transaction])
                 break
 
-        self._repository.save(self._transaction_list)
+        self._save()
 
     def get_transaction_by_id(self, transaction_id: int) -> Transaction:
+        if self.is_read_only:
+            return self._transaction_list.get_by_id(transaction_id)
+
         for transaction in self._transaction_list:
             if transaction_id == transaction.id:
                 return transaction
@@ -66,29 +210,458 @@ class TransactionManager:
         new_value: IncomeCategory | ExpenseCategory | None = None,
     ) -> None:
         """Altera a categoria da transação. Levanta exceção caso não encontrar o ID."""
+        self._ensure_rewritable()
         for transaction in self._transaction_list:
             if transaction.id == transaction_id:
-                transaction.category = new_value
-                self._repository.save(self._transaction_list)
+                self._notify_removed([transaction])
+                try:
+                    transaction.category = new_value
+                finally:
+                    self._notify_added([transaction])
+                self._save()
                 return
 
         raise ValueError(f"ID {transaction_id} não encontrado!")
 
     def update_transaction_description(self, transaction_id: int, new_value: str):
         """Altera os descrição da transação. Levanta exceção caso não encontrar o ID."""
+        self._ensure_rewritable()
         for transaction in self._transaction_list:
             if transaction.id == transaction_id:
-                transaction.description = new_value
-                self._repository.save(self._transaction_list)
+                self._notify_removed([transaction])
+                try:
+                    transaction.description = new_value
+                finally:
+                    self._notify_added([transaction])
+                self._save()
                 return
 
         raise ValueError(f"ID {transaction_id} não encontrado!")
 
+    # Índices ------------------------------------------------------------------------
+    def get_dedup_index(self) -> DedupIndex:
+        """Construído na primeira chamada e mantido atualizado a cada alteração da lista."""
+        if self._dedup_index is None:
+            self._dedup_index = DedupIndex(self._transaction_list)
+            self._indexes.append(self._dedup_index)
+
+        return self._dedup_index
+
+    def get_description_index(self) -> DescriptionIndex:
+        """Construído na primeira busca e mantido atualizado a cada alteração da lista."""
+        if self._description_index is None:
+            self._description_index = DescriptionIndex(self._transaction_list)
+            self._indexes.append(self._description_index)
+
+        return self._description_index
+
+    def search_descriptions(self, query: str) -> set[int]:
+        """Retorna os IDs das transações cuja descrição contém todos os termos da busca."""
+        return self.get_description_index().search(query)
+
+    def get_description_trie(self) -> DescriptionTrie:
+        """Construída na primeira sugestão e mantida atualizada a cada alteração da lista."""
+        if self._description_trie is None:
+            self._description_trie = DescriptionTrie(self._transaction_list)
+            self._indexes.append(self._description_trie)
+
+        return self._description_trie
+
+    def suggest_descriptions(self, prefix: str, limit: int) -> list[str]:
+        """Descrições já usadas que começam com prefix, das mais frequentes para as menos frequentes."""
+        return self.get_description_trie().suggest(prefix, limit)
+
+    def get_sorted_index(self, sort_field: SortField) -> SortedIndex:
+        """Um índice por campo, construído na primeira consulta ordenada por ele."""
+        sorted_index = self._sorted_indexes.get(sort_field)
+        if sorted_index is None:
+            sorted_index = self._sorted_indexes[sort_field] = SortedIndex(
+                sort_field, self._transaction_list
+            )
+            if not self.is_read_only:
+                self._indexes.append(sorted_index)
+
+        return sorted_index
+
+    def has_sorted_index(self, sort_field: SortField) -> bool:
+        return sort_field in self._sorted_indexes
+
+    def get_transactions_by_date_range(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> list[Transaction]:
+        """Transações entre as datas (inclusive), lidas do índice de datas em vez de percorrer a lista."""
+        if start_date is None and end_date is None:
+            return self.get_all_transactions()
+
+        return list(self.iter_transactions_by_date_range(start_date, end_date))
+
+    def iter_transactions_by_date_range(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> Iterable[Transaction]:
+        """
+        Como get_transactions_by_date_range, mas sem copiar: sem datas, é a própria lista (não
+        deve ser alterada); com datas, as transações são geradas a partir do índice de datas.
+        """
+        if start_date is None and end_date is None:
+            return self._transaction_list
+
+        start_ordinal = (start_date or date.min).toordinal()
+        end_ordinal = (end_date or date.max).toordinal()
+        return self.get_sorted_index(SortField.DATE).iter_range(start_ordinal, end_ordinal)
+
+    def get_rollup_cube(self) -> RollupCube:
+        """
+        Lido do arquivo ao lado dos dados na primeira chamada (ou construído, se ele estiver
+        desatualizado) e mantido atualizado a cada alteração da lista.
+        """
+        if self._rollup_cube is not None:
+            return self._rollup_cube
+
+        if self.is_read_only:
+            self._rollup_cube = RollupCube(self._transaction_list)
+            return self._rollup_cube
+
+        self._rollup_cube = self._repository.load_rollup_cube(self._transaction_list)
+        if self._rollup_cube is None:
+            self._rollup_cube = RollupCube(self._transaction_list)
+            self._repository.refresh_rollup_cube(self._rollup_cube)
+        self._indexes.append(self._rollup_cube)
+
+        return self._rollup_cube
+
+    def get_date_range_ends(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> tuple[date, date] | None:
+        """
+        Menor e maior data das transações entre as datas (inclusive), lidas das pontas do
+        índice de datas; None se não houver nenhuma.
+        """
+        start_ordinal = (start_date or date.min).toordinal()
+        end_ordinal = (end_date or date.max).toordinal()
+        ends = self.get_sorted_index(SortField.DATE).get_range_ends(start_ordinal, end_ordinal)
+        if ends is None:
+            return None
+
+        first_transaction, last_transaction = ends
+        return first_transaction.transaction_date, last_transaction.transaction_date
+
+    def summarize_date_range(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> PartialStatistics:
+        """
+        Agregados das transações entre as datas (inclusive): soma, contagem e maior valor por
+        tipo e categoria, sem histogramas (ver iter_month_summaries).
+        """
+        return merge_all(
+            (partial for _, partial in self.iter_month_summaries(start_date, end_date)),
+            with_histograms=False,
+        )
+
+    def iter_month_summaries(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> Iterator[tuple[int, PartialStatistics]]:
+        """
+        Resumo (sem histogramas) de cada mês com transações entre as datas, inclusive, com o
+        número do mês (ver rollup_cube.get_month_id). Os meses inteiros vêm do cubo e não devem
+        ser alterados; só os meses das pontas que o intervalo cobre em parte são agregados a
+        partir das transações.
+        """
+        start_date = start_date or date.min
+        end_date = end_date or date.max
+        if start_date > end_date:
+            return
+
+        starts_on_month = start_date.day == 1
+        ends_on_month = end_date == date.max or (end_date + timedelta(days=1)).day == 1
+        first_month_id = rollup_cube.get_month_id(start_date) + (0 if starts_on_month else 1)
+        last_month_id = rollup_cube.get_month_id(end_date) - (0 if ends_on_month else 1)
+        if first_month_id > last_month_id:
+            # Nenhum mês inteiro no intervalo
+            yield from self._summarize_months(start_date, end_date)
+            return
+
+        if not starts_on_month:
+            first_month_start = rollup_cube.get_month_start(first_month_id)
+            yield from self._summarize_months(start_date, first_month_start - timedelta(days=1))
+        yield from self.get_rollup_cube().iter_months(first_month_id, last_month_id)
+        if not ends_on_month:
+            yield from self._summarize_months(end_date.replace(day=1), end_date)
+
+    def get_balance_index(self) -> BalanceIndex:
+        """Construído na primeira consulta de saldo e mantido atualizado a cada alteração da lista."""
+        if self._balance_index is None:
+            self._balance_index = BalanceIndex(self._transaction_list)
+            if not self.is_read_only:
+                self._indexes.append(self._balance_index)
+
+        return self._balance_index
+
+    def get_balance(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> float:
+        """Saldo (receitas menos despesas) das transações entre as datas, inclusive, em O(log n)."""
+        return self.get_balance_index().get_balance(
+            start_date or date.min, end_date or date.max
+        )
+
+    def get_order_statistics(self) -> OrderStatisticsIndex:
+        """
+        Valores ordenados por tipo, para medianas e percentis de todas as transações; mantido
+        a cada alteração da lista.
+        """
+        if self._order_statistics_index is None:
+            self._order_statistics_index = OrderStatisticsIndex(self._transaction_list)
+            if not self.is_read_only:
+                self._indexes.append(self._order_statistics_index)
+
+        return self._order_statistics_index
+
+    def get_heavy_hitters(self) -> DescriptionHeavyHitters:
+        """
+        Descrições de despesa com mais gastos e mais transações, em memória limitada; construído
+        na primeira consulta e mantido a cada alteração da lista.
+        """
+        if self._heavy_hitters is None:
+            self._heavy_hitters = DescriptionHeavyHitters(self._transaction_list)
+            if not self.is_read_only:
+                self._indexes.append(self._heavy_hitters)
+
+        return self._heavy_hitters
+
+    def get_rolling_windows(self) -> RollingWindows:
+        """
+        Somas móveis de 7, 30 e 90 dias de todas as transações; estendidas a cada inclusão em
+        ordem de data e refeitas na consulta seguinte a uma alteração fora de ordem.
+        """
+        if self._rolling_windows is None:
+            self._rolling_windows = RollingWindows(self._transaction_list)
+            if not self.is_read_only:
+                self._indexes.append(self._rolling_windows)
+        elif self._rolling_windows.is_stale:
+            self._rolling_windows.rebuild(self._transaction_list)
+
+        return self._rolling_windows
+
+    def get_unusual_expense_detector(self) -> UnusualExpenseDetector:
+        """
+        Padrão de valores de cada categoria de despesa; a partir da construção, cada despesa
+        incluída é avaliada em relação a ele no momento da inclusão.
+        """
+        if self._unusual_expense_detector is None:
+            self._unusual_expense_detector = UnusualExpenseDetector(self._transaction_list)
+            if not self.is_read_only:
+                self._indexes.append(self._unusual_expense_detector)
+
+        return self._unusual_expense_detector
+
+    def get_running_balances(
+        self, transaction_list: Iterable[Transaction]
+    ) -> list[float | None]:
+        """Saldo acumulado (em ordem de data) logo após cada transação recebida."""
+        if self._running_balance_index is None:
+            self._running_balance_index = RunningBalanceIndex(self._transaction_list)
+            if not self.is_read_only:
+                self._indexes.append(self._running_balance_index)
+
+        return self._running_balance_index.get_balances(transaction_list)
+
+    def query(
+        self,
+        criteria: QueryCriteria,
+        sort: QuerySort,
+        limit: int,
+        after_key: str | None = None,
+    ) -> QueryPage:
+        """
+        Retorna até limit transações que atendem aos critérios, na ordem pedida, começando depois
+        de after_key (token devolvido pela página anterior). Percorre o índice ordenado só até
+        completar a página, sem montar o resultado inteiro.
+        """
+        if limit <= 0:
+            raise ValueError("O tamanho da página deve ser maior que zero!")
+
+        start_key = None if after_key is None else decode_key(sort, after_key)
+        matching_ids = (
+            None
+            if criteria.description is None
+            else self.search_descriptions(criteria.description)
+        )
+        if matching_ids is not None and not matching_ids:
+            return QueryPage([])
+
+        search_matches = (
+            None if criteria.search is None else self._match_search_terms(criteria.search)
+        )
+        if search_matches is not None and not all(
+            matching_ids or categories for matching_ids, categories in search_matches
+        ):
+            return QueryPage([])
+
+        sorted_index = self.get_sorted_index(sort.field)
+        page: list[Transaction] = []
+        last_key = None
+        for key in sorted_index.iter_keys_after(start_key, sort.reverse):
+            if matching_ids is not None and key[1] not in matching_ids:
+                continue
+
+            transaction = sorted_index.get_transaction(key[1])
+            if not criteria.matches(transaction):
+                continue
+
+            if search_matches is not None and not all(
+                transaction.id in matching_ids or transaction.category in categories
+                for matching_ids, categories in search_matches
+            ):
+                continue
+
+            if len(page) == limit:
+                # Há ao menos mais uma transação: a próxima página começa depois da última desta
+                return QueryPage(page, encode_key(sort, last_key))
+
+            page.append(transaction)
+            last_key = key
+
+        return QueryPage(page)
+
+    # Métodos de exportação ------------------------------------------------------------
+    def export_archive(self, archive_path: Path) -> None:
+        """Grava as transações atuais em um arquivo colunar para consulta em modo somente leitura."""
+        snapshot.write_archive(archive_path, list(self._transaction_list))
+
+    def close(self) -> None:
+        """
+        Grava o snapshot e o cubo adiados pelas inclusões no formato JSONL e aguarda as
+        gravações em segundo plano, para que nenhuma fique pela metade ao encerrar o programa.
+        """
+        self._repository.close(self._transaction_list, self._rollup_cube)
+
+    # Métodos auxiliares ---------------------------------------------------------------
+    def _save(self) -> None:
+        self._repository.save(self._transaction_list)
+        self._refresh_rollup_cube()
+
+    def _match_search_terms(
+        self, search: str
+    ) -> list[tuple[set[int], set[IncomeCategory | ExpenseCategory]]]:
+        """
+        Para cada termo da busca, os IDs cujas descrições o contêm (índice de descrições) e as
+        categorias cujo nome o contém; as categorias são poucas, então são comparadas direto.
+        """
+        search_matches = []
+        for term in normalize_description(search).split():
+            categories = {
+                category
+                for category in (*IncomeCategory, *ExpenseCategory)
+                if term in normalize_description(category.value)
+            }
+            search_matches.append((self.search_descriptions(term), categories))
+
+        return search_matches
+
+    def _refresh_rollup_cube(self) -> None:
+        # O arquivo do cubo é identificado pelo arquivo de dados, então é regravado a cada gravação
+        if self._rollup_cube is not None:
+            self._repository.refresh_rollup_cube(self._rollup_cube)
+
+    def _summarize_months(
+        self, start_date: date, end_date: date
+    ) -> Iterator[tuple[int, PartialStatistics]]:
+        summaries: dict[int, PartialStatistics] = {}
+        for transaction in self.iter_transactions_by_date_range(start_date, end_date):
+            month_id = rollup_cube.get_month_id(transaction.transaction_date)
+            summary = summaries.get(month_id)
+            if summary is None:
+                summary = summaries[month_id] = PartialStatistics(with_histograms=False)
+            summary.add(transaction)
+
+        yield from summaries.items()
+
+    def _notify_added(self, transaction_list: list[Transaction]) -> None:
+        for index in self._indexes:
+            for transaction in transaction_list:
+                index.add(transaction)
+
+    def _notify_removed(self, transaction_list: list[Transaction]) -> None:
+        for index in self._indexes:
+            for transaction in transaction_list:
+                index.remove(transaction)
+
+    def _ensure_writable(self) -> None:
+        if self.is_read_only:
+            raise ReadOnlyArchiveError(
+                "Arquivo aberto em modo somente leitura: não é possível alterar transações!"
+            )
+
+    def _ensure_rewritable(self) -> None:
+        # Operações que regravam o arquivo inteiro apagariam as linhas ignoradas na carga
+        self._ensure_writable()
+        ignored_count = len(self.ignored_line_offsets)
+        if ignored_count:
+            raise IgnoredLinesError(
+                f"O arquivo de dados tem {ignored_count} linha(s) ignorada(s) na carga, que seriam "
+                "apagadas ao regravá-lo. Descarte-as (uma cópia do arquivo é mantida) antes de "
+                "excluir ou editar transações."
+            )
+
 
 class TransactionRepository:
-    def __init__(self):
-        self._file_name: str = "transactions.json"
+    """
+    Persiste as transações em disco, no formato JSON (padrão) ou JSON Lines.
+
+    No formato JSONL cada transação ocupa uma linha compacta: novas transações são
+    adicionadas ao final do arquivo sem reescrevê-lo, e uma linha corrompida é
+    descartada sem invalidar as demais (ver corrupted_offsets). Enquanto houver linhas
+    descartadas, o snapshot não é gravado, para que elas voltem a ser reportadas na
+    próxima carga (ver discard_ignored_lines).
+
+    Ao lado do arquivo é mantido um snapshot binário (ver src.models.snapshot). Se ele
+    estiver válido, a carga o utiliza em vez de interpretar o arquivo; se estiver
+    desatualizado, é reconstruído em segundo plano após a carga e após cada reescrita.
+    As inclusões ao final do arquivo (append) não o reconstroem: ele é gravado uma única
+    vez em close, ou na próxima carga se o programa não tiver sido encerrado normalmente.
+    Todas as gravações em segundo plano passam por um único BackgroundWriter.
+    """
+
+    def __init__(
+        self, storage_format: StorageFormat = StorageFormat.JSON, load_workers: int = 1
+    ):
+        self._storage_format: StorageFormat = storage_format
+        self._load_workers: int = load_workers
+        self._file_name: str = f"transactions.{storage_format.value}"
         self._file_path: Path = self._get_data_path() / self._file_name
+        self._corrupted_offsets: list[int] = []
+        self._serialization_cache = serializer.SerializationCache(storage_format)
+        self._background_writer = snapshot.BackgroundWriter()
+        self._has_stale_caches: bool = False
+
+    @property
+    def is_read_only(self) -> bool:
+        return False
+
+    @property
+    def storage_format(self) -> StorageFormat:
+        return self._storage_format
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    @property
+    def supports_append(self) -> bool:
+        """Indica se é possível gravar uma nova transação sem reescrever o arquivo."""
+        return self._storage_format == StorageFormat.JSONL
+
+    @property
+    def corrupted_offsets(self) -> list[int]:
+        """Deslocamentos (em bytes) das linhas JSONL ignoradas na última leitura (corrompidas ou inválidas)."""
+        return self._corrupted_offsets.copy()
+
+    def discard_ignored_lines(self) -> Path:
+        """Copia o arquivo atual, com as linhas ignoradas, e deixa de protegê-las. Retorna o caminho da cópia."""
+        backup_path = self._file_path.with_name(f"{self._file_name}.bak")
+        shutil.copy2(self._file_path, backup_path)
+        self._corrupted_offsets = []
+        return backup_path
 
     def _get_data_path(self) -> Path:
         current_file_path = Path(__file__)
@@ -98,21 +671,117 @@ class TransactionRepository:
         return data_file_path
 
     def save(self, transaction_list: list[Transaction]) -> None:
-        transaction_json = serializer.to_JSON(transaction_list)
+        """Reescreve o arquivo, recodificando apenas as transações novas ou alteradas."""
+        encoded_list = self._serialization_cache.encode_all(transaction_list)
+        with open(self._file_path, "wb") as file:
+            file.write(self._serialization_cache.join(encoded_list))
 
-        with open(self._file_path, "w", encoding="utf-8") as file:
-            json.dump(transaction_json, file, indent=4, ensure_ascii=False)
+        self.refresh_snapshot(transaction_list)
+        self._has_stale_caches = False
+
+    def append(self, transaction_list: list[Transaction]) -> None:
+        """Grava as transações ao final do arquivo, em uma única escrita. Disponível apenas no formato JSONL."""
+        if not self.supports_append:
+            raise ValueError(
+                f"O formato {self._storage_format.value} não permite adicionar sem reescrever o arquivo!"
+            )
+
+        encoded_lines = b"".join(
+            self._serialization_cache.encode(transaction) for transaction in transaction_list
+        )
+        jsonl_storage.append_lines(self._file_path, encoded_lines)
+        self._has_stale_caches = True
+
+    def close(self, transaction_list: list[Transaction], cube: RollupCube | None) -> None:
+        """Grava os caches desatualizados pelas inclusões e aguarda todas as gravações em segundo plano."""
+        if self._has_stale_caches:
+            self.refresh_snapshot(transaction_list)
+            if cube is not None:
+                self.refresh_rollup_cube(cube)
+            self._has_stale_caches = False
+
+        self._background_writer.wait()
 
     def get_all_transactions(self) -> list[Transaction]:
-        file_content = self._load()
-        if file_content is None:
-            return []
+        # Gravações interrompidas (ex: programa encerrado sem close) deixam arquivos temporários
+        snapshot.remove_temporary_files(snapshot.get_snapshot_path(self._file_path))
+        snapshot.remove_temporary_files(rollup_cube.get_rollup_path(self._file_path))
+        if snapshot.is_valid(self._file_path):
+            try:
+                return snapshot.load(self._file_path)
+            except (OSError, ValueError):
+                pass  # Snapshot ilegível: segue para a leitura do arquivo original
+
+        if self._storage_format == StorageFormat.JSONL:
+            if not self._file_path.exists():
+                return []
+
+            transaction_list, self._corrupted_offsets = (
+                parallel_loader.load_jsonl_parallel(self._file_path, self._load_workers)
+            )
+        else:
+            file_content = self._load()
+            if file_content is None:
+                return []
+
+            transaction_list = parallel_loader.load_records_parallel(
+                file_content, self._load_workers
+            )
+
+        self.refresh_snapshot(transaction_list)
+        return transaction_list
+
+    def refresh_snapshot(self, transaction_list: list[Transaction]) -> None:
+        """Agenda a reconstrução do snapshot binário em segundo plano."""
+        if self._file_path.exists() and not self._corrupted_offsets:
+            snapshot.write_in_background(self._file_path, transaction_list, self._background_writer)
+
+    def load_rollup_cube(self, transaction_list: list[Transaction]) -> RollupCube | None:
+        """Cubo de agregados gravado ao lado do arquivo, se corresponder ao conteúdo atual dele."""
+        if not self._file_path.exists():
+            return None
+
+        return rollup_cube.load(self._file_path, transaction_list)
+
+    def refresh_rollup_cube(self, cube: RollupCube) -> None:
+        """Agenda a gravação do cubo de agregados em segundo plano."""
+        if self._file_path.exists():
+            rollup_cube.write_in_background(self._file_path, cube, self._background_writer)
+
+    def convert_to(self, target_format: StorageFormat) -> "TransactionRepository":
+        """
+        Copia os registros atuais para um arquivo no formato indicado e retorna o repositório
+        correspondente. O arquivo de origem é mantido intacto, e um arquivo de destino já
+        existente nunca é sobrescrito.
+        """
+        if target_format == self._storage_format:
+            raise ValueError(f"Os dados já estão no formato {target_format.value}!")
+
+        target_repository = TransactionRepository(target_format)
+        if target_repository.file_path.exists():
+            raise ValueError(
+                f"{target_repository.file_path} já existe: remova-o antes de migrar os dados."
+            )
 
-        parsed_transaction_dict_list = parser.parse_from_json(file_content)
-        return Transaction.from_json(parsed_transaction_dict_list)
+        file_content = self._load() or []
+        target_repository._write(file_content)
+        return target_repository
+
+    def _write(self, transaction_json: list[SerializedTransaction]) -> None:
+        if self._storage_format == StorageFormat.JSONL:
+            jsonl_storage.write_lines(self._file_path, transaction_json)
+            return
+
+        with open(self._file_path, "w", encoding="utf-8") as file:
+            json.dump(transaction_json, file, indent=4, ensure_ascii=False)
 
     def _load(self) -> list[SerializedTransaction] | None:
         if self._file_path.exists():
+            if self._storage_format == StorageFormat.JSONL:
+                chunk = jsonl_storage.read_lines(self._file_path)
+                self._corrupted_offsets = chunk.corrupted_offsets
+                return chunk.records
+
             try:
                 with open(self._file_path, "r", encoding="utf-8") as file:
                     return json.load(file)
@@ -120,3 +789,35 @@ class TransactionRepository:
                 return None
 
         return None
+
+
+class ArchiveRepository:
+    """
+    Repositório somente leitura sobre um arquivo colunar gerado por
+    TransactionManager.export_archive. O arquivo é mapeado em memória e nenhuma
+    transação é construída até ser acessada.
+    """
+
+    def __init__(self, archive_path: Path):
+        self._file_path: Path = archive_path
+
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    @property
+    def corrupted_offsets(self) -> list[int]:
+        return []
+
+    def discard_ignored_lines(self) -> Path:
+        raise ReadOnlyArchiveError("Arquivo aberto em modo somente leitura!")
+
+    def close(self, _transaction_list: ArchiveTransactionList, _cube: RollupCube | None) -> None:
+        pass
+
+    def get_all_transactions(self) -> ArchiveTransactionList:
+        return ArchiveTransactionList.open(self._file_path)
@@ -0,0 +1,129 @@
+"""
+Protocolo comum às listas de transações consultadas pelas operações e pelos índices.
+
+ArchiveTransactionList já implementa esses métodos sobre as colunas do arquivo; as listas comuns (e qualquer
+iterável de transações) são adaptadas por ListTransactionView. Quem consulta a lista chama as_view uma vez e usa
+os métodos do protocolo, sem testar o tipo da lista.
+"""
+import heapq
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from typing import Protocol, runtime_checkable
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory
+from src.models.archive_view import ArchiveRow
+
+
+@runtime_checkable
+class TransactionView(Protocol):
+    def filter_by_amount_range(self, start_amount: int | float, end_amount: int | float) -> Sequence[Transaction]: ...
+
+    def filter_by_type(self, transaction_type: TransactionType) -> Sequence[Transaction]: ...
+
+    def filter_by_date_range(self, start_date: date, end_date: date) -> Sequence[Transaction]: ...
+
+    def filter_by_category(self, category: IncomeCategory | ExpenseCategory) -> Sequence[Transaction]: ...
+
+    def filter_by_ids(self, transaction_ids: set[int]) -> Sequence[Transaction]: ...
+
+    def sort_by_amount(self, reverse: bool) -> Sequence[Transaction]: ...
+
+    def sort_by_date(self, reverse: bool) -> Sequence[Transaction]: ...
+
+    def sort_by_id(self, reverse: bool) -> Sequence[Transaction]: ...
+
+    def get_min_date(self) -> date: ...
+
+    def get_max_date(self) -> date: ...
+
+    def get_min_amount(self) -> int | float: ...
+
+    def get_max_amount(self) -> int | float: ...
+
+    def top_k(self, k: int, transaction_type: TransactionType | None = None) -> list[Transaction]: ...
+
+    def bottom_k(self, k: int, transaction_type: TransactionType | None = None) -> list[Transaction]: ...
+
+    def iter_rows(self) -> Iterator[Transaction | ArchiveRow]:
+        """Linhas com id, valor, tipo, data e categoria, para quem não precisa da descrição."""
+        ...
+
+
+class ListTransactionView:
+    """TransactionView sobre uma lista comum (ou qualquer iterável) de transações."""
+
+    def __init__(self, transaction_list: Iterable[Transaction]) -> None:
+        self._transaction_list: Iterable[Transaction] = transaction_list
+
+    # Filtros ----------------------------------------------------------------------------------------------------
+    def filter_by_amount_range(self, start_amount: int | float, end_amount: int | float) -> list[Transaction]:
+        return [
+            transaction for transaction in self._transaction_list
+            if start_amount <= transaction.amount <= end_amount
+        ]
+
+    def filter_by_type(self, transaction_type: TransactionType) -> list[Transaction]:
+        return [
+            transaction for transaction in self._transaction_list if transaction.transaction_type == transaction_type
+        ]
+
+    def filter_by_date_range(self, start_date: date, end_date: date) -> list[Transaction]:
+        return [
+            transaction for transaction in self._transaction_list
+            if start_date <= transaction.transaction_date <= end_date
+        ]
+
+    def filter_by_category(self, category: IncomeCategory | ExpenseCategory) -> list[Transaction]:
+        return [transaction for transaction in self._transaction_list if transaction.category == category]
+
+    def filter_by_ids(self, transaction_ids: set[int]) -> list[Transaction]:
+        return [transaction for transaction in self._transaction_list if transaction.id in transaction_ids]
+
+    # Ordenações e extremos --------------------------------------------------------------------------------------
+    def sort_by_amount(self, reverse: bool) -> list[Transaction]:
+        return sorted(self._transaction_list, key=lambda transaction: transaction.amount, reverse=reverse)
+
+    def sort_by_date(self, reverse: bool) -> list[Transaction]:
+        return sorted(self._transaction_list, key=lambda transaction: transaction.transaction_date, reverse=reverse)
+
+    def sort_by_id(self, reverse: bool) -> list[Transaction]:
+        return sorted(self._transaction_list, key=lambda transaction: transaction.id, reverse=reverse)
+
+    def get_min_date(self) -> date:
+        return min(transaction.transaction_date for transaction in self._transaction_list)
+
+    def get_max_date(self) -> date:
+        return max(transaction.transaction_date for transaction in self._transaction_list)
+
+    def get_min_amount(self) -> int | float:
+        return min(transaction.amount for transaction in self._transaction_list)
+
+    def get_max_amount(self) -> int | float:
+        return max(transaction.amount for transaction in self._transaction_list)
+
+    def top_k(self, k: int, transaction_type: TransactionType | None = None) -> list[Transaction]:
+        return heapq.nlargest(k, self._iter_by_type(transaction_type), key=lambda transaction: transaction.amount)
+
+    def bottom_k(self, k: int, transaction_type: TransactionType | None = None) -> list[Transaction]:
+        return heapq.nsmallest(k, self._iter_by_type(transaction_type), key=lambda transaction: transaction.amount)
+
+    def iter_rows(self) -> Iterator[Transaction]:
+        return iter(self._transaction_list)
+
+    # Métodos auxiliares -----------------------------------------------------------------------------------------
+    def _iter_by_type(self, transaction_type: TransactionType | None) -> Iterator[Transaction]:
+        if transaction_type is None:
+            return iter(self._transaction_list)
+
+        return (
+            transaction for transaction in self._transaction_list if transaction.transaction_type == transaction_type
+        )
+
+
+def as_view(transaction_list: Iterable[Transaction]) -> TransactionView:
+    """Devolve a própria lista se ela já implementa o protocolo (ex: ArchiveTransactionList) ou a adapta."""
+    if isinstance(transaction_list, TransactionView):
+        return transaction_list
+
+    return ListTransactionView(transaction_list)
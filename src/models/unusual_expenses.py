@@ -0,0 +1,154 @@
+"""
+Despesas fora do padrão da sua categoria, detectadas em fluxo, no momento da inclusão.
+
+Cada ExpenseCategory guarda a média e a variância móveis exponenciais (EWMA) do logaritmo dos valores. Incluir uma
+despesa compara o valor com a média da categoria e atualiza as duas em O(1), sem reler despesas anteriores; o peso
+das antigas decai aos poucos, e o padrão acompanha mudanças reais de gasto. No início, enquanto a categoria tem
+poucas despesas, o peso de cada uma é 1 / n (média e variância comuns), para que as primeiras não dominem.
+
+Cada despesa entra no padrão uma única vez. Editar uma transação (o TransactionManager a remove e a inclui de novo)
+não a soma outra vez: com a mesma categoria o alerta anterior volta; com outra, ela é comparada ao padrão da nova
+categoria, sem entrar nele.
+
+O logaritmo acomoda a assimetria dos gastos (muitos pequenos, poucos grandes): uma despesa três vezes a típica
+se afasta igualmente da média em qualquer categoria. Só despesas acima do padrão são marcadas, e apenas depois de
+min_count despesas na categoria.
+"""
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, ExpenseCategory
+from src.models.transaction_view import as_view
+
+
+DEFAULT_ALPHA = 0.05
+DEFAULT_THRESHOLD = 3.0
+DEFAULT_MIN_COUNT = 10
+# Desvio-padrão mínimo (no logaritmo): com valores quase iguais, só despesas cerca de 35% acima da típica (3 desvios)
+# são marcadas, e não qualquer centavo a mais
+MIN_DEVIATION = 0.1
+
+
+@dataclass
+class CategoryBaseline:
+    """Média e variância móveis exponenciais do logaritmo dos valores de uma categoria."""
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+
+    def update(self, value: float, alpha: float) -> None:
+        self.count += 1
+        weight = max(alpha, 1 / self.count)
+        difference = value - self.mean
+        self.mean += weight * difference
+        self.variance = (1 - weight) * (self.variance + weight * difference * difference)
+
+    def get_score(self, value: float) -> float:
+        """Número de desvios-padrão do valor acima da média."""
+        return (value - self.mean) / max(math.sqrt(self.variance), MIN_DEVIATION)
+
+
+@dataclass
+class UnusualExpense:
+    transaction: Transaction
+    # Valor típico da categoria no momento da inclusão (média geométrica móvel)
+    typical_amount: float
+    score: float
+
+
+class UnusualExpenseDetector:
+    """Índice mantido pelo TransactionManager (add/remove a cada alteração da lista)."""
+    def __init__(
+            self,
+            transaction_list: Iterable[Transaction] = (),
+            alpha: float = DEFAULT_ALPHA,
+            threshold: float = DEFAULT_THRESHOLD,
+            min_count: int = DEFAULT_MIN_COUNT
+            ) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError('O fator de suavização deve estar entre 0 e 1!')
+
+        self._alpha = alpha
+        self._threshold = threshold
+        self._min_count = min_count
+        self._baselines: dict[ExpenseCategory, CategoryBaseline] = {}
+        self._unusual_expenses: dict[int, UnusualExpense] = {}
+        # Despesas já somadas ao padrão: categoria em que entraram e o alerta gerado (se houve). Excluir uma
+        # despesa não a tira daqui, assim como não a tira do padrão
+        self._scored: dict[int, tuple[ExpenseCategory, UnusualExpense | None]] = {}
+        # A lista existente é avaliada como se as despesas tivessem sido incluídas em ordem de data
+        for transaction in sorted(transaction_list, key=lambda transaction: transaction.transaction_date):
+            self.add(transaction)
+
+    # Manutenção do índice ---------------------------------------------------------------------------------------------
+    def add(self, transaction: Transaction) -> None:
+        if transaction.transaction_type != TransactionType.EXPENSE:
+            return
+
+        scored = self._scored.get(transaction.id)
+        if scored is not None:
+            self._readd(transaction, *scored)
+            return
+
+        baseline = self._baselines.get(transaction.category)
+        if baseline is None:
+            baseline = self._baselines[transaction.category] = CategoryBaseline()
+
+        unusual_expense = self._score(transaction, baseline)
+        self._scored[transaction.id] = (transaction.category, unusual_expense)
+        baseline.update(math.log(transaction.amount), self._alpha)
+
+    def remove(self, transaction: Transaction) -> None:
+        # O padrão da categoria não é desfeito (exigiria reler as despesas); só o alerta sai
+        self._unusual_expenses.pop(transaction.id, None)
+
+    # Consultas ------------------------------------------------------------------------------------------------------
+    def get(self, transaction_id: int) -> UnusualExpense | None:
+        return self._unusual_expenses.get(transaction_id)
+
+    def get_unusual_expenses(self, transaction_list: Iterable[Transaction] | None = None) -> list[UnusualExpense]:
+        """Despesas marcadas (só as da lista, se informada), das mais acima do padrão para as menos."""
+        if transaction_list is None:
+            unusual_expenses = list(self._unusual_expenses.values())
+        else:
+            transaction_list = as_view(transaction_list).iter_rows()
+
+            unusual_expenses = [
+                self._unusual_expenses[transaction.id]
+                for transaction in transaction_list
+                if transaction.id in self._unusual_expenses
+            ]
+
+        return sorted(unusual_expenses, key=lambda unusual_expense: unusual_expense.score, reverse=True)
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _score(self, transaction: Transaction, baseline: CategoryBaseline) -> UnusualExpense | None:
+        """Marca a despesa se estiver acima do padrão da categoria (sem atualizar o padrão)."""
+        if baseline.count < self._min_count:
+            return None
+
+        score = baseline.get_score(math.log(transaction.amount))
+        if score <= self._threshold:
+            return None
+
+        unusual_expense = UnusualExpense(transaction, math.exp(baseline.mean), score)
+        self._unusual_expenses[transaction.id] = unusual_expense
+        return unusual_expense
+
+    def _readd(
+            self,
+            transaction: Transaction,
+            category: ExpenseCategory,
+            unusual_expense: UnusualExpense | None
+            ) -> None:
+        """Inclusão de uma despesa já somada ao padrão (edição): o alerta volta ou é refeito na nova categoria."""
+        if transaction.category == category:
+            if unusual_expense is not None:
+                self._unusual_expenses[transaction.id] = unusual_expense
+            return
+
+        baseline = self._baselines.get(transaction.category)
+        unusual_expense = self._score(transaction, baseline) if baseline is not None else None
+        self._scored[transaction.id] = (transaction.category, unusual_expense)
@@ -0,0 +1,24 @@
+"""
+Parâmetros comuns às tarefas divididas entre processos (carga paralela e resumo paralelo das estatísticas).
+
+Cada tarefa é dividida em CHUNKS_PER_WORKER blocos por processo, para que um bloco mais lento não deixe os demais
+processos ociosos no final.
+"""
+import os
+
+
+CHUNKS_PER_WORKER = 4
+MAX_DEFAULT_WORKERS = 8
+
+
+def get_default_workers() -> int:
+    """
+    Processos usados quando a interface não recebe --processos: um por núcleo, até MAX_DEFAULT_WORKERS.
+    Com um único núcleo a carga fica sequencial, já que nele a versão paralela é mais lenta (ver benchmarks).
+    """
+    return max(1, min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS))
+
+
+def get_chunk_size(item_count: int, workers: int) -> int:
+    """Tamanho dos blocos para dividir item_count itens em workers * CHUNKS_PER_WORKER blocos (o último, menor)."""
+    return -(-item_count // (workers * CHUNKS_PER_WORKER))
@@ -0,0 +1,232 @@
+"""
+Importação de extratos bancários em CSV.
+
+O arquivo é lido em fluxo, em lotes de tamanho fixo, e cada lote passa pelas versões em lote dos conversores
+de data_parser. Linhas inválidas viram ImportRowError no relatório em vez de interromper a importação, e a
+memória usada na leitura não depende do tamanho do arquivo.
+
+Com um DedupIndex, cada linha é comparada ao livro em O(1) pela impressão digital normalizada: duplicatas exatas
+são ignoradas e transações apenas parecidas são importadas, mas listadas no relatório para conferência.
+"""
+import csv
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.models.transaction import Transaction, TransactionType
+from src.models.dedup_index import DedupIndex, Fingerprint, make_fingerprint
+import src.models.data_parser as parser
+
+
+MAX_REPORTED_ERRORS = 1000
+
+
+@dataclass
+class CsvColumnMapping:
+    """
+    Nomes das colunas do CSV correspondentes a cada campo da transação.
+
+    transaction_type, category e description podem ser None quando o extrato não tiver essas colunas.
+    Sem a coluna de tipo, o sinal do valor decide: valores negativos são despesas e os demais, receitas.
+    """
+    amount: str = 'valor'
+    transaction_date: str = 'data'
+    transaction_type: str | None = 'tipo'
+    category: str | None = 'categoria'
+    description: str | None = 'descrição'
+    delimiter: str = ';'
+    date_format: str = '%d/%m/%Y'
+    encoding: str = 'utf-8-sig'
+
+
+@dataclass
+class ImportRowError:
+    line_number: int
+    message: str
+
+
+@dataclass
+class DuplicateRow:
+    line_number: int
+    description: str
+    reason: str
+
+
+@dataclass
+class ImportReport:
+    """
+    Resultado de uma importação. Apenas as primeiras MAX_REPORTED_ERRORS linhas de cada lista são guardadas,
+    mas os contadores sempre refletem o total.
+
+    duplicates: linhas ignoradas por já existirem no livro.
+    near_duplicates: linhas importadas que se parecem com alguma transação existente.
+    """
+    imported_count: int = 0
+    error_count: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+    duplicate_count: int = 0
+    duplicates: list[DuplicateRow] = field(default_factory=list)
+    near_duplicate_count: int = 0
+    near_duplicates: list[DuplicateRow] = field(default_factory=list)
+
+    def add_error(self, line_number: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(line_number, message))
+
+    def add_duplicate(self, line_number: int, description: str, reason: str) -> None:
+        self.duplicate_count += 1
+        if len(self.duplicates) < MAX_REPORTED_ERRORS:
+            self.duplicates.append(DuplicateRow(line_number, description, reason))
+
+    def add_near_duplicate(self, line_number: int, description: str, reason: str) -> None:
+        self.near_duplicate_count += 1
+        if len(self.near_duplicates) < MAX_REPORTED_ERRORS:
+            self.near_duplicates.append(DuplicateRow(line_number, description, reason))
+
+
+class CsvImporter:
+    BATCH_SIZE = 5000
+
+    def __init__(self, mapping: CsvColumnMapping | None = None, dedup_index: DedupIndex | None = None) -> None:
+        self._mapping: CsvColumnMapping = mapping or CsvColumnMapping()
+        self._dedup_index: DedupIndex | None = dedup_index
+        # Ocorrências já vistas neste arquivo das impressões digitais presentes no livro. Se o livro tem a mesma
+        # transação N vezes, só as N primeiras ocorrências do arquivo são duplicatas; as seguintes são novas.
+        # Impressões ausentes do livro não são contadas, e o contador não cresce com o tamanho do arquivo.
+        self._seen_fingerprints: Counter[Fingerprint] = Counter()
+
+    def iter_transactions(self, file_path: Path, report: ImportReport) -> Iterator[Transaction]:
+        """Lê o arquivo em lotes e gera as transações válidas, registrando os erros no relatório."""
+        for transaction_list in self.iter_batches(file_path, report):
+            yield from transaction_list
+
+    def iter_batches(self, file_path: Path, report: ImportReport) -> Iterator[list[Transaction]]:
+        """
+        Como iter_transactions, mas gera as transações válidas de cada lote de até BATCH_SIZE linhas. Um arquivo
+        malformado (ex: campo grande demais) levanta ValueError com o número da linha.
+        """
+        for batch in self._iter_batches(file_path):
+            yield self._parse_batch(batch, report)
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _iter_batches(self, file_path: Path) -> Iterator[list[tuple[int, dict[str, str]]]]:
+        mapping = self._mapping
+        with open(file_path, 'r', encoding=mapping.encoding, newline='') as file:
+            reader = csv.DictReader(file, delimiter=mapping.delimiter)
+            try:
+                self._validate_header(reader.fieldnames)
+
+                batch: list[tuple[int, dict[str, str]]] = []
+                for row in reader:
+                    # reader.line_num aponta para a última linha física lida (o cabeçalho é a linha 1)
+                    batch.append((reader.line_num, row))
+                    if len(batch) >= self.BATCH_SIZE:
+                        yield batch
+                        batch = []
+            except csv.Error as e:
+                # O registro que falhou começa logo depois da última linha lida
+                raise ValueError(f'Arquivo CSV malformado na linha {reader.line_num + 1}: {e}') from e
+
+            if batch:
+                yield batch
+
+    def _validate_header(self, fieldnames: list[str] | None) -> None:
+        mapping = self._mapping
+        required_columns = [mapping.amount, mapping.transaction_date]
+        optional_columns = [mapping.transaction_type, mapping.category, mapping.description]
+        expected_columns = required_columns + [column for column in optional_columns if column is not None]
+
+        missing_columns = [column for column in expected_columns if column not in (fieldnames or [])]
+        if missing_columns:
+            raise ValueError(f'Colunas não encontradas no arquivo: {", ".join(missing_columns)}!')
+
+    def _parse_batch(
+            self,
+            batch: list[tuple[int, dict[str, str]]],
+            report: ImportReport
+            ) -> list[Transaction]:
+        mapping = self._mapping
+        rows = [row for _, row in batch]
+
+        amounts, amount_errors = parser.to_valid_amounts([row[mapping.amount] or '' for row in rows])
+        dates, date_errors = parser.to_valid_transaction_dates(
+            [row[mapping.transaction_date] or '' for row in rows], mapping.date_format
+        )
+        if mapping.transaction_type is not None:
+            types, type_errors = parser.to_valid_transaction_types(
+                [row[mapping.transaction_type] or '' for row in rows]
+            )
+        else:
+            types, type_errors = self._infer_types(amounts), {}
+
+        if mapping.category is not None:
+            categories, category_errors = parser.to_valid_categories(
+                [(row[mapping.category] or '').strip() or None for row in rows]
+            )
+        else:
+            categories, category_errors = [None] * len(rows), {}
+
+        transaction_list = []
+        for index, (line_number, row) in enumerate(batch):
+            error = (
+                amount_errors.get(index)
+                or date_errors.get(index)
+                or type_errors.get(index)
+                or category_errors.get(index)
+            )
+            if error is not None:
+                report.add_error(line_number, error)
+                continue
+
+            description = None
+            if mapping.description is not None:
+                description = (row[mapping.description] or '').strip() or None
+                if description is not None and len(description) > 90:
+                    report.add_error(line_number, 'A descrição deve conter no máximo 90 caracteres!')
+                    continue
+
+            amount = abs(amounts[index])
+            if self._dedup_index is not None:
+                fingerprint = make_fingerprint(amount, types[index], dates[index], description)
+                if self._is_duplicate(line_number, fingerprint, description or '-', report):
+                    continue
+
+            try:
+                transaction_list.append(Transaction(
+                    amount, types[index], dates[index], categories[index], description
+                ))
+            except ValueError as e:
+                report.add_error(line_number, str(e))
+
+        return transaction_list
+
+    def _is_duplicate(
+            self,
+            line_number: int,
+            fingerprint: Fingerprint,
+            description: str,
+            report: ImportReport
+            ) -> bool:
+        """Registra a linha como duplicata (retorna True) ou como possível duplicata (retorna False)."""
+        ledger_count = self._dedup_index.count(fingerprint)
+        if ledger_count:
+            self._seen_fingerprints[fingerprint] += 1
+            if self._seen_fingerprints[fingerprint] <= ledger_count:
+                report.add_duplicate(line_number, description, 'Transação já existe no livro')
+                return True
+
+        reason = self._dedup_index.find_near_duplicate(fingerprint)
+        if reason is not None:
+            report.add_near_duplicate(line_number, description, reason)
+
+        return False
+
+    def _infer_types(self, amounts: list[float | None]) -> list[TransactionType | None]:
+        return [
+            None if amount is None
+            else TransactionType.EXPENSE if amount < 0
+            else TransactionType.INCOME
+            for amount in amounts
+        ]
@@ -0,0 +1,148 @@
+"""
+Exportação de listas de transações para CSV, JSON Lines e Markdown.
+
+Cada formato é um gerador que produz uma linha de texto por vez, e export_transactions grava essas linhas
+diretamente no arquivo. Nada é montado inteiro em memória, então exportar um milhão de linhas (inclusive de um
+arquivo aberto em modo somente leitura) usa memória constante.
+"""
+import csv
+import io
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+from src.models.transaction import Transaction
+from src.models.enums import ExportFormat
+from src.models.json_serializer import to_serialized_dict
+from src.models.jsonl_storage import to_jsonl_line
+
+
+CSV_HEADER = ['id', 'data', 'tipo', 'categoria', 'descrição', 'valor']
+MARKDOWN_HEADER = ['ID', 'Data', 'Tipo', 'Categoria', 'Descrição', 'Valor']
+DATE_FORMAT = '%d/%m/%Y'
+PROGRESS_INTERVAL = 1000
+
+
+def iter_csv_lines(transaction_list: Iterable[Transaction], delimiter: str = ';') -> Iterator[str]:
+    """Gera o CSV linha a linha, com as colunas e o formato de valor aceitos por CsvImporter."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator='\n')
+
+    def to_line(row: list[str]) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        return buffer.getvalue()
+
+    yield to_line(CSV_HEADER)
+    for transaction in transaction_list:
+        yield to_line([
+            str(transaction.id),
+            transaction.transaction_date.strftime(DATE_FORMAT),
+            transaction.transaction_type.value,
+            transaction.category.value,
+            transaction.description,
+            _format_amount(transaction.amount),
+        ])
+
+
+def iter_jsonl_lines(transaction_list: Iterable[Transaction]) -> Iterator[str]:
+    """Gera um registro JSON por linha, no mesmo formato do armazenamento JSONL."""
+    for transaction in transaction_list:
+        yield to_jsonl_line(to_serialized_dict(transaction))
+
+
+def iter_markdown_lines(transaction_list: Iterable[Transaction]) -> Iterator[str]:
+    """Gera uma tabela Markdown, com o valor alinhado à direita."""
+    yield '| ' + ' | '.join(MARKDOWN_HEADER) + ' |\n'
+    yield '| ---: | --- | --- | --- | --- | ---: |\n'
+    for transaction in transaction_list:
+        cells = [
+            str(transaction.id),
+            transaction.transaction_date.strftime(DATE_FORMAT),
+            transaction.transaction_type.value.capitalize(),
+            transaction.category.value.capitalize(),
+            _escape_markdown_cell(transaction.description),
+            _format_amount(transaction.amount),
+        ]
+        yield '| ' + ' | '.join(cells) + ' |\n'
+
+
+def iter_lines(transaction_list: Iterable[Transaction], export_format: ExportFormat) -> Iterator[str]:
+    match export_format:
+        case ExportFormat.CSV:
+            return iter_csv_lines(transaction_list)
+
+        case ExportFormat.JSONL:
+            return iter_jsonl_lines(transaction_list)
+
+        case ExportFormat.MARKDOWN:
+            return iter_markdown_lines(transaction_list)
+
+    raise ValueError(f'{export_format} não é um formato de exportação válido!')
+
+
+def export_transactions(
+        transaction_list: Iterable[Transaction],
+        file_path: Path,
+        export_format: ExportFormat,
+        progress_callback: Callable[[int], None] | None = None,
+        should_cancel: Callable[[], bool] | None = None
+        ) -> int:
+    """
+    Grava as transações no arquivo, linha a linha.
+
+    Args:
+    progress_callback: chamado a cada PROGRESS_INTERVAL transações (e ao final) com o total já gravado.
+    should_cancel: consultado junto com o progresso; se retornar True, a exportação é interrompida e o
+    arquivo parcial é removido.
+
+    Returns:
+    Número de transações exportadas.
+    """
+    tracker = _ProgressTracker(progress_callback, should_cancel)
+    with open(file_path, 'w', encoding='utf-8', newline='') as file:
+        file.writelines(iter_lines(tracker.track(transaction_list), export_format))
+
+    if tracker.cancelled:
+        file_path.unlink(missing_ok=True)
+        return 0
+
+    if progress_callback is not None:
+        progress_callback(tracker.count)
+
+    return tracker.count
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _format_amount(amount: float) -> str:
+    return f'{amount:.2f}'.replace('.', ',')
+
+
+def _escape_markdown_cell(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('|', '\\|').replace('\n', ' ')
+
+
+class _ProgressTracker:
+    """Conta as transações à medida que o gerador de linhas as consome, e interrompe a iteração se cancelado."""
+    def __init__(
+            self,
+            progress_callback: Callable[[int], None] | None,
+            should_cancel: Callable[[], bool] | None
+            ) -> None:
+        self._progress_callback = progress_callback
+        self._should_cancel = should_cancel
+        self.count = 0
+        self.cancelled = False
+
+    def track(self, transaction_list: Iterable[Transaction]) -> Iterator[Transaction]:
+        for transaction in transaction_list:
+            yield transaction
+            self.count += 1
+            if self.count % PROGRESS_INTERVAL != 0:
+                continue
+
+            if self._progress_callback is not None:
+                self._progress_callback(self.count)
+            if self._should_cancel is not None and self._should_cancel():
+                self.cancelled = True
+                return
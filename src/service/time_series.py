@@ -0,0 +1,163 @@
+"""
+Agregação de transações em séries temporais (por dia, semana, mês ou ano), opcionalmente divididas por tipo ou
+por categoria.
+
+Uma única passada pela lista acumula a soma e a contagem de cada (período, série). O resultado é compacto: a lista
+dos períodos e, para cada série, um array de somas e um de contagens alinhados a ela, em vez de dicionários
+aninhados. Períodos sem transações entre o primeiro e o último entram com zero, então duas posições vizinhas de
+um array são sempre períodos consecutivos (ex: um mês e o mês anterior).
+"""
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import date
+
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory, TimeBucket, SeriesGroup
+from src.models.transaction_view import as_view
+from src.models.partial_statistics import PartialStatistics
+from src.models.rollup_cube import get_month_id, get_month_start
+
+
+SeriesKey = TransactionType | IncomeCategory | ExpenseCategory | None
+
+
+@dataclass
+class TimeSeries:
+    """
+    Séries alinhadas a periods (data de início de cada período, em ordem crescente).
+
+    As chaves de totals e counts são o tipo (SeriesGroup.TYPE), a categoria (SeriesGroup.CATEGORY) ou None, quando
+    não há divisão; nesse caso a série única soma as receitas e subtrai as despesas (saldo do período).
+    """
+    bucket: TimeBucket
+    periods: list[date] = field(default_factory=list)
+    totals: dict[SeriesKey, array] = field(default_factory=dict)
+    counts: dict[SeriesKey, array] = field(default_factory=dict)
+
+    def get_totals(self, key: SeriesKey) -> array:
+        """Somas da série por período; zeros se a série não teve nenhuma transação."""
+        return self.totals.get(key) or array('d', bytes(8 * len(self.periods)))
+
+    def get_counts(self, key: SeriesKey) -> array:
+        return self.counts.get(key) or array('L', [0] * len(self.periods))
+
+    def get_changes(self, key: SeriesKey) -> list[float | None]:
+        """Variação percentual de cada período em relação ao anterior; None no primeiro e após um período zerado."""
+        totals = self.get_totals(key)
+        changes: list[float | None] = [None]
+        for previous, current in zip(totals, totals[1:]):
+            changes.append((current - previous) / abs(previous) * 100 if previous else None)
+
+        return changes[:len(totals)]
+
+
+def aggregate(
+        transaction_list: Iterable[Transaction],
+        bucket: TimeBucket,
+        group_by: SeriesGroup | None = None
+        ) -> TimeSeries:
+    """Agrupa as transações por período e, se group_by for informado, por tipo ou categoria."""
+    # Em um arquivo, linhas leves lidas das colunas; as descrições não são necessárias aqui
+    transaction_list = as_view(transaction_list).iter_rows()
+
+    get_bucket_id, _ = _BUCKET_FUNCTIONS[bucket]
+    bucket_ids_by_date: dict[date, int] = {}
+    sums: dict[tuple[int, SeriesKey], int | float] = {}
+    counts: dict[tuple[int, SeriesKey], int] = {}
+    for transaction in transaction_list:
+        transaction_date = transaction.transaction_date
+        bucket_id = bucket_ids_by_date.get(transaction_date)
+        if bucket_id is None:
+            bucket_id = bucket_ids_by_date[transaction_date] = get_bucket_id(transaction_date)
+
+        amount = transaction.amount
+        match group_by:
+            case SeriesGroup.TYPE:
+                key = transaction.transaction_type
+            case SeriesGroup.CATEGORY:
+                key = transaction.category
+            case _:
+                key = None
+                if transaction.transaction_type == TransactionType.EXPENSE:
+                    amount = -amount
+
+        cell = (bucket_id, key)
+        sums[cell] = sums.get(cell, 0) + amount
+        counts[cell] = counts.get(cell, 0) + 1
+
+    return _to_time_series(bucket, sums, counts)
+
+
+def aggregate_months(
+        month_summaries: Iterable[tuple[int, PartialStatistics]],
+        group_by: SeriesGroup | None = None
+        ) -> TimeSeries:
+    """
+    Mesmo resultado de aggregate com TimeBucket.MONTH, a partir do resumo de cada mês (ver
+    TransactionManager.iter_month_summaries), sem percorrer as transações.
+    """
+    sums: dict[tuple[int, SeriesKey], int | float] = {}
+    counts: dict[tuple[int, SeriesKey], int] = {}
+    for month_id, summary in month_summaries:
+        for (transaction_type, category), aggregate_cell in summary.cells.items():
+            total = aggregate_cell.total
+            match group_by:
+                case SeriesGroup.TYPE:
+                    key = transaction_type
+                case SeriesGroup.CATEGORY:
+                    key = category
+                case _:
+                    key = None
+                    if transaction_type == TransactionType.EXPENSE:
+                        total = -total
+
+            cell = (month_id, key)
+            sums[cell] = sums.get(cell, 0) + total
+            counts[cell] = counts.get(cell, 0) + aggregate_cell.count
+
+    return _to_time_series(TimeBucket.MONTH, sums, counts)
+
+
+# Funções auxiliares -------------------------------------------------------------------------------------------------
+def _to_time_series(
+        bucket: TimeBucket,
+        sums: dict[tuple[int, SeriesKey], int | float],
+        counts: dict[tuple[int, SeriesKey], int]
+        ) -> TimeSeries:
+    if not sums:
+        return TimeSeries(bucket)
+
+    _, get_period_start = _BUCKET_FUNCTIONS[bucket]
+    first_id = min(bucket_id for bucket_id, _ in sums)
+    last_id = max(bucket_id for bucket_id, _ in sums)
+    period_count = last_id - first_id + 1
+
+    time_series = TimeSeries(bucket, [get_period_start(bucket_id) for bucket_id in range(first_id, last_id + 1)])
+    for (bucket_id, key), total in sums.items():
+        if key not in time_series.totals:
+            time_series.totals[key] = array('d', bytes(8 * period_count))
+            time_series.counts[key] = array('L', [0] * period_count)
+
+        time_series.totals[key][bucket_id - first_id] = total
+        time_series.counts[key][bucket_id - first_id] = counts[(bucket_id, key)]
+
+    return time_series
+
+
+def _get_week_id(transaction_date: date) -> int:
+    # date(1, 1, 1) é uma segunda-feira, então semanas de segunda a domingo são blocos de 7 ordinais
+    return (transaction_date.toordinal() - 1) // 7
+
+
+def _get_week_start(week_id: int) -> date:
+    return date.fromordinal(week_id * 7 + 1)
+
+
+# Para cada período: (data -> número sequencial do período, número do período -> data de início)
+_BUCKET_FUNCTIONS: dict[TimeBucket, tuple[Callable[[date], int], Callable[[int], date]]] = {
+    TimeBucket.DAY: (date.toordinal, date.fromordinal),
+    TimeBucket.WEEK: (_get_week_id, _get_week_start),
+    TimeBucket.MONTH: (get_month_id, get_month_start),
+    TimeBucket.YEAR: (lambda transaction_date: transaction_date.year, lambda year: date(year, 1, 1)),
+}
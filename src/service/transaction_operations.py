@@ -1,6 +1,7 @@
 from datetime import date
 
 from src.models.transaction import Transaction, TransactionType, IncomeCategory, ExpenseCategory
+from src.models.transaction_view import as_view
 
 
 # Métodos de filtragem --------------------------------------------------------------------------------------------
@@ -9,63 +10,70 @@ def filter_by_amount_range(
         start_amount: int | float, 
         end_amount: int | float,
     ) -> list[Transaction]:
-    return [
-        transaction for transaction in transaction_list \
-            if start_amount <= transaction.amount <= end_amount
-    ]
-    
+    return as_view(transaction_list).filter_by_amount_range(start_amount, end_amount)
+
 def filter_by_type(transaction_type: TransactionType, transaction_list: list[Transaction]) -> list[Transaction]:
-    return [
-        transaction for transaction in transaction_list if transaction.transaction_type == transaction_type
-    ]
-    
+    return as_view(transaction_list).filter_by_type(transaction_type)
+
 def filter_by_date_range( 
         transaction_list: list[Transaction],
         start_date: date, 
         end_date: date, 
     ) -> list[Transaction]:
-    return [
-        transaction for transaction in transaction_list \
-            if start_date <= transaction.transaction_date <= end_date]
-    
+    return as_view(transaction_list).filter_by_date_range(start_date, end_date)
+
 def filter_by_category(category: IncomeCategory | ExpenseCategory, transaction_list: list[Transaction]) -> list[Transaction]:
-    return [transaction for transaction in transaction_list if transaction.category == category]
-    
+    return as_view(transaction_list).filter_by_category(category)
+
+def filter_by_ids(transaction_ids: set[int], transaction_list: list[Transaction]) -> list[Transaction]:
+    """Mantém a ordem da lista recebida, para preservar uma ordenação já aplicada."""
+    return as_view(transaction_list).filter_by_ids(transaction_ids)
+
 # Métodos de ordenação --------------------------------------------------------------------------------------------
 def sort_by_amount(
         reverse: bool, 
         transaction_list: list[Transaction]
     ) -> list[Transaction]:
-        
-    return sorted(transaction_list, key=lambda transaction: transaction.amount, reverse=reverse)
-    
+    return as_view(transaction_list).sort_by_amount(reverse)
+
 def sort_by_date( 
         reverse: bool,
         transaction_list: list[Transaction]
     ) -> list[Transaction]:
-        
-    return sorted(transaction_list, key=lambda transaction: transaction.transaction_date, reverse=reverse)
-    
+    return as_view(transaction_list).sort_by_date(reverse)
+
 def sort_by_id( 
                 reverse: bool,
                 transaction_list: list[Transaction]
     ) -> list[Transaction]:
-        
-     return sorted(transaction_list, key=lambda transaction: transaction.id, reverse=reverse)
+    return as_view(transaction_list).sort_by_id(reverse)
+
+# Métodos de seleção dos k maiores e menores valores ------------------------------------------------------------------
+def top_k(
+        k: int,
+        transaction_list: list[Transaction],
+        transaction_type: TransactionType | None = None
+    ) -> list[Transaction]:
+    """As k transações de maior valor, da maior para a menor, sem ordenar a lista inteira (O(n log k))."""
+    return as_view(transaction_list).top_k(k, transaction_type)
+
+def bottom_k(
+        k: int,
+        transaction_list: list[Transaction],
+        transaction_type: TransactionType | None = None
+    ) -> list[Transaction]:
+    """As k transações de menor valor, da menor para a maior."""
+    return as_view(transaction_list).bottom_k(k, transaction_type)
 
 # Métodos para buscar os maiores e menores valores --------------------------------------------------------------------
 def get_min_date(transaction_list: list[Transaction]) -> date:
-    date_list = [transaction.transaction_date for transaction in transaction_list]
-    return min(date_list)
+    return as_view(transaction_list).get_min_date()
 
 def get_max_date(transaction_list: list[Transaction]) -> date:
-    date_list = [transaction.transaction_date for transaction in transaction_list]
-    return max(date_list)
+    return as_view(transaction_list).get_max_date()
 
 def get_min_amount(transaction_list: list[Transaction]) -> int | float:
-    amount_list = [transaction.amount for transaction in transaction_list]
-    return min(amount_list)
+    return as_view(transaction_list).get_min_amount()
 
 def get_max_amount(transaction_list: list[Transaction]) -> int | float:
-    amount_list = [transaction.amount for transaction in transaction_list]
-    return max(amount_list)
\ No newline at end of file
+    return as_view(transaction_list).get_max_amount()
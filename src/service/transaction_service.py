@@ -1,11 +1,28 @@
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date
+from functools import partial
+from pathlib import Path
 
-from src.models.transaction_manager import TransactionManager
+from src.models.transaction_manager import TransactionManager, TransactionRepository
 import src.models.data_parser as parser
 from src.models.transaction import Transaction, TransactionType, IncomeCategory, ExpenseCategory
+from src.models.enums import StorageFormat, ExportFormat, SortField, TimeBucket, SeriesGroup
+from src.models.query import QueryCriteria, QuerySort, QueryPage
+from src.models.order_statistics import OrderStatisticsIndex
+from src.models.reservoir_sample import SampledQuantiles
+from src.models.heavy_hitters import DescriptionHeavyHitters, TopDescriptions, DEFAULT_TOP_COUNT
+from src.models.rolling_window import RollingWindows
+from src.models.unusual_expenses import UnusualExpense
 import src.service.transaction_operations as operations
 from src.service.transaction_statistics import TransactionStatisticsCalculator, TransactionStatistics
 from src.models.typed_dicts import ParsedTransaction
+from src.service.csv_importer import CsvImporter, CsvColumnMapping, ImportReport
+import src.service.exporter as exporter
+import src.service.time_series as time_series
+from src.service.time_series import TimeSeries
+
+
+PAGE_SIZE = 200
 
 
 class TransactionService:
@@ -14,23 +31,60 @@ class TransactionService:
 
     Atributos privados:
     _manager: Instancia um novo TransactionManager para as operações sobre a lista de transações.
+
+    Se archive_path for informado, o serviço abre esse arquivo colunar em modo somente leitura.
+    load_workers > 1 ativa a carga paralela de arquivos grandes e o cálculo das estatísticas em blocos paralelos.
+    approximate_statistics=True estima medianas e percentis por amostragem, em memória constante (ver
+    src.models.reservoir_sample); contagens, somas e percentuais continuam exatos.
     """
-    def __init__(self):
-        self._manager = TransactionManager()
-        self.statistics = TransactionStatisticsCalculator(self._manager.get_all_transactions())
+    def __init__(
+            self,
+            storage_format: StorageFormat = StorageFormat.JSON,
+            archive_path: Path | None = None,
+            load_workers: int = 1,
+            approximate_statistics: bool = False,
+            ):
+        self._manager = TransactionManager(storage_format, archive_path, load_workers)
+        self.statistics = TransactionStatisticsCalculator([], load_workers, approximate_statistics)
+        # Estatísticas de todas as transações, lidas do gerenciador só quando algum campo for acessado
+        self.update_statistics_for_date_range()
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._manager.is_read_only
+
+    @property
+    def is_approximate_statistics(self) -> bool:
+        return self.statistics.is_approximate
+
+    @property
+    def ignored_line_count(self) -> int:
+        """Linhas do arquivo de dados (corrompidas ou inválidas) que ficaram de fora na carga."""
+        return len(self._manager.ignored_line_offsets)
+
+    def discard_ignored_lines(self) -> Path:
+        """Libera exclusões e edições, que apagam do arquivo as linhas ignoradas. Retorna a cópia do original."""
+        return self._manager.discard_ignored_lines()
 
     # Métodos básicos de lista ----------------------------------------------------------------------------------------
-    def add_transaction(self, str_dict: dict[str, str]) -> None:
+    def add_transaction(self, str_dict: dict[str, str]) -> UnusualExpense | None:
+        """Retorna o alerta se a transação for uma despesa muito acima do padrão da sua categoria."""
         parsed_transaction_dict: ParsedTransaction = parser.parse_from_user(str_dict)
 
         transaction = Transaction.from_user_input(parsed_transaction_dict)
+        # Construído antes da inclusão, para que ela seja avaliada
+        unusual_expense_detector = self._manager.get_unusual_expense_detector()
         self._manager.add_transaction(transaction)
+        self.statistics.invalidate()
+
+        return unusual_expense_detector.get(transaction.id)
     
     def get_all_transactions(self) -> list[Transaction]:
         return self._manager.get_all_transactions()
     
     def del_transaction(self, transaction_id: int) -> None:
         self._manager.del_transaction(transaction_id)
+        self.statistics.invalidate()
 
     def get_transaction_by_id(self, transaction_id: int) -> Transaction:
         return self._manager.get_transaction_by_id(transaction_id)
@@ -43,10 +97,84 @@ class TransactionService:
     def update_transaction_category(self, transaction_id: int, new_value: str):
         parsed_new_value: IncomeCategory | ExpenseCategory | None = parser.to_valid_category(new_value)
         self._manager.update_transaction_category(transaction_id, parsed_new_value)
+        self.statistics.invalidate()
 
     def update_transaction_description(self, transaction_id: int, new_value: str):
         self._manager.update_transaction_description(transaction_id, new_value)
 
+    def suggest_descriptions(self, prefix: str, limit: int = 10) -> list[str]:
+        """Sugestões para autocompletar a descrição, das mais usadas para as menos usadas."""
+        return self._manager.suggest_descriptions(prefix, limit)
+
+    def import_csv(
+            self,
+            file_path: Path,
+            mapping: CsvColumnMapping | None = None,
+            skip_duplicates: bool = True,
+            progress_callback: Callable[[int], None] | None = None
+            ) -> ImportReport:
+        """
+        Importa um extrato CSV. As linhas válidas entram no livro em lotes de até CsvImporter.BATCH_SIZE linhas,
+        sem carregar o arquivo inteiro; as inválidas, as duplicatas ignoradas e as possíveis duplicatas são
+        listadas no relatório retornado. progress_callback recebe o número de transações já incluídas a cada lote.
+        """
+        report = ImportReport()
+        dedup_index = self._manager.get_dedup_index() if skip_duplicates else None
+        importer = CsvImporter(mapping, dedup_index)
+        batches = importer.iter_batches(file_path, report)
+        if progress_callback is not None:
+            batches = self._report_batch_progress(batches, progress_callback)
+
+        try:
+            report.imported_count = self._manager.add_transaction_batches(batches)
+        finally:
+            self.statistics.invalidate()
+
+        return report
+
+    @staticmethod
+    def _report_batch_progress(
+            batches: Iterator[list[Transaction]],
+            progress_callback: Callable[[int], None]
+            ) -> Iterator[list[Transaction]]:
+        added_count = 0
+        for batch in batches:
+            yield batch
+            added_count += len(batch)
+            progress_callback(added_count)
+
+    def export_transactions(
+            self,
+            transaction_list: Iterable[Transaction],
+            file_path: Path,
+            export_format: ExportFormat,
+            progress_callback: Callable[[int], None] | None = None,
+            should_cancel: Callable[[], bool] | None = None
+            ) -> int:
+        """
+        Exporta a lista recebida (normalmente já filtrada/ordenada) em fluxo, sem montar o arquivo em memória.
+        Retorna o número de transações exportadas.
+        """
+        return exporter.export_transactions(
+            transaction_list, file_path, export_format, progress_callback, should_cancel
+        )
+
+    def export_archive(self, archive_path: Path) -> None:
+        """Gera um arquivo colunar com as transações atuais, que pode ser aberto depois em modo somente leitura."""
+        self._manager.export_archive(archive_path)
+
+    def close(self) -> None:
+        """Conclui as gravações pendentes em disco. Deve ser chamado ao encerrar o programa."""
+        self._manager.close()
+
+    @staticmethod
+    def migrate_storage(source_format: StorageFormat, target_format: StorageFormat) -> Path:
+        """
+        Copia o arquivo de dados para o formato indicado, sem carregar as transações nem alterar o original.
+        Retorna o caminho do novo arquivo, a ser aberto depois com esse formato.
+        """
+        return TransactionRepository(source_format).convert_to(target_format).file_path
+
     # Métodos de filtragem --------------------------------------------------------------------------------------------
     def filter_by_amount_range(
             self,
@@ -95,6 +223,14 @@ class TransactionService:
             parsed_end_date = parser.to_valid_transaction_date(end_date, DATE_FORMAT)
 
         return operations.filter_by_date_range(transaction_list, parsed_start_date, parsed_end_date) 
+
+    def iter_transactions_by_date_range(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None
+            ) -> Iterable[Transaction]:
+        """Transações entre as datas (inclusive), lidas do índice de datas em ordem de data, sem montar uma lista."""
+        return self._manager.iter_transactions_by_date_range(start_date, end_date)
     
     def filter_by_category(self, category: str, transaction_list: list[Transaction]) -> list[Transaction]:
         
@@ -113,6 +249,78 @@ class TransactionService:
         # Caso normal: filtrar pela categoria específica
         return operations.filter_by_category(parsed_category, transaction_list)
     
+    def filter_by_description(self, query: str, transaction_list: list[Transaction]) -> list[Transaction]:
+        """
+        Busca pelos termos digitados em qualquer posição da descrição, sem diferenciar maiúsculas e acentos.
+        Os IDs vêm do índice de descrições do gerenciador, então a busca não percorre todas as descrições.
+        """
+        if not query or not query.strip():
+            raise ValueError('Digite ao menos um termo para buscar na descrição!')
+
+        matching_ids = self._manager.search_descriptions(query)
+
+        return operations.filter_by_ids(matching_ids, transaction_list)
+
+    # Métodos de consulta paginada -----------------------------------------------------------------------------------
+    def query(
+            self,
+            criteria: QueryCriteria | None = None,
+            sort: QuerySort | None = None,
+            limit: int = PAGE_SIZE,
+            after_key: str | None = None
+            ) -> QueryPage:
+        """
+        Retorna uma página de transações filtradas e ordenadas. Para a página seguinte, chame de novo com
+        after_key=page.next_key; a paginação é por chave, então inserções entre as chamadas não repetem nem
+        pulam linhas. Levanta ValueError se o token não pertencer à mesma ordenação.
+        """
+        return self._manager.query(criteria or QueryCriteria(), sort or QuerySort(), limit, after_key)
+
+    def iter_query(
+            self,
+            criteria: QueryCriteria | None = None,
+            sort: QuerySort | None = None,
+            page_size: int = PAGE_SIZE
+            ) -> Iterator[Transaction]:
+        """Percorre todas as transações da consulta, uma página por vez (ex: para exportar em fluxo)."""
+        after_key = None
+        while True:
+            page = self.query(criteria, sort, page_size, after_key)
+            yield from page.transactions
+            if page.next_key is None:
+                return
+
+            after_key = page.next_key
+
+    def build_query_criteria(
+            self,
+            start_amount: str | None = None,
+            end_amount: str | None = None,
+            start_date: str | None = None,
+            end_date: str | None = None,
+            transaction_type: str | None = None,
+            category: str | None = None,
+            description: str | None = None
+            ) -> QueryCriteria:
+        """Converte os filtros digitados pelo usuário nos critérios de query. Valores vazios não filtram."""
+        DATE_FORMAT = "%d/%m/%Y"
+
+        if description is not None and not description.strip():
+            raise ValueError('Digite ao menos um termo para buscar na descrição!')
+
+        return QueryCriteria(
+            start_amount=parser.to_valid_amount(start_amount) if start_amount else None,
+            end_amount=parser.to_valid_amount(end_amount) if end_amount else None,
+            start_date=parser.to_valid_transaction_date(start_date, DATE_FORMAT) if start_date else None,
+            end_date=parser.to_valid_transaction_date(end_date, DATE_FORMAT) if end_date else None,
+            transaction_type=parser.to_valid_transaction_type(transaction_type) if transaction_type else None,
+            category=parser.to_valid_category(category) if category else None,
+            description=description
+        )
+
+    def build_query_sort(self, sort_field: SortField, order: str) -> QuerySort:
+        return QuerySort(sort_field, parser.to_boolean_sort_order(order))
+
     # Métodos de ordenação --------------------------------------------------------------------------------------------
     def sort_by_amount(
             self, 
@@ -140,19 +348,178 @@ class TransactionService:
 
         return operations.sort_by_id(reverse, transaction_list)
     
+    # Métodos de seleção dos k maiores e menores valores -------------------------------------------------------------
+    def top_k(
+            self,
+            k: int,
+            transaction_list: Iterable[Transaction] | None = None,
+            transaction_type: str | None = None
+            ) -> list[Transaction]:
+        """
+        As k transações de maior valor (opcionalmente de um tipo), da maior para a menor; a lista pode ser qualquer
+        iterável, percorrido uma única vez. Sem lista, considera todas as transações; se o índice de valores já
+        existir, lê apenas o fim dele.
+        """
+        return self._select_extremes(k, transaction_list, transaction_type, largest=True)
+
+    def bottom_k(
+            self,
+            k: int,
+            transaction_list: list[Transaction] | None = None,
+            transaction_type: str | None = None
+            ) -> list[Transaction]:
+        """As k transações de menor valor (opcionalmente de um tipo), da menor para a maior."""
+        return self._select_extremes(k, transaction_list, transaction_type, largest=False)
+
+    def _select_extremes(
+            self,
+            k: int,
+            transaction_list: Iterable[Transaction] | None,
+            transaction_type: str | None,
+            largest: bool
+            ) -> list[Transaction]:
+        if k <= 0:
+            return []
+
+        parsed_type = parser.to_valid_transaction_type(transaction_type) if transaction_type else None
+        if transaction_list is None:
+            if self._manager.has_sorted_index(SortField.AMOUNT):
+                criteria = QueryCriteria(transaction_type=parsed_type)
+                return self._manager.query(criteria, QuerySort(SortField.AMOUNT, largest), k).transactions
+
+            # A própria lista do gerenciador, sem cópia (também mantém o caminho rápido do arquivo colunar)
+            transaction_list = self._manager.iter_transactions_by_date_range()
+
+        if largest:
+            return operations.top_k(k, transaction_list, parsed_type)
+
+        return operations.bottom_k(k, transaction_list, parsed_type)
+
+    def get_top_descriptions(
+            self,
+            count: int = DEFAULT_TOP_COUNT,
+            transaction_list: Iterable[Transaction] | None = None
+            ) -> TopDescriptions:
+        """
+        Descrições de despesa com maior gasto e com mais transações (estimativas com margem de erro). Sem lista,
+        considera todas as transações e lê o índice mantido pelo gerenciador; com lista, resume apenas ela.
+        """
+        if transaction_list is None:
+            return self._manager.get_heavy_hitters().get_top(count)
+
+        return DescriptionHeavyHitters(transaction_list).get_top(count)
+
+    def get_unusual_expense(self, transaction_id: int) -> UnusualExpense | None:
+        return self._manager.get_unusual_expense_detector().get(transaction_id)
+
+    def get_unusual_expenses(self, transaction_list: Iterable[Transaction] | None = None) -> list[UnusualExpense]:
+        """Despesas muito acima do padrão da categoria (só as da lista, se informada), das mais destoantes."""
+        return self._manager.get_unusual_expense_detector().get_unusual_expenses(transaction_list)
+
+    # Métodos de séries temporais -------------------------------------------------------------------------------------
+    def aggregate_time_series(
+            self,
+            transaction_list: Iterable[Transaction],
+            bucket: TimeBucket,
+            group_by: SeriesGroup | None = None
+            ) -> TimeSeries:
+        """Totais e contagens por período (ex: mês a mês), em uma só passada pela lista."""
+        return time_series.aggregate(transaction_list, bucket, group_by)
+
+    def aggregate_time_series_for_date_range(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None,
+            group_by: SeriesGroup | None = None
+            ) -> TimeSeries:
+        """
+        Totais e contagens mês a mês das transações entre as datas, combinados a partir do cubo de agregados: só
+        os meses das pontas que o intervalo cobre em parte são somados a partir das transações.
+        """
+        return time_series.aggregate_months(self._manager.iter_month_summaries(start_date, end_date), group_by)
+
+    def get_rolling_windows(self, transaction_list: Iterable[Transaction] | None = None) -> RollingWindows:
+        """
+        Receitas e despesas das janelas móveis de 7, 30 e 90 dias, dia a dia. Sem lista, considera todas as
+        transações e lê o índice mantido pelo gerenciador; com lista, percorre apenas ela.
+        """
+        if transaction_list is None:
+            return self._manager.get_rolling_windows()
+
+        return RollingWindows(transaction_list)
+
+    # Métodos de saldo ------------------------------------------------------------------------------------------------
+    def get_balance(self, start_date: date | None = None, end_date: date | None = None) -> float:
+        """
+        Saldo das transações entre as datas (inclusive); sem datas, de todas as transações.
+        Lido do índice de saldo por data, sem percorrer a lista.
+        """
+        return self._manager.get_balance(start_date, end_date)
+
+    def get_balance_as_of(self, as_of_date: date) -> float:
+        """Saldo acumulado de todas as transações até as_of_date (inclusive)."""
+        return self._manager.get_balance(end_date=as_of_date)
+
+    def get_running_balances(self, transaction_list: Iterable[Transaction]) -> list[float | None]:
+        """
+        Saldo acumulado logo após cada transação, considerando todas as transações em ordem de data (não só as
+        recebidas). Retorna uma lista alinhada à recebida.
+        """
+        return self._manager.get_running_balances(transaction_list)
+
     # Métodos que retornam estatísticas -------------------------------------------------------------------------------
     def get_statistics(self) -> TransactionStatistics:
         return self.statistics.statistics
     
     # Método para atualizar as estatísticas de acordo com o estado da lista atual sendo exibida -----------------------
-    def update_statistics(self, new_transaction_list: list[Transaction]) -> None:
+    def update_statistics(self, new_transaction_list: Iterable[Transaction]) -> None:
+        """No modo aproximado, aceita qualquer iterável (ex: iter_query), resumido em fluxo em memória constante."""
         self.statistics.update_statistics(new_transaction_list)
 
+    def update_statistics_for_date_range(self, start_date: date | None = None, end_date: date | None = None) -> None:
+        """
+        Equivale a update_statistics(filter_by_date_range(todas as transações, ...)), sem recalcular as estatísticas
+        a partir das linhas: os resumos dos meses inteiros do intervalo vêm do cubo de agregados e são combinados.
+        Sem datas, considera todas as transações, e medianas e percentis vêm dos valores mantidos ordenados pelo
+        gerenciador; com datas, dos valores do intervalo, ordenados só quando lidos. No modo aproximado, eles vêm
+        de uma amostra das transações do intervalo.
+
+        Os campos só são calculados quando lidos (ver TransactionStatistics): quem lê apenas os totais, como o
+        painel, combina só as células do cubo.
+        """
+        if self.statistics.is_approximate:
+            load_order_statistics = partial(self._sample_date_range, start_date, end_date)
+        elif start_date is None and end_date is None:
+            load_order_statistics = self._manager.get_order_statistics
+        else:
+            load_order_statistics = partial(self._sort_date_range, start_date, end_date)
+        # O cubo não guarda histogramas: medianas e percentis vêm sempre de load_order_statistics
+        self.statistics.update_statistics_from_partial(
+            lambda with_histograms: self._manager.summarize_date_range(start_date, end_date),
+            load_order_statistics,
+        )
+
+    def _sort_date_range(self, start_date: date | None, end_date: date | None) -> OrderStatisticsIndex:
+        return OrderStatisticsIndex(self._manager.iter_transactions_by_date_range(start_date, end_date))
+
+    def _sample_date_range(self, start_date: date | None, end_date: date | None) -> SampledQuantiles:
+        return SampledQuantiles.from_transactions(
+            self._manager.iter_transactions_by_date_range(start_date, end_date), self.statistics.sample_size
+        )
+
     # Métodos que retornam a menor e a maior data ---------------------------------------------------------------------
-    def get_min_date(self, transaction_list: list[Transaction]) -> date:
+    def get_date_range_ends(
+            self,
+            start_date: date | None = None,
+            end_date: date | None = None
+            ) -> tuple[date, date] | None:
+        """Menor e maior data das transações entre as datas (inclusive), sem percorrê-las; None se não houver."""
+        return self._manager.get_date_range_ends(start_date, end_date)
+
+    def get_min_date(self, transaction_list: Iterable[Transaction]) -> date:
         return operations.get_min_date(transaction_list)
     
-    def get_max_date(self, transaction_list: list[Transaction]) -> date:
+    def get_max_date(self, transaction_list: Iterable[Transaction]) -> date:
         return operations.get_max_date(transaction_list)
     
     # Métodos que retornam os menores e maiores valores ---------------------------------------------------------------
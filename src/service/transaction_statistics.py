@@ -1,290 +1,289 @@
-from dataclasses import dataclass, field
 from collections import Counter
-import statistics
+from collections.abc import Callable, Iterable
 
 from src.models.transaction import Transaction
 from src.models.enums import TransactionType, IncomeCategory, ExpenseCategory
+from src.models.partial_statistics import PartialStatistics, summarize_parallel
+from src.models.order_statistics import OrderStatisticsIndex
+from src.models.reservoir_sample import SampledQuantiles, summarize_with_sample, DEFAULT_SAMPLE_SIZE
+
+PartialLoader = Callable[[bool], PartialStatistics]
+QuantileLoader = Callable[[], OrderStatisticsIndex | SampledQuantiles]
 
-@dataclass
 class TransactionStatistics:
-       transaction_count: int = 0
-       income_transaction_count: int = 0
-       expense_transaction_count: int = 0
-       total_income: int | float = 0
-       total_expense: int | float = 0
-       balance: int | float = 0
-       highest_income_amount: int | float = 0
-       highest_expense_amount: int | float = 0
-       income_category_with_highest_amount: IncomeCategory | None = None
-       expense_category_with_highest_amount: ExpenseCategory | None = None
-       income_category_with_most_transactions: IncomeCategory | None = None
-       expense_category_with_most_transactions: ExpenseCategory | None = None
-       total_per_income_category: dict[IncomeCategory, int | float] = field(default_factory=dict)
-       total_per_expense_category: dict[ExpenseCategory, int | float] = field(default_factory=dict)
-       percentage_per_income_category: dict[IncomeCategory, float] = field(default_factory=dict)
-       percentage_per_expense_category: dict[ExpenseCategory, float] = field(default_factory=dict)
-       count_per_income_category: dict[IncomeCategory, int] = field(default_factory=dict)
-       count_per_expense_category: dict[ExpenseCategory, int] = field(default_factory=dict)
-       count_percentage_per_income_category: dict[IncomeCategory, float] = field(default_factory=dict)
-       count_percentage_per_expense_category: dict[ExpenseCategory, float] = field(default_factory=dict)
-       average_income: float = 0.0
-       average_expense: float = 0.0
-       median_income: int | float = 0
-       median_expense: int | float = 0
+       """
+       Estatísticas de uma lista de transações, calculadas por grupo de campos no primeiro acesso e guardadas até
+       invalidate(): os totais (contagens, somas, saldo e médias), os detalhes por categoria e as estatísticas de
+       ordem (medianas e percentis).
+
+       load_partial(with_histograms) fornece o resumo das transações; os totais e as categorias pedem só as células,
+       e apenas medianas e percentis pedem os histogramas (ou os leem de load_order_statistics, se informado).
+       Sem load_partial, todas as estatísticas são as de uma lista vazia.
+
+       Se load_order_statistics fornecer uma amostra (SampledQuantiles), medianas e percentis são aproximados:
+       approximate_quantiles indica isso, quantile_rank_error dá o erro máximo de posição (em pontos percentuais,
+       com 95% de confiança) e quantile_bounds, o intervalo de cada estimativa.
+       """
+       # Totais
+       transaction_count: int
+       income_transaction_count: int
+       expense_transaction_count: int
+       total_income: int | float
+       total_expense: int | float
+       balance: int | float
+       average_income: float
+       average_expense: float
+       # Categorias
+       highest_income_amount: int | float
+       highest_expense_amount: int | float
+       income_category_with_highest_amount: IncomeCategory | None
+       expense_category_with_highest_amount: ExpenseCategory | None
+       income_category_with_most_transactions: IncomeCategory | None
+       expense_category_with_most_transactions: ExpenseCategory | None
+       total_per_income_category: dict[IncomeCategory, int | float]
+       total_per_expense_category: dict[ExpenseCategory, int | float]
+       percentage_per_income_category: dict[IncomeCategory, float]
+       percentage_per_expense_category: dict[ExpenseCategory, float]
+       count_per_income_category: dict[IncomeCategory, int]
+       count_per_expense_category: dict[ExpenseCategory, int]
+       count_percentage_per_income_category: dict[IncomeCategory, float]
+       count_percentage_per_expense_category: dict[ExpenseCategory, float]
+       # Estatísticas de ordem
+       median_income: int | float
+       median_expense: int | float
+       percentile_90_expense: int | float
+       percentile_99_expense: int | float
+       approximate_quantiles: bool
+       quantile_sample_size: int
+       quantile_rank_error: float
+       quantile_bounds: dict[str, tuple[int | float, int | float]]
+
+       _TOTAL_FIELDS = (
+              'transaction_count', 'income_transaction_count', 'expense_transaction_count', 'total_income',
+              'total_expense', 'balance', 'average_income', 'average_expense',
+       )
+       _CATEGORY_FIELDS = (
+              'highest_income_amount', 'highest_expense_amount', 'income_category_with_highest_amount',
+              'expense_category_with_highest_amount', 'income_category_with_most_transactions',
+              'expense_category_with_most_transactions', 'total_per_income_category', 'total_per_expense_category',
+              'percentage_per_income_category', 'percentage_per_expense_category', 'count_per_income_category',
+              'count_per_expense_category', 'count_percentage_per_income_category',
+              'count_percentage_per_expense_category',
+       )
+       _ORDER_FIELDS = (
+              'median_income', 'median_expense', 'percentile_90_expense', 'percentile_99_expense',
+              'approximate_quantiles', 'quantile_sample_size', 'quantile_rank_error', 'quantile_bounds',
+       )
+       # Percentil estimado por cada campo de ordem, para os intervalos das estimativas aproximadas
+       _QUANTILE_FIELDS = (
+              ('median_income', TransactionType.INCOME, 50),
+              ('median_expense', TransactionType.EXPENSE, 50),
+              ('percentile_90_expense', TransactionType.EXPENSE, 90),
+              ('percentile_99_expense', TransactionType.EXPENSE, 99),
+       )
+
+       def __init__(
+                     self,
+                     load_partial: PartialLoader | None = None,
+                     load_order_statistics: QuantileLoader | None = None
+                     ) -> None:
+              self._load_partial = load_partial
+              self._load_order_statistics = load_order_statistics
+              self._partial: PartialStatistics | None = None
+
+       def __getattr__(self, name: str):
+              # Chamado só para campos ainda não calculados: calcula o grupo inteiro e os grava no objeto
+              if name in self._TOTAL_FIELDS:
+                     self._calculate_totals()
+              elif name in self._CATEGORY_FIELDS:
+                     self._calculate_categories()
+              elif name in self._ORDER_FIELDS:
+                     self._calculate_order_statistics()
+              else:
+                     raise AttributeError(name)
+
+              return self.__dict__[name]
+
+       def invalidate(self) -> None:
+              """Descarta os campos calculados; o próximo acesso os recalcula a partir das transações atuais."""
+              for name in (*self._TOTAL_FIELDS, *self._CATEGORY_FIELDS, *self._ORDER_FIELDS):
+                     self.__dict__.pop(name, None)
+              self._partial = None
+
+       # Métodos privados ---------------------------------------------------------------------------------------------
+       def _get_partial(self, with_histograms: bool = False) -> PartialStatistics:
+              """O resumo já carregado serve se tiver os histogramas ou se eles não forem necessários."""
+              if self._partial is None or (with_histograms and not self._partial.with_histograms):
+                     if self._load_partial is None:
+                            self._partial = PartialStatistics()
+                     else:
+                            self._partial = self._load_partial(with_histograms)
+
+              return self._partial
+
+       def _get_cells_by_type(self, transaction_type: TransactionType) -> dict:
+              return {
+                     category: cell for (cell_type, category), cell in self._get_partial().cells.items()
+                     if cell_type == transaction_type and cell.count
+              }
+
+       def _calculate_totals(self) -> None:
+              income_cells = self._get_cells_by_type(TransactionType.INCOME).values()
+              expense_cells = self._get_cells_by_type(TransactionType.EXPENSE).values()
+              self.income_transaction_count = sum(cell.count for cell in income_cells)
+              self.expense_transaction_count = sum(cell.count for cell in expense_cells)
+              self.transaction_count = self.income_transaction_count + self.expense_transaction_count
+              self.total_income = sum(cell.total for cell in income_cells)
+              self.total_expense = sum(cell.total for cell in expense_cells)
+              self.balance = self.total_income - self.total_expense
+              self.average_income = (
+                     self.total_income / self.income_transaction_count if self.income_transaction_count else 0.0
+              )
+              self.average_expense = (
+                     self.total_expense / self.expense_transaction_count if self.expense_transaction_count else 0.0
+              )
+
+       def _calculate_categories(self) -> None:
+              income_cells = self._get_cells_by_type(TransactionType.INCOME)
+              expense_cells = self._get_cells_by_type(TransactionType.EXPENSE)
+              self.total_per_income_category = {category: cell.total for category, cell in income_cells.items()}
+              self.total_per_expense_category = {category: cell.total for category, cell in expense_cells.items()}
+              self.count_per_income_category = Counter(
+                     {category: cell.count for category, cell in income_cells.items()}
+              )
+              self.count_per_expense_category = Counter(
+                     {category: cell.count for category, cell in expense_cells.items()}
+              )
+              self.percentage_per_income_category = self._to_percentages(self.total_per_income_category)
+              self.percentage_per_expense_category = self._to_percentages(self.total_per_expense_category)
+              self.count_percentage_per_income_category = self._to_percentages(self.count_per_income_category)
+              self.count_percentage_per_expense_category = self._to_percentages(self.count_per_expense_category)
+
+              self.highest_income_amount = 0
+              self.income_category_with_highest_amount = None
+              self.income_category_with_most_transactions = None
+              if income_cells:
+                     highest_category = max(income_cells, key=lambda category: income_cells[category].highest)
+                     self.highest_income_amount = income_cells[highest_category].highest
+                     self.income_category_with_highest_amount = highest_category
+                     self.income_category_with_most_transactions = self.count_per_income_category.most_common(1)[0][0]
+
+              self.highest_expense_amount = 0
+              self.expense_category_with_highest_amount = None
+              self.expense_category_with_most_transactions = None
+              if expense_cells:
+                     highest_category = max(expense_cells, key=lambda category: expense_cells[category].highest)
+                     self.highest_expense_amount = expense_cells[highest_category].highest
+                     self.expense_category_with_highest_amount = highest_category
+                     self.expense_category_with_most_transactions = (
+                            self.count_per_expense_category.most_common(1)[0][0]
+                     )
+
+       def _calculate_order_statistics(self) -> None:
+              if self._load_order_statistics is not None:
+                     quantiles = self._load_order_statistics()
+              else:
+                     quantiles = self._get_partial(with_histograms=True)
+
+              self.median_income = quantiles.get_median(TransactionType.INCOME)
+              self.median_expense = quantiles.get_median(TransactionType.EXPENSE)
+              self.percentile_90_expense = quantiles.get_percentile(TransactionType.EXPENSE, 90)
+              self.percentile_99_expense = quantiles.get_percentile(TransactionType.EXPENSE, 99)
+
+              self.approximate_quantiles = False
+              self.quantile_sample_size = 0
+              self.quantile_rank_error = 0.0
+              self.quantile_bounds = {}
+              if not isinstance(quantiles, SampledQuantiles):
+                     return
+
+              samples = [quantiles.get_sample(transaction_type) for transaction_type in TransactionType]
+              self.approximate_quantiles = not all(sample.is_exact for sample in samples)
+              self.quantile_sample_size = sum(sample.sample_size for sample in samples)
+              self.quantile_rank_error = max(sample.get_rank_error() for sample in samples) * 100
+              if self.approximate_quantiles:
+                     self.quantile_bounds = {
+                            name: quantiles.get_sample(transaction_type).get_percentile_bounds(percentage)
+                            for name, transaction_type, percentage in self._QUANTILE_FIELDS
+                     }
+
+       def _to_percentages(self, values: dict) -> dict:
+              total = sum(values.values())
+              return {key: (value / total) * 100 for key, value in values.items()}
 
 class TransactionStatisticsCalculator:
-       def __init__(self, transaction_list: list[Transaction]):
-              self._income_transactions = [
-                     transaction for transaction in transaction_list 
-                     if transaction.transaction_type == TransactionType.INCOME
-                     ]
-              self._expense_transactions = [
-                     transaction for transaction in transaction_list 
-                     if transaction.transaction_type == TransactionType.EXPENSE
-              ]
+       """
+       Mantém o TransactionStatistics da lista exibida. Nenhuma estatística é calculada aqui: cada atualização só
+       troca a origem do resumo, e os campos são calculados quando lidos. Com workers > 1, listas grandes são
+       resumidas em blocos paralelos.
+
+       Com approximate=True, as listas são resumidas em uma única passada e em memória constante: contadores
+       exatos por categoria e uma amostra de sample_size valores por tipo para medianas e percentis.
+       """
+       def __init__(
+                     self,
+                     transaction_list: list[Transaction],
+                     workers: int = 1,
+                     approximate: bool = False,
+                     sample_size: int = DEFAULT_SAMPLE_SIZE
+                     ):
+              self._workers = workers
+              self._approximate = approximate
+              self._sample_size = sample_size
               self.statistics = TransactionStatistics()
-              if transaction_list:
-                     self._calculate_statistics()
-
-       def update_statistics(self, new_transaction_list: list[Transaction]) -> None:
-              self._income_transactions = [
-                     transaction for transaction in new_transaction_list 
-                     if transaction.transaction_type == TransactionType.INCOME
-                     ]
-              self._expense_transactions = [
-                     transaction for transaction in new_transaction_list 
-                     if transaction.transaction_type == TransactionType.EXPENSE
-              ]
-              if not new_transaction_list:
-                     self.statistics = TransactionStatistics()
+              self.update_statistics(transaction_list)
+
+       @property
+       def is_approximate(self) -> bool:
+              return self._approximate
+
+       @property
+       def sample_size(self) -> int:
+              return self._sample_size
+
+       def update_statistics(self, new_transaction_list: Iterable[Transaction]) -> None:
+              """No modo aproximado, a lista pode ser qualquer iterável: ela é percorrida uma única vez, na leitura."""
+              if self._approximate:
+                     source = _SampledSource(new_transaction_list, self._sample_size)
+                     self.statistics = TransactionStatistics(source.load_partial, source.load_quantiles)
                      return
-              
-              self._calculate_statistics()
 
-       # Métodos privados ---------------------------------------------------------------------------------------------
-       def _calculate_statistics(self) -> None:
-              stats = self.statistics
-
-              stats.transaction_count = self._get_transaction_count()
-              stats.income_transaction_count = self._get_income_transaction_count()
-              stats.expense_transaction_count = self._get_expense_transaction_count()
-              stats.total_income = self._calculate_total_income()
-              stats.total_expense = self._calculate_total_expense()
-              stats.balance = self._calculate_balance()
-              stats.highest_income_amount = self._get_highest_income_amount()
-              stats.highest_expense_amount = self._get_highest_expense_amount()
-              stats.income_category_with_highest_amount = self._get_income_category_with_highest_amount()
-              stats.expense_category_with_highest_amount = self._get_expense_category_with_highest_amount()
-              stats.income_category_with_most_transactions = (
-                     self._get_income_category_with_most_transaction()
-              )
-              stats.expense_category_with_most_transactions = (
-                     self._get_expense_category_with_most_transactions()
+              self.statistics = TransactionStatistics(
+                     lambda with_histograms: summarize_parallel(new_transaction_list, self._workers, with_histograms)
               )
-              stats.total_per_income_category = self._calculate_total_per_income_category()
-              stats.total_per_expense_category = self._calculate_total_per_expense_category()
-              stats.percentage_per_income_category = self._calculate_percentage_per_income_category()
-              stats.percentage_per_expense_category = self._calculate_percentage_per_expense_category()
-              stats.count_per_income_category = self._get_count_per_income_category()
-              stats.count_per_expense_category = self._get_count_per_expense_category()
-              stats.count_percentage_per_income_category = self._calculate_count_percentage_per_income_category()
-              stats.count_percentage_per_expense_category = self._calculate_count_percentage_per_expense_category()
-              stats.average_income = self._calculate_average_income()
-              stats.average_expense = self._calculate_average_expense()
-              stats.median_income = self._get_median_income()
-              stats.median_expense = self._get_median_expense()
-
-       def _get_transaction_count(self) -> int:
-              return len(self._income_transactions) + len(self._expense_transactions)
-       
-       def _get_income_transaction_count(self) -> int:
-              return len(self._income_transactions)
-       
-       def _get_expense_transaction_count(self) -> int:
-              return len(self._expense_transactions)
-
-       def _calculate_total_income(self) -> float | int:
-              result = 0
-              for transaction in self._income_transactions:
-                     result += transaction.amount
-              
-              return result
-
-       def _calculate_total_expense(self) -> float | int:
-              result = 0
-              for transaction in self._expense_transactions:
-                     result += transaction.amount
-              
-              return result
-
-       def _calculate_balance(self) -> float | int:
-              return self.statistics.total_income - self.statistics.total_expense
-       
-       def _get_highest_income_amount(self) -> float | int:
-              if not self._income_transactions:
-                     return 0
-              
-              transaction_with_highest_amount = self._get_income_transaction_with_highest_amount()
-              return transaction_with_highest_amount.amount
-       
-       def _get_highest_expense_amount(self) -> float | int:
-              if not self._expense_transactions:
-                     return 0
-              
-              transaction_with_highest_amount = self._get_expense_transaction_with_highest_amount()
-              return transaction_with_highest_amount.amount
-       
-       def _get_income_category_with_highest_amount(self) -> IncomeCategory | None:
-              if not self._income_transactions:
-                     return None
-              
-              transaction_with_highest_amount = self._get_income_transaction_with_highest_amount()
-              return transaction_with_highest_amount.category
-       
-       def _get_expense_category_with_highest_amount(self) -> ExpenseCategory | None:
-              if not self._expense_transactions:
-                     return None
-              
-              transaction_with_highest_amount = self._get_expense_transaction_with_highest_amount()
-              return transaction_with_highest_amount.category
-       
-       def _get_income_category_with_most_transaction(self) -> IncomeCategory | None:
-              if not self._income_transactions:
-                     return None
-              
-              category_list = [transaction.category for transaction in self._income_transactions]
-              most_common_category, _ = Counter(category_list).most_common(1)[0]
-
-              return most_common_category
-
-       def _get_expense_category_with_most_transactions(self) -> ExpenseCategory | None:
-              if not self._expense_transactions:
-                     return None
-              
-              category_list = [transaction.category for transaction in self._expense_transactions]
-              most_common_category, _ = Counter(category_list).most_common(1)[0]
-
-              return most_common_category            
-       
-       def _calculate_total_per_income_category(self) -> dict[IncomeCategory, int | float]:
-              if not self._income_transactions:
-                     return {}
-              
-              totals = {}
-              for transaction in self._income_transactions:
-                     category = transaction.category
-                     amount = transaction.amount
-                     totals[category] = totals.get(category, 0) + amount
-
-              return totals
-
-       def _calculate_total_per_expense_category(self) -> dict[ExpenseCategory, int | float]:
-              if not self._expense_transactions:
-                     return {}
-              
-              totals = {}
-              for transaction in self._expense_transactions:
-                     category = transaction.category
-                     amount = transaction.amount
-                     totals[category] = totals.get(category, 0) + amount
-
-              return totals
-
-       def _calculate_percentage_per_income_category(self) -> dict[IncomeCategory, float]:
-              if not self._income_transactions:
-                     return {}
-              
-              income_total = self._calculate_total_income()
-              income_totals_per_category = self._calculate_total_per_income_category()
-              percentages = {}
-              for category, total_per_category in income_totals_per_category.items():
-                     percentages[category] = (total_per_category / income_total) * 100
-
-              return percentages
-
-       def _calculate_percentage_per_expense_category(self) -> dict[ExpenseCategory, float]:
-              if not self._expense_transactions:
-                     return {}
-              
-              expense_total = self._calculate_total_expense()
-              expense_totals_per_category = self._calculate_total_per_expense_category()
-              percentages = {}
-              for category, total_per_category in expense_totals_per_category.items():
-                     percentages[category] = (total_per_category / expense_total) * 100
-
-              return percentages
-       
-       def _get_count_per_income_category(self) -> Counter[IncomeCategory]:
-              if not self._income_transactions:
-                     return {}
-              
-              category_list = [transaction.category for transaction in self._income_transactions]
-              return Counter(category_list)
-              
-       def _get_count_per_expense_category(self) -> Counter[ExpenseCategory]:
-              if not self._expense_transactions:
-                     return {}
-              
-              category_list = [transaction.category for transaction in self._expense_transactions]
-              return Counter(category_list)
-       
-       def _calculate_count_percentage_per_income_category(self) -> dict[IncomeCategory, float]:
-              if not self._income_transactions:
-                     return {}
-              
-              income_transaction_count = self._get_income_transaction_count()
-              count_per_category = self._get_count_per_income_category()
-              count_percentage = {}
-              for category, count in count_per_category.items():
-                     count_percentage[category] = (count / income_transaction_count) * 100
-
-              return count_percentage
-              
-       def _calculate_count_percentage_per_expense_category(self) -> dict[ExpenseCategory, float]:
-              if not self._expense_transactions:
-                     return {}
-              
-              expense_transaction_count = self._get_expense_transaction_count()
-              count_per_category = self._get_count_per_expense_category()
-              count_percentage = {}
-              for category, count in count_per_category.items():
-                     count_percentage[category] = (count / expense_transaction_count) * 100
-
-              return count_percentage
-       
-       def _calculate_average_income(self) -> float:
-              if not self._income_transactions:
-                     return 0.0
-              
-              income_transaction_total = self._calculate_total_income()
-              income_transaction_count = self._get_income_transaction_count()
-              return income_transaction_total / income_transaction_count
-       
-       def _calculate_average_expense(self) -> float:
-              if not self._expense_transactions:
-                     return 0.0
-              
-              expense_transaction_total = self._calculate_total_expense()
-              expense_transaction_count = self._get_expense_transaction_count()
-              return expense_transaction_total / expense_transaction_count
-       
-       def _get_median_income(self) -> int | float:
-              if not self._income_transactions:
-                     return 0
-              
-              amount_list = [transaction.amount for transaction in self._income_transactions]
-              return statistics.median(amount_list)
-       
-       def _get_median_expense(self) -> int | float:
-              if not self._expense_transactions:
-                     return 0
-              
-              amount_list = [transaction.amount for transaction in self._expense_transactions]
-              return statistics.median(amount_list)
-       
-       # Métodos menores auxiliares para calcular a transação com maior valor -----------------------------------------
-       def _get_income_transaction_with_highest_amount(self) -> Transaction:
-              return max(self._income_transactions, key=lambda t: t.amount)
-       
-       def _get_expense_transaction_with_highest_amount(self) -> Transaction:
-              return max(self._expense_transactions, key=lambda t: t.amount)
\ No newline at end of file
+
+       def update_statistics_from_partial(
+                     self,
+                     load_partial: PartialLoader,
+                     load_order_statistics: QuantileLoader | None = None
+                     ) -> None:
+              """
+              Usa o resumo fornecido por load_partial (ver TransactionManager.summarize_date_range) em vez de
+              percorrer uma lista; medianas e percentis vêm de load_order_statistics, se informado.
+              """
+              self.statistics = TransactionStatistics(load_partial, load_order_statistics)
+
+       def invalidate(self) -> None:
+              """Chamado quando a lista de transações muda: os campos já lidos são recalculados ao serem lidos."""
+              self.statistics.invalidate()
+
+
+class _SampledSource:
+       """Resumo aproximado de uma lista, feito uma única vez e compartilhado pelas células e pelos quantis."""
+       def __init__(self, transaction_list: Iterable[Transaction], sample_size: int):
+              self._transaction_list = transaction_list
+              self._sample_size = sample_size
+              self._summary: tuple[PartialStatistics, SampledQuantiles] | None = None
+
+       def load_partial(self, with_histograms: bool) -> PartialStatistics:
+              # Sem histogramas mesmo quando pedidos: os quantis vêm da amostra
+              return self._load()[0]
+
+       def load_quantiles(self) -> SampledQuantiles:
+              return self._load()[1]
+
+       def _load(self) -> tuple[PartialStatistics, SampledQuantiles]:
+              if self._summary is None:
+                     self._summary = summarize_with_sample(self._transaction_list, self._sample_size)
+
+              return self._summary
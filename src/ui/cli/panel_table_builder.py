@@ -20,6 +20,7 @@ def build_dashboard() -> Panel:
 def build_main_menu() -> Panel:
     menu_text: str = """[cyan][1][/cyan] Adicionar Transação
 [cyan][2][/cyan] Gerenciar Transações
+[cyan][3][/cyan] Importar Extrato CSV
 [cyan][0][/cyan] Sair"""
 
     return Panel(
@@ -94,6 +95,8 @@ def build_transaction_management_submenu() -> Panel:
 [cyan][2][/]: Filtrar Transações
 [cyan][3][/]: Ordenar Transações
 [cyan][4][/]: Gerar Relatório
+[cyan][5][/]: Exportar Lista
+[cyan][6][/]: Navegar por Páginas
 [cyan][0][/]: Voltar"""
     submenu_title = '[bold blue]Opções de Gerenciamento[/]'
 
@@ -124,7 +127,8 @@ def build_transaction_filter_submenu() -> Panel:
 [cyan][2][/]: Filtrar por Tipo
 [cyan][3][/]: Filtrar por Data
 [cyan][4][/]: Filtrar por Categoria
-[cyan][5][/]: Resetar Filtro
+[cyan][5][/]: Filtrar por Descrição
+[cyan][6][/]: Resetar Filtro
 [cyan][0][/]: Voltar"""
     submenu_title = '[bold blue]Opções de Filtragem[/]'
 
@@ -163,6 +167,43 @@ def build_transaction_sort_order_submenu() -> Panel:
         padding=(1,4)
     )
 
+def build_export_format_menu() -> Panel:
+    menu_text = """[cyan][1][/]: CSV (planilha)
+[cyan][2][/]: JSON Lines
+[cyan][3][/]: Markdown
+[cyan][0][/]: Voltar"""
+
+    return Panel(
+        menu_text,
+        title='[bold blue]Formato de Exportação[/]',
+        expand=False,
+        border_style='cyan',
+        padding=(1,4)
+    )
+
+def build_page_navigation_menu(
+        has_previous_page: bool,
+        has_next_page: bool,
+        can_jump: bool = False,
+        exit_label: str = 'Voltar'
+        ) -> Panel:
+    menu_lines = []
+    if has_next_page:
+        menu_lines.append('[cyan][1][/]: Próxima Página')
+    if has_previous_page:
+        menu_lines.append('[cyan][2][/]: Página Anterior')
+    if can_jump:
+        menu_lines.append('[cyan][3][/]: Ir para Página')
+    menu_lines.append(f'[cyan][0][/]: {exit_label}')
+
+    return Panel(
+        '\n'.join(menu_lines),
+        title='[bold blue]Navegação[/]',
+        expand=False,
+        border_style='cyan',
+        padding=(1,4)
+    )
+
 def build_confirmation_panel(msg: str) -> Panel:
     return Panel(
         msg, 
@@ -181,6 +222,16 @@ def build_orientation_panel(msg: str) -> Panel:
         padding=(0,0)
     )
 
+def build_import_report_panel(msg: str) -> Panel:
+    return Panel(
+        msg,
+        box=box.SQUARE,
+        title='[bold blue]Resultado da Importação[/]',
+        border_style='cyan',
+        expand=False,
+        padding=(1,4)
+    )
+
 def build_general_overview_panel(msg: str) -> Panel:
     return Panel(
         msg,
@@ -213,7 +264,7 @@ def build_expense_overview_panel(msg: str) -> Panel:
     
 # Funções que retornam uma lista de opções para o Prompt de Rich --------------------------------------------------
 def get_main_menu_choices() -> list[str]:
-    return ['1', '2', '0']
+    return ['1', '2', '3', '0']
 
 def get_transaction_type_choices() -> list[str]:
     return [number for number in TRANSACTION_TYPE_TABLE]
@@ -234,13 +285,13 @@ def get_all_categories_choices() -> list[str]:
     return [number for number in ALL_CATEGORIES_TABLE]
 
 def get_transaction_management_submenu_choices() -> list[str]:
-    return ['1', '2', '3', '4', '0']
+    return ['1', '2', '3', '4', '5', '6', '0']
 
 def get_transaction_modification_submenu_choices() -> list[str]:
     return ['1', '2', '3', '0']
 
 def get_transaction_filter_submenu_choices() -> list[str]:
-    return ['1', '2', '3', '4', '5', '0']
+    return ['1', '2', '3', '4', '5', '6', '0']
 
 def get_transaction_sorter_submenu_choices() -> list[str]:
     return ['1', '2', '3', '0']
@@ -248,11 +299,36 @@ def get_transaction_sorter_submenu_choices() -> list[str]:
 def get_transaction_sort_order_choices() -> list[str]:
     return ['1', '2', '0']
 
+def get_export_format_choices() -> list[str]:
+    return ['1', '2', '3', '0']
+
+def get_page_navigation_choices(has_previous_page: bool, has_next_page: bool, can_jump: bool = False) -> list[str]:
+    choices = []
+    if has_next_page:
+        choices.append('1')
+    if has_previous_page:
+        choices.append('2')
+    if can_jump:
+        choices.append('3')
+    choices.append('0')
+    return choices
+
 
 # Funções que constroem as diferentes tabelas usadas no programa ------------------------------------------------------
-def build_transaction_table(transactions_list: list[Transaction], statistics: TransactionStatistics) -> Table:
+def build_transaction_table(
+        transactions_list: list[Transaction],
+        statistics: TransactionStatistics,
+        page_number: int | None = None,
+        page_count: int | None = None,
+        running_balances: list[float | None] | None = None
+        ) -> Table:
+    """
+    Os totais do rodapé são os da lista inteira, mesmo quando a tabela mostra só uma página dela.
+    Se running_balances (alinhada à lista) for informada, a tabela ganha a coluna de saldo acumulado.
+    """
+    title = 'Transações' if page_number is None else f'Transações - Página {page_number} de {page_count}'
     transaction_table = Table( 
-        title='Transações', 
+        title=title, 
         style='bold blue',
         show_footer=True
         )
@@ -274,19 +350,10 @@ def build_transaction_table(transactions_list: list[Transaction], statistics: Tr
     transaction_table.add_column('[cyan]Data[/]', style='cyan')
     transaction_table.add_column('[cyan]Categoria[/]', style='cyan')
     transaction_table.add_column('[cyan]Descrição[/]', style='cyan')
-    
-    for transaction in transactions_list:
-        transaction_table.add_row(
-            str(transaction.id), 
-            formatter.format_transaction_type(transaction.transaction_type), 
-            formatter.format_currency_for_ptbr(transaction.amount), 
-            formatter.format_date(transaction.transaction_date), 
-            formatter.format_category(transaction.category), 
-            transaction.description, 
-            style='green' if transaction.transaction_type.value == 'receita' else 'red')
+    _add_transaction_rows(transaction_table, transactions_list, running_balances)
 
     return transaction_table
-    
+
 def build_income_report_table(row_content: list[list[str]]) -> Table:
     report_table = Table(
         title='Breakdown de Receitas por Categoria',
@@ -321,4 +388,195 @@ def build_expense_report_table(row_content: list[list[str]]) -> Table:
     for content in row_content:
         report_table.add_row(*content)
 
-    return report_table
\ No newline at end of file
+    return report_table
+
+def build_monthly_report_table(row_content: list[list[str]]) -> Table:
+    report_table = Table(
+        title='Evolução Mensal',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    report_table.add_column('Mês')
+    report_table.add_column('Receitas', justify='right', style='green')
+    report_table.add_column('Despesas', justify='right', style='red')
+    report_table.add_column('Saldo', justify='right')
+    report_table.add_column('Despesas vs. mês anterior', justify='right')
+
+    for content in row_content:
+        report_table.add_row(*content)
+
+    return report_table
+
+def build_unusual_expenses_table(row_content: list[list[str]]) -> Table:
+    report_table = Table(
+        title='Despesas Fora do Padrão',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    report_table.add_column('Data')
+    report_table.add_column('Categoria')
+    report_table.add_column('Descrição')
+    report_table.add_column('Valor', justify='right', style='red')
+    report_table.add_column('Típico da categoria', justify='right')
+    report_table.add_column('Desvios', justify='right')
+
+    for content in row_content:
+        report_table.add_row(*content)
+
+    return report_table
+
+def build_rolling_windows_table(row_content: list[list[str]], last_day_str: str) -> Table:
+    report_table = Table(
+        title=f'Janelas Móveis (até {last_day_str})',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    report_table.add_column('Janela')
+    report_table.add_column('Receitas', justify='right', style='green')
+    report_table.add_column('Despesas', justify='right', style='red')
+    report_table.add_column('Janela anterior', justify='right')
+    report_table.add_column('Variação', justify='right')
+    report_table.add_column('Maior gasto', justify='right')
+    report_table.add_column('Terminada em')
+
+    for content in row_content:
+        report_table.add_row(*content)
+
+    return report_table
+
+def build_largest_expenses_table(row_content: list[list[str]]) -> Table:
+    report_table = Table(
+        title='Maiores Despesas',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    report_table.add_column('Data')
+    report_table.add_column('Categoria')
+    report_table.add_column('Descrição')
+    report_table.add_column('Valor', justify='right', style='red')
+
+    for content in row_content:
+        report_table.add_row(*content)
+
+    return report_table
+
+def build_top_descriptions_by_amount_table(row_content: list[list[str]]) -> Table:
+    report_table = Table(
+        title='Descrições com Maior Gasto',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    report_table.add_column('Descrição')
+    report_table.add_column('Total', justify='right', style='red')
+    report_table.add_column('Erro máximo', justify='right')
+
+    for content in row_content:
+        report_table.add_row(*content)
+
+    return report_table
+
+def build_top_descriptions_by_count_table(row_content: list[list[str]]) -> Table:
+    report_table = Table(
+        title='Descrições Mais Frequentes',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    report_table.add_column('Descrição')
+    report_table.add_column('Transações', justify='right')
+    report_table.add_column('Erro máximo', justify='right')
+
+    for content in row_content:
+        report_table.add_row(*content)
+
+    return report_table
+
+def build_import_error_table(row_content: list[list[str]]) -> Table:
+    error_table = Table(
+        title='Linhas Rejeitadas',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    error_table.add_column('Linha', justify='right')
+    error_table.add_column('Motivo', style='red')
+
+    for content in row_content:
+        error_table.add_row(*content)
+
+    return error_table
+
+def build_import_duplicate_table(row_content: list[list[str]]) -> Table:
+    duplicate_table = Table(
+        title='Duplicadas (ignoradas)',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    duplicate_table.add_column('Linha', justify='right')
+    duplicate_table.add_column('Descrição')
+    duplicate_table.add_column('Motivo', style='cyan')
+
+    for content in row_content:
+        duplicate_table.add_row(*content)
+
+    return duplicate_table
+
+
+def build_import_near_duplicate_table(row_content: list[list[str]]) -> Table:
+    near_duplicate_table = Table(
+        title='Possíveis Duplicadas (importadas)',
+        style='bold blue',
+        header_style= 'bold cyan'
+    )
+
+    near_duplicate_table.add_column('Linha', justify='right')
+    near_duplicate_table.add_column('Descrição')
+    near_duplicate_table.add_column('Motivo', style='yellow')
+
+    for content in row_content:
+        near_duplicate_table.add_row(*content)
+
+    return near_duplicate_table
+
+
+# Funções auxiliares --------------------------------------------------------------------------------------------------
+def _add_transaction_rows(
+        transaction_table: Table,
+        transactions_list: list[Transaction],
+        running_balances: list[float | None] | None
+        ) -> None:
+    if running_balances is None:
+        for transaction in transactions_list:
+            _add_transaction_row(transaction_table, transaction)
+        return
+
+    transaction_table.add_column('[cyan]Saldo acumulado[/]', justify='right')
+    for transaction, running_balance in zip(transactions_list, running_balances):
+        _add_transaction_row(transaction_table, transaction, running_balance)
+
+def _add_transaction_row(
+        transaction_table: Table,
+        transaction: Transaction,
+        running_balance: float | None = None
+        ) -> None:
+    cells = [
+        str(transaction.id), 
+        formatter.format_transaction_type(transaction.transaction_type), 
+        formatter.format_currency_for_ptbr(transaction.amount), 
+        formatter.format_date(transaction.transaction_date), 
+        formatter.format_category(transaction.category), 
+        transaction.description, 
+    ]
+    if running_balance is not None:
+        balance_color = 'green' if running_balance >= 0 else 'red'
+        cells.append(f'[{balance_color}]{formatter.format_currency_for_ptbr(running_balance)}[/]')
+
+    transaction_table.add_row(
+        *cells,
+        style='green' if transaction.transaction_type.value == 'receita' else 'red')
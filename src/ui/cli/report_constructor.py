@@ -2,15 +2,38 @@ from datetime import date
 from rich.panel import Panel
 from rich.table import Table
 
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
 from src.service.transaction_statistics import TransactionStatistics
+from src.service.time_series import TimeSeries
+from src.models.heavy_hitters import TopDescriptions
+from src.models.rolling_window import RollingWindows
+from src.models.unusual_expenses import UnusualExpense
 import src.ui.formatter as formatter
 import src.ui.cli.panel_table_builder as ptbuilder
 
 class ReportConstructor:
-    def __init__(self, statistics: TransactionStatistics, start_date: date, end_date: date):
+    def __init__(
+            self,
+            statistics: TransactionStatistics,
+            start_date: date,
+            end_date: date,
+            largest_expenses: list[Transaction] | None = None,
+            monthly_series: TimeSeries | None = None,
+            accumulated_balance: int | float | None = None,
+            top_descriptions: TopDescriptions | None = None,
+            rolling_windows: RollingWindows | None = None,
+            unusual_expenses: list[UnusualExpense] | None = None
+            ):
         self._statistics: TransactionStatistics = statistics
         self._start_date: date = start_date
         self._end_date: date = end_date
+        self._largest_expenses: list[Transaction] = largest_expenses or []
+        self._monthly_series: TimeSeries | None = monthly_series
+        self._accumulated_balance: int | float | None = accumulated_balance
+        self._top_descriptions: TopDescriptions = top_descriptions or TopDescriptions()
+        self._rolling_windows: RollingWindows | None = rolling_windows
+        self._unusual_expenses: list[UnusualExpense] = unusual_expenses or []
 
     def generate_full_report(self) -> tuple[Panel | Table, ...]:
         overview_text = self._compose_overview_text()
@@ -27,7 +50,39 @@ class ReportConstructor:
         expense_table_row_content = self._get_expense_report_table_content()
         expense_report_table = ptbuilder.build_expense_report_table(expense_table_row_content)
 
-        return overview_panel, income_overview_panel, expense_overview_panel, income_report_table, expense_report_table
+        largest_expenses_row_content = self._get_largest_expenses_table_content()
+        largest_expenses_table = ptbuilder.build_largest_expenses_table(largest_expenses_row_content)
+
+        unusual_expenses_row_content = self._get_unusual_expenses_table_content()
+        unusual_expenses_table = ptbuilder.build_unusual_expenses_table(unusual_expenses_row_content)
+
+        monthly_row_content = self._get_monthly_report_table_content()
+        monthly_report_table = ptbuilder.build_monthly_report_table(monthly_row_content)
+
+        rolling_windows_row_content = self._get_rolling_windows_table_content()
+        rolling_windows_table = ptbuilder.build_rolling_windows_table(
+            rolling_windows_row_content, self._get_rolling_windows_last_day_str()
+        )
+
+        top_by_amount_row_content = self._get_top_descriptions_by_amount_table_content()
+        top_by_amount_table = ptbuilder.build_top_descriptions_by_amount_table(top_by_amount_row_content)
+
+        top_by_count_row_content = self._get_top_descriptions_by_count_table_content()
+        top_by_count_table = ptbuilder.build_top_descriptions_by_count_table(top_by_count_row_content)
+
+        return (
+            overview_panel,
+            income_overview_panel,
+            expense_overview_panel,
+            income_report_table,
+            expense_report_table,
+            largest_expenses_table,
+            unusual_expenses_table,
+            monthly_report_table,
+            rolling_windows_table,
+            top_by_amount_table,
+            top_by_count_table
+        )
 
 
 
@@ -37,10 +92,27 @@ class ReportConstructor:
         transaction_count = self._statistics.transaction_count
         formatted_balance = formatter.format_currency_for_ptbr(self._statistics.balance)
         balance_color = '[green]' if self._statistics.balance >= 0 else '[red]'
-        return (
+        overview_text = (
             f'Período: [cyan]{formatted_start_date}[/] até [cyan]{formatted_end_date}[/]\n'
             f'Transações: [cyan]{transaction_count}[/] | Saldo: {balance_color}{formatted_balance}[/]'
         )
+        if self._statistics.approximate_quantiles:
+            approximation_note = formatter.format_approximation_note(
+                self._statistics.quantile_sample_size, self._statistics.quantile_rank_error
+            )
+            overview_text += f'\n[yellow]{approximation_note}[/]'
+
+        if self._accumulated_balance is None:
+            return overview_text
+
+        # Saldo de todas as transações até o fim do período, inclusive as anteriores a ele
+        formatted_accumulated_balance = formatter.format_currency_for_ptbr(self._accumulated_balance)
+        accumulated_balance_color = '[green]' if self._accumulated_balance >= 0 else '[red]'
+        return (
+            f'{overview_text}\n'
+            f'Saldo acumulado até {formatted_end_date}: '
+            f'{accumulated_balance_color}{formatted_accumulated_balance}[/]'
+        )
 
     def _compose_income_overview_text(self) -> str:
         if self._statistics.income_category_with_highest_amount is None \
@@ -50,7 +122,7 @@ class ReportConstructor:
         income_count = self._statistics.income_transaction_count
         total_income = formatter.format_currency_for_ptbr(self._statistics.total_income)
         average_income = formatter.format_currency_for_ptbr(self._statistics.average_income)
-        median_income = formatter.format_currency_for_ptbr(self._statistics.median_income)
+        median_income = self._format_quantile('median_income')
         highest_income_amount = formatter.format_currency_for_ptbr(self._statistics.highest_income_amount)
         income_category_with_highest_amount = (
             formatter.format_category(self._statistics.income_category_with_highest_amount)
@@ -76,7 +148,9 @@ class ReportConstructor:
         expense_count = self._statistics.expense_transaction_count
         total_expense = formatter.format_currency_for_ptbr(self._statistics.total_expense)
         average_expense = formatter.format_currency_for_ptbr(self._statistics.average_expense)
-        median_expense = formatter.format_currency_for_ptbr(self._statistics.median_expense)
+        median_expense = self._format_quantile('median_expense')
+        percentile_90_expense = self._format_quantile('percentile_90_expense')
+        percentile_99_expense = self._format_quantile('percentile_99_expense')
         highest_expense_amount = formatter.format_currency_for_ptbr(self._statistics.highest_expense_amount)
         expense_category_with_highest_amount = (
             formatter.format_category(self._statistics.expense_category_with_highest_amount)
@@ -89,6 +163,8 @@ class ReportConstructor:
             f'[cyan]Total[/]: {total_expense}\n'
             f'[cyan]Média[/]: {average_expense}\n'
             f'[cyan]Mediana[/]: {median_expense}\n'
+            f'[cyan]Percentil 90[/]: {percentile_90_expense}\n'
+            f'[cyan]Percentil 99[/]: {percentile_99_expense}\n'
             f'[cyan]Maior valor[/]: {highest_expense_amount}\n'
             f'[cyan]Categoria com maior valor[/]: {expense_category_with_highest_amount}\n'
             f'[cyan]Categoria com maior número de transações[/]: {expense_category_with_most_transactions}'
@@ -154,3 +230,110 @@ class ReportConstructor:
 
         return rows
 
+    def _get_largest_expenses_table_content(self) -> list[list[str]]:
+        return [
+            [
+                formatter.format_date(transaction.transaction_date),
+                formatter.format_category(transaction.category),
+                transaction.description,
+                formatter.format_currency_for_ptbr(transaction.amount)
+            ]
+            for transaction in self._largest_expenses
+        ]
+
+    def _get_unusual_expenses_table_content(self) -> list[list[str]]:
+        return [
+            [
+                formatter.format_date(unusual_expense.transaction.transaction_date),
+                formatter.format_category(unusual_expense.transaction.category),
+                unusual_expense.transaction.description,
+                formatter.format_currency_for_ptbr(unusual_expense.transaction.amount),
+                formatter.format_currency_for_ptbr(unusual_expense.typical_amount),
+                f'{unusual_expense.score:.1f}'
+            ]
+            for unusual_expense in self._unusual_expenses
+        ]
+
+    def _get_monthly_report_table_content(self) -> list[list[str]]:
+        """Uma linha por mês, com a variação das despesas em relação ao mês anterior."""
+        if self._monthly_series is None:
+            return []
+
+        incomes = self._monthly_series.get_totals(TransactionType.INCOME)
+        expenses = self._monthly_series.get_totals(TransactionType.EXPENSE)
+        expense_changes = self._monthly_series.get_changes(TransactionType.EXPENSE)
+        rows = []
+        for month, income, expense, expense_change in zip(
+            self._monthly_series.periods, incomes, expenses, expense_changes
+        ):
+            balance = income - expense
+            balance_color = 'green' if balance >= 0 else 'red'
+            rows.append([
+                formatter.format_month(month),
+                formatter.format_currency_for_ptbr(income),
+                formatter.format_currency_for_ptbr(expense),
+                f'[{balance_color}]{formatter.format_currency_for_ptbr(balance)}[/]',
+                '-' if expense_change is None else f'{expense_change:+.1f}%'
+            ])
+
+        return rows
+
+    def _get_rolling_windows_table_content(self) -> list[list[str]]:
+        """Uma linha por largura de janela, com as somas da janela que termina no último dia da série."""
+        if self._rolling_windows is None:
+            return []
+
+        rows = []
+        for window_days in self._rolling_windows.window_days:
+            series = self._rolling_windows.get_series(window_days)
+            if not len(series):
+                return []
+
+            previous_expenses = series.get_previous_expenses()
+            expense_change = series.get_expense_change()
+            peak_day, peak_expenses = series.get_peak_expenses()
+            rows.append([
+                f'{window_days} dias',
+                formatter.format_currency_for_ptbr(series.incomes[-1]),
+                formatter.format_currency_for_ptbr(series.expenses[-1]),
+                '-' if previous_expenses is None else formatter.format_currency_for_ptbr(previous_expenses),
+                '-' if expense_change is None else f'{expense_change:+.1f}%',
+                formatter.format_currency_for_ptbr(peak_expenses),
+                formatter.format_date(peak_day)
+            ])
+
+        return rows
+
+    def _get_rolling_windows_last_day_str(self) -> str:
+        if self._rolling_windows is None:
+            return '-'
+
+        last_day = self._rolling_windows.get_series(self._rolling_windows.window_days[0]).last_day
+        return '-' if last_day is None else formatter.format_date(last_day)
+
+    def _get_top_descriptions_by_amount_table_content(self) -> list[list[str]]:
+        # Estimativas: o valor real é no máximo o erro a menos (sem erro, o valor é exato)
+        return [
+            [
+                description_total.description,
+                formatter.format_currency_for_ptbr(description_total.estimate),
+                '-' if not description_total.error else formatter.format_currency_for_ptbr(description_total.error)
+            ]
+            for description_total in self._top_descriptions.by_amount
+        ]
+
+    def _get_top_descriptions_by_count_table_content(self) -> list[list[str]]:
+        return [
+            [
+                description_total.description,
+                str(description_total.estimate),
+                '-' if not description_total.error else str(description_total.error)
+            ]
+            for description_total in self._top_descriptions.by_count
+        ]
+
+    def _format_quantile(self, field_name: str) -> str:
+        """Mediana ou percentil; no modo aproximado, com o intervalo da estimativa."""
+        return formatter.format_quantile(
+            getattr(self._statistics, field_name), self._statistics.quantile_bounds.get(field_name)
+        )
@@ -0,0 +1,95 @@
+from collections.abc import Callable
+
+from rich.table import Table
+
+from src.models.transaction import Transaction
+from src.models.query import QueryPage
+from src.service.transaction_statistics import TransactionStatistics
+import src.ui.cli.panel_table_builder as ptbuilder
+
+
+PageLoader = Callable[[int, str | None], QueryPage]
+
+
+class TransactionPager:
+    """
+    Exibe uma consulta paginada por chave uma página de page_size linhas por vez.
+
+    Montar e desenhar uma tabela com dezenas de milhares de linhas leva segundos; aqui só a janela visível é
+    buscada e construída. page_loader recebe o tamanho da página e o token da página anterior (None para a
+    primeira), como partial(TransactionService.query, criteria, sort). Os tokens das páginas já vistas ficam
+    guardados, então voltar ou pular não refaz a consulta desde o início. prefetch monta as páginas vizinhas
+    enquanto o usuário lê a atual; só as tabelas próximas da página atual ficam guardadas.
+
+    statistics são as da consulta inteira: dão os totais do rodapé e o número de páginas. Se
+    running_balance_loader for informado, cada página mostra o saldo acumulado das suas linhas, buscado junto
+    com a montagem da página.
+    """
+    def __init__(
+            self,
+            page_loader: PageLoader,
+            statistics: TransactionStatistics,
+            page_size: int = 50,
+            running_balance_loader: Callable[[list[Transaction]], list[float | None]] | None = None
+            ) -> None:
+        self._page_loader = page_loader
+        self._statistics = statistics
+        self._page_size = page_size
+        self._running_balance_loader = running_balance_loader
+        # _page_keys[n] é o token que abre a página n + 1 (None para a primeira)
+        self._page_keys: list[str | None] = [None]
+        self._tables: dict[int, Table] = {}
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self._statistics.transaction_count // self._page_size))
+
+    def get_table(self, page_number: int) -> Table:
+        """Tabela da página (de 1 a page_count), construída agora se ainda não foi pré-montada."""
+        if not 1 <= page_number <= self.page_count:
+            raise ValueError(f'A página deve estar entre 1 e {self.page_count}!')
+
+        table = self._tables.get(page_number)
+        if table is None:
+            table = self._tables[page_number] = self._build_table(page_number)
+
+        return table
+
+    def prefetch(self, page_number: int) -> None:
+        """Monta as páginas vizinhas de page_number e descarta as tabelas distantes."""
+        neighbours = {page_number - 1, page_number, page_number + 1}
+        for cached_page in list(self._tables):
+            if cached_page not in neighbours:
+                del self._tables[cached_page]
+
+        for neighbour in (page_number + 1, page_number - 1):
+            if 1 <= neighbour <= self.page_count and neighbour not in self._tables:
+                self._tables[neighbour] = self._build_table(neighbour)
+
+    # Métodos privados -------------------------------------------------------------------------------------------
+    def _build_table(self, page_number: int) -> Table:
+        page_transactions = self._load_page(page_number).transactions
+        running_balances = None
+        if self._running_balance_loader is not None:
+            running_balances = self._running_balance_loader(page_transactions)
+
+        # Uma única página é exibida como a lista inteira, sem numeração
+        if self.page_count == 1:
+            return ptbuilder.build_transaction_table(
+                page_transactions, self._statistics, running_balances=running_balances
+            )
+
+        return ptbuilder.build_transaction_table(
+            page_transactions, self._statistics, page_number, self.page_count, running_balances
+        )
+
+    def _load_page(self, page_number: int) -> QueryPage:
+        # Uma página ainda não alcançada (ex: ao pular para ela) é buscada a partir do último token conhecido
+        while True:
+            current_page = min(page_number, len(self._page_keys))
+            page = self._page_loader(self._page_size, self._page_keys[current_page - 1])
+            if current_page == len(self._page_keys) and page.next_key is not None:
+                self._page_keys.append(page.next_key)
+
+            if current_page == page_number or page.next_key is None:
+                return page
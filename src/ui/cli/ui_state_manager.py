@@ -1,30 +1,36 @@
-from src.models.transaction import Transaction
+from src.models.query import QueryCriteria, QuerySort
 
 
 class UIStateManager:
-    """Guarda o estado atual da lista mostrada pela UI"""
+    """
+    Guarda os filtros e a ordenação ativos da lista mostrada pela UI.
+
+    Só os critérios ficam guardados, não as transações: a lista é consultada no serviço a cada exibição, então
+    inclusões, exclusões e edições aparecem sem precisar reaplicar os filtros.
+    """
     def __init__(self) -> None:
-        self._filtered_list: list[Transaction] | None = None
+        self._criteria: QueryCriteria = QueryCriteria()
+        self._sort: QuerySort = QuerySort()
+
+    @property
+    def criteria(self) -> QueryCriteria:
+        return self._criteria
 
     @property
-    def filtered_list(self) -> list[Transaction] | None:
-        if self._filtered_list is None:
-            return None
-        
-        return self._filtered_list.copy()
-    
+    def sort(self) -> QuerySort:
+        return self._sort
+
     def has_active_filter(self) -> bool:
-        return self._filtered_list is not None
+        """A ordenação não conta como filtro: a lista continua com todas as transações."""
+        return self._criteria != QueryCriteria()
 
-    def set_filtered_list(self, filtered_list: list[Transaction]) -> None:
-        self._filtered_list = filtered_list
+    def add_filter(self, criteria: QueryCriteria) -> None:
+        """Aplica o filtro sobre os já ativos. Levanta ValueError se nenhuma transação puder atender aos dois."""
+        self._criteria = self._criteria.combine(criteria)
 
-    def del_from_filtered_list(self, transaction_id: int) -> None:
-        if self._filtered_list is not None:
-            self._filtered_list = [
-                transaction for transaction in self._filtered_list if transaction.id != transaction_id
-            ]
+    def set_sort(self, sort: QuerySort) -> None:
+        self._sort = sort
 
-    def clear_filtered_list(self) -> None:
-        if self._filtered_list is not None:
-            self._filtered_list = None
\ No newline at end of file
+    def clear(self) -> None:
+        self._criteria = QueryCriteria()
+        self._sort = QuerySort()
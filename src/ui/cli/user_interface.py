@@ -1,9 +1,19 @@
 import os
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+try:
+    import readline
+except ImportError:
+    # readline não existe no Windows; sem ele a descrição é digitada sem autocompletar.
+    readline = None
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import Progress
 from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
@@ -12,63 +22,94 @@ from src.service.transaction_service import TransactionService
 from src.utils.utils import PromptPTBR, IntPromptPTBR
 from src.utils.constants import (
     INCOME_CATEGORY_TABLE, EXPENSE_CATEGORY_TABLE, ALL_CATEGORIES_TABLE, APP_TITLE, DATE_PATTERN, AMOUNT_PATTERN,
-    DESCRIPTION_PATTERN
+    DESCRIPTION_PATTERN, LARGEST_EXPENSES_COUNT, TOP_DESCRIPTIONS_COUNT, UNUSUAL_EXPENSES_COUNT
 )
 from src.models.transaction import Transaction
+from src.models.query import QueryCriteria, QuerySort
+from src.models.enums import ExportFormat, SortField, StorageFormat, TimeBucket, SeriesGroup
+from src.service.csv_importer import CsvColumnMapping, ImportReport
 from src.ui.cli.ui_state_manager import UIStateManager
 import src.ui.formatter as formatter
 from src.ui.cli.report_constructor import ReportConstructor
+from src.ui.cli.transaction_pager import TransactionPager
 import  src.ui.cli.panel_table_builder as ptbuilder
-    
+
+
+# No macOS o módulo readline costuma usar o libedit, que tem outra sintaxe em parse_and_bind
+_USES_LIBEDIT = readline is not None and 'libedit' in (readline.__doc__ or '')
+
 
 class UserInterface:
     """Interface CLI do Programa"""
-    def __init__(self):
-        self._service: TransactionService = TransactionService()
+    def __init__(
+            self,
+            storage_format: StorageFormat = StorageFormat.JSON,
+            archive_path: Path | None = None,
+            load_workers: int = 1,
+            approximate_statistics: bool = False,
+            ):
+        self._service: TransactionService = TransactionService(
+            storage_format,
+            archive_path=archive_path,
+            load_workers=load_workers,
+            approximate_statistics=approximate_statistics
+        )
         self._console: Console = Console()
         self._state_manager: UIStateManager = UIStateManager()
         # Dicionários para execução dos comandos com o padrão Dispatch Table
         self._main_menu_dispatch_table: dict[str, Callable[[], None]] = {
             '1': self._add_transaction,
-            '2': self._manage_transactions
+            '2': self._manage_transactions,
+            '3': self._import_csv
         }
         self._transaction_management_submenu_dispatch_table: dict[str, Callable[[], None]] = {
             '1': self._modify_transaction,
             '2': self._filter_transactions,
             '3': self._sort_transactions,
-            '4': self._show_report
+            '4': self._show_report,
+            '5': self._export_transactions,
+            '6': self._browse_transactions
+        }
+        self._sort_field_table: dict[str, SortField] = {
+            '1': SortField.AMOUNT,
+            '2': SortField.DATE,
+            '3': SortField.ID
+        }
+        self._export_format_table: dict[str, ExportFormat] = {
+            '1': ExportFormat.CSV,
+            '2': ExportFormat.JSONL,
+            '3': ExportFormat.MARKDOWN
         }
         self._transaction_modification_submenu_dispatch_table: dict[str, Callable[[int], None]] = {
             '1': self._del_transaction,
             '2': self._update_category,
             '3': self._update_description
         }
-        self.transaction_filter_submenu_dispatch_table: dict[
-            str, Callable[[list[Transaction] | None], list[Transaction]]
-            ] = {
+        self.transaction_filter_submenu_dispatch_table: dict[str, Callable[[], QueryCriteria]] = {
             '1': self._filter_by_amount,
             '2': self._filter_by_type,
             '3': self._filter_by_date,
-            '4': self._filter_by_category
+            '4': self._filter_by_category,
+            '5': self._filter_by_description
         }
-        self.transaction_sorter_submenu_dispatch_table: dict[
-            str, Callable[[str, list[Transaction] | None], list[Transaction]]
-            ] = {
-            '1': self._sort_by_amount,
-            '2': self._sort_by_date,
-            '3': self._sort_by_id
-            }
         
     def run(self) -> None:
+        self._confirm_ignored_lines()
         while True:
             self._clear_screen()
             title = APP_TITLE
             self._console.print(title, style='bold blue')
+            if self._service.is_read_only:
+                read_only_warning = ptbuilder.build_orientation_panel(
+                    'Arquivo aberto em modo somente leitura. Não é possível alterar transações.'
+                )
+                self._console.print(read_only_warning, justify='center')
             self.show_dashboard()
             option: str = self._collect_main_menu_choice()
             if option == '0':
                 self._console.print('\n')
                 self._console.print('Obrigado por usar o FinController!', style='green')
+                self._service.close()
                 break
 
             command: Callable[[], None] = self._main_menu_dispatch_table.get(option)
@@ -77,13 +118,12 @@ class UserInterface:
     def show_dashboard(self) -> None:
         dashboard = ptbuilder.build_dashboard()
         self._console.print(dashboard)
-        transaction_list = self._service.get_all_transactions()
-        self._service.update_statistics(transaction_list)
+        self._service.update_statistics_for_date_range()
         statistics = self._service.get_statistics()
         transaction_count = statistics.transaction_count
         total_income = statistics.total_income
         total_expense = statistics.total_expense
-        balance = statistics.balance
+        balance = self._service.get_balance()
         formatted_number_of_transaction = Text(
             f'Você possui {transaction_count} transação(ões) contabilizada(s).', style='cyan'
         )
@@ -121,13 +161,25 @@ class UserInterface:
         return option
     
     def _add_transaction(self) -> None:
+        if self._service.is_read_only:
+            self._console.print('\n')
+            self._console.print('[red]Arquivo aberto em modo somente leitura: não é possível adicionar transações.[/]')
+            self._pause_and_clear()
+            return
+
         try:
             raw_data_dict = self._collect_transaction_info()
-            self._service.add_transaction(raw_data_dict)
+            unusual_expense = self._service.add_transaction(raw_data_dict)
 
             confirmation_msg = 'Transação adicionada com sucesso!'
             confirmation_panel = ptbuilder.build_confirmation_panel(confirmation_msg)
             self._console.print(confirmation_panel, justify='center')
+            if unusual_expense is not None:
+                typical_amount = formatter.format_currency_for_ptbr(unusual_expense.typical_amount)
+                self._console.print(
+                    f'[yellow]Atenção: despesa fora do padrão da categoria (típico: {typical_amount}).[/]',
+                    justify='center'
+                )
             self._pause_and_clear()
         except ValueError as e:
             self._console.print('\n')
@@ -169,6 +221,83 @@ class UserInterface:
 
         return raw_transaction_data_dict
 
+    def _import_csv(self) -> None:
+        if self._service.is_read_only:
+            self._console.print('\n')
+            self._console.print('[red]Arquivo aberto em modo somente leitura: não é possível importar transações.[/]')
+            self._pause_and_clear()
+            return
+
+        self._clear_screen()
+        self._print_section_title('Importar Extrato CSV')
+        file_path = Path(self._console.input('Digite o caminho do arquivo CSV: ').strip().strip('"'))
+        if not file_path.is_file():
+            self._console.print('\n')
+            self._console.print('[red]Arquivo não encontrado.[/]')
+            self._pause_and_clear()
+            return
+
+        mapping = self._collect_csv_column_mapping()
+        try:
+            with self._console.status('[cyan]Importando transações...[/]'):
+                report = self._service.import_csv(file_path, mapping)
+        except (ValueError, OSError) as e:
+            self._console.print('\n')
+            self._console.print(f'[red]Não foi possível importar o arquivo: {e}[/]')
+            self._pause_and_clear()
+            return
+
+        self._show_import_report(report)
+        self._pause_and_clear()
+
+    def _show_import_report(self, report: ImportReport) -> None:
+        MAX_DISPLAYED_ERRORS = 20
+
+        report_msg = (
+            f'[green]Transações importadas: {report.imported_count}[/]\n'
+            f'[red]Linhas rejeitadas: {report.error_count}[/]\n'
+            f'[cyan]Duplicadas ignoradas: {report.duplicate_count}[/]\n'
+            f'[yellow]Possíveis duplicadas importadas: {report.near_duplicate_count}[/]'
+        )
+        self._console.print('\n')
+        self._console.print(ptbuilder.build_import_report_panel(report_msg), justify='center')
+
+        if report.errors:
+            row_content = [
+                [str(error.line_number), error.message] for error in report.errors[:MAX_DISPLAYED_ERRORS]
+            ]
+            self._console.print(ptbuilder.build_import_error_table(row_content), justify='center')
+            if report.error_count > MAX_DISPLAYED_ERRORS:
+                self._console.print(
+                    f'[yellow]... e mais {report.error_count - MAX_DISPLAYED_ERRORS} linha(s) rejeitada(s).[/]',
+                    justify='center'
+                )
+
+        if report.duplicates:
+            row_content = [
+                [str(row.line_number), row.description, row.reason]
+                for row in report.duplicates[:MAX_DISPLAYED_ERRORS]
+            ]
+            self._console.print(ptbuilder.build_import_duplicate_table(row_content), justify='center')
+            if report.duplicate_count > MAX_DISPLAYED_ERRORS:
+                self._console.print(
+                    f'[yellow]... e mais {report.duplicate_count - MAX_DISPLAYED_ERRORS} duplicada(s) ignorada(s).[/]',
+                    justify='center'
+                )
+
+        if report.near_duplicates:
+            row_content = [
+                [str(row.line_number), row.description, row.reason]
+                for row in report.near_duplicates[:MAX_DISPLAYED_ERRORS]
+            ]
+            self._console.print(ptbuilder.build_import_near_duplicate_table(row_content), justify='center')
+            if report.near_duplicate_count > MAX_DISPLAYED_ERRORS:
+                self._console.print(
+                    f'[yellow]... e mais {report.near_duplicate_count - MAX_DISPLAYED_ERRORS} '
+                    'possível(is) duplicada(s).[/]',
+                    justify='center'
+                )
+
     # Métodos que representam os diversos submenus do programa e suas funcionalidades ---------------------------------
     def _manage_transactions(self) ->None:
         """
@@ -177,15 +306,14 @@ class UserInterface:
         """
         while True:
             self._clear_screen()
-            transaction_list = self._get_transaction_list_for_display()    
-            if not transaction_list:
+            self._update_statistics()
+            if self._service.get_statistics().transaction_count == 0:
                 self._console.print('\n')
                 self._console.print('[red]Não há nenhum item na sua lista de transações. Adicione um primeiro.[/]')
                 self._pause_and_clear()
                 break
 
-            self._service.update_statistics(transaction_list)
-            self._show_all_transactions(transaction_list)
+            self._show_all_transactions()
             if self._state_manager.has_active_filter():
                 filter_warning = ptbuilder.build_orientation_panel('Você possui um filtro ativo.')
                 self._console.print(filter_warning)
@@ -204,8 +332,7 @@ class UserInterface:
             command: Callable = self._transaction_management_submenu_dispatch_table.get(option)
             command()
         
-        if self._state_manager.has_active_filter():
-            self._state_manager.clear_filtered_list()
+        self._state_manager.clear()
     
     def _modify_transaction(self) -> None:
         """Apresenta um menu de possíveis modificações, captura a escolha do usuário e a executa"""
@@ -214,12 +341,11 @@ class UserInterface:
 
         while True:
             self._clear_screen()
-            transaction_list = self._get_transaction_list_for_display()
-            if not transaction_list:
+            self._update_statistics()
+            if self._service.get_statistics().transaction_count == 0:
                 return
 
-            self._service.update_statistics(transaction_list)
-            self._show_all_transactions(transaction_list)
+            self._show_all_transactions()
             if self._state_manager.has_active_filter():
                 filter_warning = ptbuilder.build_orientation_panel('Você possui um filtro ativo.')
                 self._console.print(filter_warning)
@@ -259,12 +385,11 @@ class UserInterface:
 
         while True:
             self._clear_screen()
-            transaction_list = self._get_transaction_list_for_display()
-            if not transaction_list:
+            self._update_statistics()
+            if self._service.get_statistics().transaction_count == 0:
                 return
-            
-            self._service.update_statistics(transaction_list)
-            self._show_all_transactions(transaction_list)
+
+            self._show_all_transactions()
             if self._state_manager.has_active_filter():
                 filter_warning = ptbuilder.build_orientation_panel('Você possui um filtro ativo.')
                 self._console.print(filter_warning)
@@ -277,17 +402,13 @@ class UserInterface:
             if option == '0':
                 return
             
-            if option == '5':
-                self._state_manager.clear_filtered_list()
+            if option == '6':
+                self._state_manager.clear()
                 continue
             
             try:
-                command: Callable[
-                    [list[Transaction]], list[Transaction]
-                    ] = self.transaction_filter_submenu_dispatch_table.get(option)
-                
-                transaction_list = command(transaction_list)
-                self._state_manager.set_filtered_list(transaction_list)
+                command: Callable[[], QueryCriteria] = self.transaction_filter_submenu_dispatch_table.get(option)
+                self._state_manager.add_filter(command())
 
             except ValueError as e:
                 self._console.print(f'[red]{e}[/]')
@@ -298,12 +419,11 @@ class UserInterface:
         transaction_sorter_choices = ptbuilder.get_transaction_sorter_submenu_choices()
 
         while True:
-            transaction_list = self._get_transaction_list_for_display()
-            if not transaction_list:
+            self._update_statistics()
+            if self._service.get_statistics().transaction_count == 0:
                 return
-            
-            self._service.update_statistics(transaction_list)
-            self._show_all_transactions(transaction_list)
+
+            self._show_all_transactions()
             if self._state_manager.has_active_filter():
                 filter_warning = ptbuilder.build_orientation_panel('Você possui um filtro ativo.')
                 self._console.print(filter_warning)
@@ -313,31 +433,33 @@ class UserInterface:
 
             if option == '0':
                 return
-            
-            try:
-                command: Callable[
-                    [list[Transaction]], list[Transaction]
-                    ] = self.transaction_sorter_submenu_dispatch_table.get(option)
-                
-                transaction_list = command(transaction_list)
-                self._state_manager.set_filtered_list(transaction_list)
-            
-            except ValueError as e:
-                self._console.print(f'[red]{e}[/]')
-                self._pause_and_clear()
+
+            self._state_manager.set_sort(self._collect_query_sort(option))
 
     def _show_report(self) -> None:
         self._clear_screen()
-        transaction_list = self._get_transaction_list_for_display()  
+        transaction_list = self._get_transaction_list_for_display()
         if not transaction_list:
             return
         
         statistics = self._service.get_statistics()
         start_date = self._service.get_min_date(transaction_list)
         end_date = self._service.get_max_date(transaction_list)
-        report_constructor = ReportConstructor(statistics, start_date, end_date)
-        overview_panel, income_overview_panel, expense_overview_panel, income_report_table, expense_report_table \
-        = report_constructor.generate_full_report()
+        largest_expenses = self._service.top_k(LARGEST_EXPENSES_COUNT, transaction_list, 'despesa')
+        monthly_series = self._service.aggregate_time_series(transaction_list, TimeBucket.MONTH, SeriesGroup.TYPE)
+        accumulated_balance = self._service.get_balance_as_of(end_date)
+        # Sem filtro ativo, rankings e janelas móveis vêm dos índices mantidos a cada inclusão
+        filtered_list = transaction_list if self._state_manager.has_active_filter() else None
+        top_descriptions = self._service.get_top_descriptions(TOP_DESCRIPTIONS_COUNT, filtered_list)
+        rolling_windows = self._service.get_rolling_windows(filtered_list)
+        unusual_expenses = self._service.get_unusual_expenses(filtered_list)[:UNUSUAL_EXPENSES_COUNT]
+        report_constructor = ReportConstructor(
+            statistics, start_date, end_date, largest_expenses, monthly_series, accumulated_balance, top_descriptions,
+            rolling_windows, unusual_expenses
+        )
+        overview_panel, income_overview_panel, expense_overview_panel, income_report_table, expense_report_table, \
+        largest_expenses_table, unusual_expenses_table, monthly_report_table, rolling_windows_table, \
+        top_by_amount_table, top_by_count_table = report_constructor.generate_full_report()
 
         self._console.print(overview_panel)
         self._console.print(income_overview_panel)
@@ -346,48 +468,108 @@ class UserInterface:
             self._console.print(income_report_table)
         if expense_report_table.row_count > 0:
             self._console.print(expense_report_table)
+        if largest_expenses_table.row_count > 0:
+            self._console.print(largest_expenses_table)
+        if unusual_expenses_table.row_count > 0:
+            self._console.print(unusual_expenses_table)
+        # Com um único mês não há o que comparar
+        if monthly_report_table.row_count > 1:
+            self._console.print(monthly_report_table)
+        if rolling_windows_table.row_count > 0:
+            self._console.print(rolling_windows_table)
+        if top_by_amount_table.row_count > 0:
+            self._console.print(top_by_amount_table)
+        if top_by_count_table.row_count > 0:
+            self._console.print(top_by_count_table)
         self._pause_and_clear()
 
+    def _export_transactions(self) -> None:
+        """
+        Exporta a lista exibida (com o filtro/ordenação ativos) para um arquivo. As transações são lidas da
+        consulta página a página enquanto o arquivo é escrito.
+        """
+        transaction_count = self._service.get_statistics().transaction_count
+        if transaction_count == 0:
+            return
+
+        export_format_menu = ptbuilder.build_export_format_menu()
+        export_format_choices = ptbuilder.get_export_format_choices()
+
+        self._console.print('\n')
+        self._console.print(export_format_menu, justify='center')
+        option = PromptPTBR.ask('Digite o número do formato desejado', choices=export_format_choices)
+        if option == '0':
+            return
+
+        export_format = self._export_format_table.get(option)
+        default_file_name = f'transacoes.{export_format.value}'
+        file_path = Path(
+            self._console.input(f'Digite o caminho do arquivo de destino ({default_file_name}): ').strip().strip('"')
+            or default_file_name
+        )
+        if not file_path.suffix:
+            file_path = file_path.with_suffix(f'.{export_format.value}')
+
+        try:
+            with Progress(console=self._console, transient=True) as progress:
+                task = progress.add_task('[cyan]Exportando transações...[/]', total=transaction_count)
+                exported_count = self._service.export_transactions(
+                    self._service.iter_query(self._state_manager.criteria, self._state_manager.sort),
+                    file_path,
+                    export_format,
+                    lambda count: progress.update(task, completed=count)
+                )
+        except (OSError, ValueError) as e:
+            self._console.print(f'[red]Não foi possível exportar a lista: {e}[/]')
+            self._pause_and_clear()
+            return
+
+        confirmation_msg = f'{exported_count} transação(ões) exportada(s) para {file_path}'
+        self._console.print(ptbuilder.build_confirmation_panel(confirmation_msg), justify='center')
+        self._pause_and_clear()
+
+    def _browse_transactions(self) -> None:
+        """
+        Percorre as transações (com os filtros ativos) página a página com a consulta paginada do serviço (ver
+        TransactionPager): cada página é buscada só quando exibida ou pré-montada.
+        """
+        BROWSE_PAGE_SIZE = 50
+
+        transaction_sorter_submenu = ptbuilder.build_transaction_sorter_submenu()
+        transaction_sorter_choices = ptbuilder.get_transaction_sorter_submenu_choices()
+        self._console.print('\n')
+        self._console.print(transaction_sorter_submenu, justify='center')
+        option = PromptPTBR.ask('Digite o número da ordenação desejada', choices=transaction_sorter_choices)
+        if option == '0':
+            return
+
+        sort = self._collect_query_sort(option)
+        self._update_statistics()
+        pager = TransactionPager(
+            partial(self._service.query, self._state_manager.criteria, sort),
+            self._service.get_statistics(),
+            BROWSE_PAGE_SIZE,
+            self._service.get_running_balances
+        )
+        self._clear_screen()
+        self._page_through(pager)
+
     # Métodos para atualizar dados individuais (categoria ou descrição) ou excluir uma transação da lista -------------
     def _del_transaction(self, transaction_id: int) -> None:
         self._service.del_transaction(transaction_id)
 
-        if self._state_manager.has_active_filter():
-            self._state_manager.del_from_filtered_list(transaction_id)
-
     def _update_category(self, transaction_id: int) -> None:
-        orientation_msg = 'Nota: Alterar a categoria de uma transação' \
-        ' irá resetar o filtro de transações se houver um ativo.'
-        orientation_panel = ptbuilder.build_orientation_panel(orientation_msg)
-
-        self._console.print(orientation_panel)
         transaction_type = self._service.get_transaction_type(transaction_id)
 
         new_category = self._collect_category(transaction_type)
         self._service.update_transaction_category(transaction_id, new_category)
-        
-        if self._state_manager.has_active_filter():
-            self._state_manager.clear_filtered_list()
 
     def _update_description(self, transaction_id: int) -> None:
         new_description = self._collect_description()
         self._service.update_transaction_description(transaction_id, new_description)
 
     # Métodos individuais para as opções de ordenação -----------------------------------------------------------------
-    def _sort_by_amount(self, transaction_list : list[Transaction] | None) -> list[Transaction]:
-        sort_order_menu = ptbuilder.build_transaction_sort_order_submenu()
-        sort_order_choices = ptbuilder.get_transaction_sort_order_choices()
-
-        self._console.print(sort_order_menu, justify='center')
-        option = PromptPTBR.ask('Digite o número da ordenação desejada', choices=sort_order_choices)
-        order = 'crescente' if option == '1' else 'decrescente'
-
-        if transaction_list is None:
-            return self._service.sort_by_amount(order)
-        
-        return self._service.sort_by_amount(order, transaction_list)
-
-    def _sort_by_date(self, transaction_list : list[Transaction] | None) -> list[Transaction]:
+    def _collect_query_sort(self, sort_field_option: str) -> QuerySort:
         sort_order_menu = ptbuilder.build_transaction_sort_order_submenu()
         sort_order_choices = ptbuilder.get_transaction_sort_order_choices()
 
@@ -395,26 +577,10 @@ class UserInterface:
         option = PromptPTBR.ask('Digite o número da ordenação desejada', choices=sort_order_choices)
         order = 'crescente' if option == '1' else 'decrescente'
 
-        if transaction_list is None:
-            return self._service.sort_by_date(order)
-        
-        return self._service.sort_by_date(order, transaction_list)
-
-    def _sort_by_id(self, transaction_list : list[Transaction] | None) -> list[Transaction]:
-        sort_order_menu = ptbuilder.build_transaction_sort_order_submenu()
-        sort_order_choices = ptbuilder.get_transaction_sort_order_choices()
-
-        self._console.print(sort_order_menu, justify='center')
-        option = PromptPTBR.ask('Digite o número da ordenação desejada', choices=sort_order_choices)
-        order = 'crescente' if option == '1' else 'decrescente'
-
-        if transaction_list is None:
-            return self._service.sort_by_id(order)
-        
-        return self._service.sort_by_id(order, transaction_list)
+        return self._service.build_query_sort(self._sort_field_table.get(sort_field_option), order)
 
     # Métodos individuais para as opções de filtragem -----------------------------------------------------------------
-    def _filter_by_amount(self, transaction_list: list[Transaction]) -> list[Transaction]:
+    def _filter_by_amount(self) -> QueryCriteria:
         orientation_msg = 'Você pode omitir um dos valores abaixos para a filtragem.'
         orientation_panel = ptbuilder.build_orientation_panel(orientation_msg)
 
@@ -422,14 +588,14 @@ class UserInterface:
         start_amount: str = self._console.input('Digite o valor inicial de filtragem: ').strip() or None
         end_amount: str = self._console.input('Digite o valor final de filtragem: ').strip() or None
 
-        return self._service.filter_by_amount_range(transaction_list, start_amount, end_amount)
+        return self._service.build_query_criteria(start_amount=start_amount, end_amount=end_amount)
     
-    def _filter_by_type(self, transaction_list: list[Transaction]) -> list[Transaction]:
+    def _filter_by_type(self) -> QueryCriteria:
         transaction_type: str = self._collect_transaction_type()
 
-        return self._service.filter_by_type(transaction_type, transaction_list)
+        return self._service.build_query_criteria(transaction_type=transaction_type)
     
-    def _filter_by_date(self, transaction_list: list[Transaction]) -> list[Transaction]:
+    def _filter_by_date(self) -> QueryCriteria:
         orientation_msg = 'Você pode omitir uma das datas abaixos para a filtragem.'
         orientation_panel = ptbuilder.build_orientation_panel(orientation_msg)
         DATE_FORMAT = """[yellow]DD/MM/AAAA
@@ -442,9 +608,9 @@ Exemplo: 01/01/2025[/]"""
         start_date: str = self._console.input('Digite a data inicial de filtragem: ').strip() or None
         end_date: str = self._console.input('Digite a data final de filtragem: ').strip() or None
         
-        return self._service.filter_by_date_range(transaction_list, start_date, end_date)
+        return self._service.build_query_criteria(start_date=start_date, end_date=end_date)
 
-    def _filter_by_category(self, transaction_list: list[Transaction]) -> list[Transaction]:
+    def _filter_by_category(self) -> QueryCriteria:
         all_categories_menu = ptbuilder.build_all_categories_filter_menu()
         all_categories_choices = ptbuilder.get_all_categories_choices()
 
@@ -456,10 +622,17 @@ Exemplo: 01/01/2025[/]"""
         )
         category: str = ALL_CATEGORIES_TABLE.get(category_option)
 
-        if transaction_list is None:
-            return self._service.filter_by_category(category)
-        
-        return self._service.filter_by_category(category, transaction_list)
+        return self._service.build_query_criteria(category=category)
+
+    def _filter_by_description(self) -> QueryCriteria:
+        orientation_msg = 'Digite uma ou mais palavras (ou trechos) da descrição. Maiúsculas e acentos são ignorados.'
+        orientation_panel = ptbuilder.build_orientation_panel(orientation_msg)
+
+        self._console.print('\n')
+        self._console.print(orientation_panel)
+        query: str = self._console.input('Digite o termo de busca: ').strip()
+
+        return self._service.build_query_criteria(description=query)
 
     # Métodos de coleta de dados individuais --------------------------------------------------------------------------
     def _collect_amount(self) -> str:
@@ -532,13 +705,16 @@ Exemplo: 01/01/2025[/]"""
             
     def _collect_description(self) -> str | None:
         description_note = '[yellow]Nota: Este campo é opcional, pressione enter para pula-lo.[/]'
+        if readline is not None:
+            description_note += '\n[yellow]Pressione Tab para completar com descrições já usadas.[/]'
 
         description_panel = ptbuilder.build_orientation_panel(description_note)
 
         while True:
             self._console.print('\n')
             self._console.print(description_panel)
-            description = self._console.input('Digite uma descrição para a transação: ')
+            with self._description_completion():
+                description = self._console.input('Digite uma descrição para a transação: ')
             self._console.print('\n')
 
             if not self._validate_description_format(description):
@@ -547,6 +723,61 @@ Exemplo: 01/01/2025[/]"""
 
             return description if description else None
 
+    def _collect_csv_column_mapping(self) -> CsvColumnMapping:
+        """Pergunta o nome de cada coluna do extrato. Enter mantém o nome padrão e '-' indica que a coluna não existe."""
+        orientation_msg = 'Pressione enter para manter o nome padrão da coluna, ou digite "-" se ela não existir.\n' \
+        'Sem a coluna de tipo, valores negativos são importados como despesas.'
+        self._console.print('\n')
+        self._console.print(ptbuilder.build_orientation_panel(orientation_msg))
+
+        default_mapping = CsvColumnMapping()
+        amount = PromptPTBR.ask('Coluna do valor', default=default_mapping.amount)
+        transaction_date = PromptPTBR.ask('Coluna da data', default=default_mapping.transaction_date)
+        transaction_type = PromptPTBR.ask('Coluna do tipo', default=default_mapping.transaction_type)
+        category = PromptPTBR.ask('Coluna da categoria', default=default_mapping.category)
+        description = PromptPTBR.ask('Coluna da descrição', default=default_mapping.description)
+        delimiter = PromptPTBR.ask('Separador de colunas', default=default_mapping.delimiter)
+
+        return CsvColumnMapping(
+            amount=amount,
+            transaction_date=transaction_date,
+            transaction_type=None if transaction_type == '-' else transaction_type,
+            category=None if category == '-' else category,
+            description=None if description == '-' else description,
+            delimiter=delimiter
+        )
+
+    @contextmanager
+    def _description_completion(self) -> Iterator[None]:
+        """Ativa o autocompletar por Tab (readline) com as descrições mais usadas, apenas durante a digitação."""
+        if readline is None:
+            yield
+            return
+
+        suggestions: list[str] = []
+
+        def complete(text: str, state: int) -> str | None:
+            # O readline chama com state = 0, 1, 2... até receber None; as sugestões são buscadas só na primeira.
+            if state == 0:
+                suggestions[:] = self._service.suggest_descriptions(readline.get_line_buffer())
+            return suggestions[state] if state < len(suggestions) else None
+
+        previous_completer = readline.get_completer()
+        previous_delims = readline.get_completer_delims()
+        readline.set_completer(complete)
+        readline.set_completer_delims('')  # A descrição inteira é o texto a completar
+        readline.parse_and_bind('bind ^I rl_complete' if _USES_LIBEDIT else 'tab: complete')
+        try:
+            yield
+        finally:
+            readline.set_completer(previous_completer)
+            readline.set_completer_delims(previous_delims)
+            # Com o GNU readline, o módulo do Python liga o Tab a inserir tabulação; sem isso, os prompts
+            # seguintes continuariam completando ao pressionar Tab. O libedit não tem tab-insert: lá basta
+            # devolver o completer anterior.
+            if not _USES_LIBEDIT:
+                readline.parse_and_bind('tab: tab-insert')
+
     # Métodos internos de validação por regex -------------------------------------------------------------------------
     def _validate_amount_format(self, amount_str: str) -> bool:
         if not bool(re.fullmatch(AMOUNT_PATTERN, amount_str)):
@@ -567,25 +798,104 @@ Exemplo: 01/01/2025[/]"""
         return True
 
     # Métodos internos útilitários ------------------------------------------------------------------------------------
+    def _confirm_ignored_lines(self) -> None:
+        """Avisa sobre linhas do arquivo de dados que não puderam ser carregadas e pergunta se podem ser apagadas."""
+        ignored_line_count = self._service.ignored_line_count
+        if not ignored_line_count:
+            return
+
+        warning = ptbuilder.build_orientation_panel(
+            f'{ignored_line_count} linha(s) do arquivo de dados estão corrompidas ou inválidas e foram ignoradas. '
+            'Excluir ou editar transações regrava o arquivo e as apaga.'
+        )
+        self._console.print(warning, justify='center')
+        option = PromptPTBR.ask('Descartar essas linhas (uma cópia do arquivo será mantida)?', choices=['s', 'n'])
+        if option == 's':
+            backup_path = self._service.discard_ignored_lines()
+            self._console.print(f'Cópia do arquivo original gravada em {backup_path}', style='green')
+        else:
+            self._console.print('As linhas serão mantidas; exclusões e edições ficam bloqueadas.', style='yellow')
+        self._pause_and_clear('\nPressione enter para continuar...')
+
+    def _update_statistics(self) -> None:
+        """
+        Estatísticas das transações que atendem aos filtros ativos. Sem filtros (ou só com um intervalo de datas),
+        vêm dos índices do serviço; com outros filtros, são calculadas percorrendo a consulta página a página.
+        """
+        criteria = self._state_manager.criteria
+        if criteria.is_date_range_only:
+            self._service.update_statistics_for_date_range(criteria.start_date, criteria.end_date)
+        else:
+            self._service.update_statistics(self._service.iter_query(criteria))
+
     def _get_transaction_list_for_display(self) -> list[Transaction]:
-            if self._state_manager.has_active_filter():
-                transaction_list = self._state_manager.filtered_list
-            
-            else:
-                transaction_list = self._service.get_all_transactions()
+        """Lista com os filtros e a ordenação ativos, para quem precisa dela inteira (ex: o relatório)."""
+        if self._state_manager.has_active_filter() or self._state_manager.sort != QuerySort():
+            return list(self._service.iter_query(self._state_manager.criteria, self._state_manager.sort))
 
-            return transaction_list
+        return self._service.get_all_transactions()
     
-    def _show_all_transactions(self, transaction_list: list[Transaction]) -> list[Transaction]:
-        """Mostra a lista de todas as transações no terminal"""
-        statistics = self._service.get_statistics()
-        transaction_table: Table = ptbuilder.build_transaction_table(transaction_list, statistics)
+    def _show_all_transactions(self) -> None:
+        """
+        Mostra as transações com os filtros e a ordenação ativos. Listas maiores que PAGER_PAGE_SIZE são
+        exibidas por páginas (ver TransactionPager), e o usuário navega entre elas antes de ver o menu.
+        """
+        PAGER_PAGE_SIZE = 50
 
+        pager = TransactionPager(
+            partial(self._service.query, self._state_manager.criteria, self._state_manager.sort),
+            self._service.get_statistics(),
+            PAGER_PAGE_SIZE,
+            self._service.get_running_balances
+        )
+        self._page_through(pager, exit_label='Ir para o Menu')
+
+    def _page_through(self, pager: TransactionPager, exit_label: str = 'Voltar') -> None:
+        """Exibe a primeira página e, havendo outras, deixa o usuário navegar entre elas até sair."""
+        page_number = 1
+        while True:
+            self._print_transaction_table(pager.get_table(page_number))
+            if pager.page_count == 1:
+                return
+
+            pager.prefetch(page_number)
+            has_previous_page = page_number > 1
+            has_next_page = page_number < pager.page_count
+            self._console.print('\n')
+            self._console.print(
+                ptbuilder.build_page_navigation_menu(
+                    has_previous_page, has_next_page, can_jump=True, exit_label=exit_label
+                ),
+                justify='center'
+            )
+            option = PromptPTBR.ask(
+                'Digite o número da opção desejada',
+                choices=ptbuilder.get_page_navigation_choices(has_previous_page, has_next_page, can_jump=True)
+            )
+            match option:
+                case '1':
+                    page_number += 1
+                case '2':
+                    page_number -= 1
+                case '3':
+                    page_number = self._collect_page_number(pager.page_count)
+                case _:
+                    return
+
+            self._clear_screen()
+
+    def _collect_page_number(self, page_count: int) -> int:
+        while True:
+            page_number = IntPromptPTBR.ask(f'Digite o número da página (1 a {page_count})')
+            if 1 <= page_number <= page_count:
+                return page_number
+
+            self._console.print('[red]Página inexistente.[/]')
+
+    def _print_transaction_table(self, transaction_table: Table) -> None:
         self._console.print(Rule('[bold blue]Lista de Transações[/]', style='cyan'))
-        self._console.print('\n')        
+        self._console.print('\n')
         self._console.print(transaction_table, justify='center')
-
-        return transaction_list
     
     def _print_section_title(self, rule_title: str, characters: str = '─') -> None:
         self._console.print(Rule(f'\n[bold blue]{rule_title}[/]', style='cyan', characters=characters))
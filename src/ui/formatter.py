@@ -11,18 +11,39 @@ except Exception:
 
 
 from src.models.transaction import TransactionType, IncomeCategory, ExpenseCategory
+from src.models.reservoir_sample import DEFAULT_CONFIDENCE
 from src.utils.constants import DATE_FORMAT
 
 
 def format_currency_for_ptbr(amount: float | int) -> str:
     return locale.currency(amount, grouping=True)
 
+def format_quantile(amount: float | int, bounds: tuple[float | int, float | int] | None = None) -> str:
+    """Valor de mediana ou percentil; para estimativas, acompanhado do intervalo de confiança."""
+    if bounds is None:
+        return format_currency_for_ptbr(amount)
+
+    low, high = bounds
+    return (
+        f'{format_currency_for_ptbr(amount)} '
+        f'(entre {format_currency_for_ptbr(low)} e {format_currency_for_ptbr(high)})'
+    )
+
+def format_approximation_note(sample_size: int, rank_error: float) -> str:
+    return (
+        f'Mediana e percentis aproximados: amostra de {sample_size} transações, '
+        f'erro de posição de até ±{rank_error:.1f} p.p. ({DEFAULT_CONFIDENCE:.0%} de confiança)'
+    )
+
 def format_transaction_type(transaction_type: TransactionType) -> str:
     return transaction_type.value.capitalize()
 
 def format_date(transaction_date: date) -> str:
     return transaction_date.strftime(DATE_FORMAT)
 
+def format_month(month_start: date) -> str:
+    return month_start.strftime('%m/%Y')
+
 def format_category(category: IncomeCategory | ExpenseCategory) -> str:
     return category.value.capitalize()
 
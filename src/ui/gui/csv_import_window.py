@@ -0,0 +1,185 @@
+from pathlib import Path
+
+from PySide6.QtWidgets import (
+    QDialog,
+    QFormLayout,
+    QLineEdit,
+    QLabel,
+    QWidget,
+    QPushButton,
+    QHBoxLayout,
+    QVBoxLayout,
+    QFrame,
+    QFileDialog,
+)
+from PySide6.QtCore import Qt
+
+from src.service.csv_importer import CsvColumnMapping
+from src.utils.constants import WINDOW_ICON
+
+
+class CsvImportWindow(QDialog):
+    """
+    Janela para escolher o extrato CSV e informar o nome de cada coluna.
+    Campos opcionais deixados em branco indicam que o extrato não possui a coluna.
+    """
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+
+        self._file_path: Path | None = None
+        self._column_mapping = CsvColumnMapping()
+
+        # Layouts ----------------------------------------------------------------------
+        self._main_layout = QVBoxLayout()
+        self._card_layout = QVBoxLayout()
+        self._form_layout = QFormLayout()
+        self._file_layout = QHBoxLayout()
+        self._buttons_layout = QHBoxLayout()
+
+        # Frame-------------------------------------------------------------------------
+        self._main_card = QFrame()
+
+        # Line Edits -------------------------------------------------------------------
+        self._file_path_line = QLineEdit()
+
+        self._amount_column = QLineEdit(self._column_mapping.amount)
+        self._date_column = QLineEdit(self._column_mapping.transaction_date)
+        self._type_column = QLineEdit(self._column_mapping.transaction_type)
+        self._category_column = QLineEdit(self._column_mapping.category)
+        self._description_column = QLineEdit(self._column_mapping.description)
+        self._delimiter = QLineEdit(self._column_mapping.delimiter)
+
+        # Buttons ----------------------------------------------------------------------
+        self._browse_button = QPushButton("Procurar...")
+        self._confirm_button = QPushButton("Importar")
+        self._cancel_button = QPushButton("Cancelar")
+
+        # Labels -----------------------------------------------------------------------
+        self._title_label = QLabel("Importar Extrato CSV")
+        self._note_label = QLabel(
+            "Deixe tipo, categoria ou descrição em branco se o extrato não tiver a "
+            "coluna. Sem a coluna de tipo, valores negativos viram despesas."
+        )
+
+        self._setup_user_interface()
+
+    @property
+    def file_path(self) -> Path | None:
+        return self._file_path
+
+    @property
+    def column_mapping(self) -> CsvColumnMapping:
+        return self._column_mapping
+
+    def _setup_user_interface(self) -> None:
+        self.setWindowTitle("Importar Extrato CSV")
+        self.setWindowIcon(WINDOW_ICON)
+        self.setMinimumWidth(600)
+
+        self._config_labels()
+        self._config_frame()
+        self._config_layout()
+        self._config_lines()
+        self._config_buttons()
+
+        self.setLayout(self._main_layout)
+
+    def _config_lines(self) -> None:
+        lines = (
+            self._file_path_line,
+            self._amount_column,
+            self._date_column,
+            self._type_column,
+            self._category_column,
+            self._description_column,
+            self._delimiter,
+        )
+        for line in lines:
+            line.setTextMargins(5, 2, 5, 2)
+
+        self._file_path_line.setPlaceholderText("Selecione o arquivo .csv")
+        self._file_path_line.textChanged.connect(self._on_file_path_changed)
+        self._delimiter.setMaxLength(1)
+
+    def _config_buttons(self) -> None:
+        self._browse_button.clicked.connect(self._on_browse_button_clicked)
+        self._confirm_button.clicked.connect(self._on_confirm_button_clicked)
+        self._cancel_button.clicked.connect(self.reject)
+
+        self._confirm_button.setEnabled(False)
+
+        self._confirm_button.setObjectName("confirmButton")
+        self._confirm_button.setProperty("class", "primaryButton")
+        self._browse_button.setProperty("class", "secondaryButton")
+        self._cancel_button.setProperty("class", "secondaryButton")
+
+        self._confirm_button.setMinimumHeight(36)
+        self._browse_button.setMinimumHeight(36)
+        self._cancel_button.setMinimumHeight(36)
+
+    def _config_labels(self) -> None:
+        self._title_label.setObjectName("TitleLabel")
+        self._note_label.setWordWrap(True)
+
+    def _config_layout(self) -> None:
+        self._file_layout.addWidget(self._file_path_line)
+        self._file_layout.addWidget(self._browse_button)
+
+        self._form_layout.addRow(QLabel("Arquivo: "), self._file_layout)
+        self._form_layout.addRow(QLabel("Coluna do valor: "), self._amount_column)
+        self._form_layout.addRow(QLabel("Coluna da data: "), self._date_column)
+        self._form_layout.addRow(QLabel("Coluna do tipo: "), self._type_column)
+        self._form_layout.addRow(QLabel("Coluna da categoria: "), self._category_column)
+        self._form_layout.addRow(
+            QLabel("Coluna da descrição: "), self._description_column
+        )
+        self._form_layout.addRow(QLabel("Separador: "), self._delimiter)
+
+        self._buttons_layout.addStretch()
+        self._buttons_layout.addWidget(self._confirm_button)
+        self._buttons_layout.addWidget(self._cancel_button)
+
+        self._card_layout.addWidget(
+            self._title_label, alignment=Qt.AlignmentFlag.AlignHCenter
+        )
+        self._card_layout.addSpacing(12)
+        self._card_layout.addLayout(self._form_layout)
+        self._card_layout.addWidget(self._note_label)
+        self._card_layout.addSpacing(12)
+        self._card_layout.addLayout(self._buttons_layout)
+
+        self._card_layout.setContentsMargins(16, 16, 16, 16)
+        self._card_layout.setSpacing(12)
+
+        self._main_layout.addWidget(self._main_card)
+        self._main_layout.setContentsMargins(16, 16, 16, 16)
+        self._main_layout.setSpacing(12)
+
+    def _config_frame(self) -> None:
+        self._main_card.setLayout(self._card_layout)
+        self._main_card.setObjectName("Card")
+
+    # Métodos utilitários e slots ------------------------------------------------------
+    def _on_browse_button_clicked(self) -> None:
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Selecionar Extrato", "", "Arquivos CSV (*.csv);;Todos (*)"
+        )
+        if file_path:
+            self._file_path_line.setText(file_path)
+
+    def _on_file_path_changed(self, text: str) -> None:
+        self._confirm_button.setEnabled(bool(text.strip()))
+
+    def _on_confirm_button_clicked(self) -> None:
+        self._file_path = Path(self._file_path_line.text().strip())
+        self._column_mapping = CsvColumnMapping(
+            amount=self._amount_column.text().strip(),
+            transaction_date=self._date_column.text().strip(),
+            transaction_type=self._type_column.text().strip() or None,
+            category=self._category_column.text().strip() or None,
+            description=self._description_column.text().strip() or None,
+            delimiter=self._delimiter.text() or self._column_mapping.delimiter,
+        )
+
+        self.accept()
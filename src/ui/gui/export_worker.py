@@ -0,0 +1,57 @@
+from collections.abc import Iterable
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from src.service.transaction_service import TransactionService
+from src.models.transaction import Transaction
+from src.models.enums import ExportFormat
+
+
+class ExportWorker(QObject):
+    """
+    Executa a exportação fora da thread da interface (ver MainWindow._on_export_clicked).
+
+    progress emite o número de transações já gravadas; cancel pode ser chamado de outra thread,
+    e a exportação para na próxima verificação de progresso.
+    """
+
+    progress = Signal(int)
+    finished = Signal(int)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        service: TransactionService,
+        transaction_list: Iterable[Transaction],
+        file_path: Path,
+        export_format: ExportFormat,
+    ) -> None:
+        super().__init__()
+        self._service = service
+        self._transaction_list = transaction_list
+        self._file_path = file_path
+        self._export_format = export_format
+        self._is_cancelled = False
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def run(self) -> None:
+        try:
+            exported_count = self._service.export_transactions(
+                self._transaction_list,
+                self._file_path,
+                self._export_format,
+                self.progress.emit,
+                lambda: self._is_cancelled,
+            )
+        except (OSError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+
+        self.finished.emit(exported_count)
+
+    def cancel(self) -> None:
+        self._is_cancelled = True
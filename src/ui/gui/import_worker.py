@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from src.service.transaction_service import TransactionService
+from src.service.csv_importer import CsvColumnMapping
+
+
+class ImportWorker(QObject):
+    """
+    Executa a importação de um CSV fora da thread da interface (ver MainWindow._on_import_csv_clicked).
+
+    progress emite o número de transações já incluídas no livro; finished emite o ImportReport.
+    """
+
+    progress = Signal(int)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        service: TransactionService,
+        file_path: Path,
+        column_mapping: CsvColumnMapping,
+    ) -> None:
+        super().__init__()
+        self._service = service
+        self._file_path = file_path
+        self._column_mapping = column_mapping
+
+    def run(self) -> None:
+        try:
+            report = self._service.import_csv(
+                self._file_path,
+                self._column_mapping,
+                progress_callback=self.progress.emit,
+            )
+        except (ValueError, OSError) as e:
+            self.failed.emit(str(e))
+            return
+        except Exception as e:
+            # Rede de segurança: sem finished nem failed, o diálogo de progresso ficaria aberto
+            self.failed.emit(f"Erro inesperado: {e}")
+            return
+
+        self.finished.emit(report)
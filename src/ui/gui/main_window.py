@@ -1,5 +1,9 @@
 """Define a janela principal da aplicação FinController."""
 
+from dataclasses import replace
+from collections.abc import Iterable
+from pathlib import Path
+
 from PySide6.QtWidgets import (
     QWidget,
     QMainWindow,
@@ -12,8 +16,12 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QFrame,
     QSizePolicy,
+    QFileDialog,
+    QProgressDialog,
+    QLineEdit,
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QThread, QTimer
+from PySide6.QtGui import QCloseEvent
 
 from src.ui.gui.table_model import TableModel
 from src.ui.gui.transaction_form_window import (
@@ -25,8 +33,20 @@ from src.ui.gui.transaction_filter_window import (
     SortingFieldCode,
 )
 from src.ui.gui.report_window import ReportWindow
-from src.service.transaction_service import TransactionService
+from src.ui.gui.csv_import_window import CsvImportWindow
+from src.ui.gui.export_worker import ExportWorker
+from src.ui.gui.import_worker import ImportWorker
+from src.service.transaction_service import TransactionService, PAGE_SIZE
+from src.service.csv_importer import ImportReport
 from src.models.transaction import Transaction
+from src.models.enums import (
+    ExportFormat,
+    SortField,
+    StorageFormat,
+    TimeBucket,
+    SeriesGroup,
+)
+from src.models.query import QueryCriteria, QuerySort, QueryPage
 
 from src.utils.constants import (
     ADD_ICON,
@@ -34,16 +54,53 @@ from src.utils.constants import (
     DELETE_ICON,
     FILTER_ICON,
     REPORT_ICON,
+    IMPORT_ICON,
+    EXPORT_ICON,
     WINDOW_ICON,
+    LARGEST_EXPENSES_COUNT,
+    TOP_DESCRIPTIONS_COUNT,
+    UNUSUAL_EXPENSES_COUNT,
 )
 
 
 class MainWindow(QMainWindow):
     """Janela principal da aplicação FinController."""
 
-    def __init__(self, parent: QWidget | None = None) -> None:
+    SEARCH_DEBOUNCE_MS = 250
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        storage_format: StorageFormat = StorageFormat.JSON,
+        archive_path: Path | None = None,
+        load_workers: int = 1,
+        approximate_statistics: bool = False,
+    ) -> None:
         super().__init__(parent)
-        self._service = TransactionService()
+        self._service = TransactionService(
+            storage_format,
+            archive_path=archive_path,
+            load_workers=load_workers,
+            approximate_statistics=approximate_statistics,
+        )
+
+        # Exportação em segundo plano (ver _on_export_clicked) ---------------------------
+        self._export_thread: QThread | None = None
+        self._export_worker: ExportWorker | None = None
+        self._export_progress: QProgressDialog | None = None
+        self._export_file_path: Path | None = None
+
+        # Importação em segundo plano (ver _on_import_csv_clicked) -----------------------
+        self._import_thread: QThread | None = None
+        self._import_worker: ImportWorker | None = None
+        self._import_progress: QProgressDialog | None = None
+
+        # Consulta exibida na tabela, carregada por páginas (ver _set_table_query) --------
+        self._query_criteria = QueryCriteria()
+        self._query_sort = QuerySort()
+
+        # Busca enquanto digita (ver _on_search_timeout) -------------------------------
+        self._search_timer = QTimer(self)
 
         # Central Widget e Layouts -----------------------------------------------------
         self.central_window = QWidget()
@@ -61,6 +118,11 @@ class MainWindow(QMainWindow):
         self.delete_button = QPushButton("Excluir\nTransação")
         self.filter_button = QPushButton("Filtrar/Ordernar")
         self.report_button = QPushButton("Gerar\nRelatório")
+        self.import_button = QPushButton("Importar\nCSV")
+        self.export_button = QPushButton("Exportar\nLista")
+
+        # Barra de busca ---------------------------------------------------------------
+        self.search_line = QLineEdit()
 
         # Tabela e Modelo --------------------------------------------------------------
         self.table = QTableView()
@@ -73,10 +135,15 @@ class MainWindow(QMainWindow):
         )
 
         self.configure_user_interface()
+        # Depois que a janela for exibida, para que a pergunta apareça sobre ela
+        QTimer.singleShot(0, self._confirm_ignored_lines)
 
     def configure_user_interface(self) -> None:
         """Configura a interface gráfica do usuário."""
-        self.setWindowTitle("FinController")
+        if self._service.is_read_only:
+            self.setWindowTitle("FinController (somente leitura)")
+        else:
+            self.setWindowTitle("FinController")
         self.setFixedSize(1200, 800)
         self.setWindowIcon(WINDOW_ICON)
 
@@ -90,6 +157,7 @@ class MainWindow(QMainWindow):
         self._configure_frame()
         self._configure_table()
         self._configure_buttons()
+        self._configure_search()
 
     def _configure_layout(self) -> None:
         self.button_layout.addWidget(self.add_button)
@@ -97,6 +165,8 @@ class MainWindow(QMainWindow):
         self.button_layout.addWidget(self.delete_button)
         self.button_layout.addWidget(self.filter_button)
         self.button_layout.addWidget(self.report_button)
+        self.button_layout.addWidget(self.import_button)
+        self.button_layout.addWidget(self.export_button)
 
         self.main_layout.addWidget(self.main_card)
 
@@ -106,11 +176,11 @@ class MainWindow(QMainWindow):
 
         self.card_layout.addLayout(self.button_layout)
         self.card_layout.addSpacing(12)
+        self.card_layout.addWidget(self.search_line)
 
-        transactions = self._service.get_all_transactions()
-        if transactions:
+        self._set_table_query()
+        if self.table_model.rowCount() > 0:
             self.card_layout.addWidget(self.table)
-            self.table_model.set_transaction_list(transactions)
 
         else:
             self.card_layout.addWidget(self.no_table_label)
@@ -141,6 +211,8 @@ class MainWindow(QMainWindow):
         vertical_header.setVisible(False)
 
         table.setModel(self.table_model)
+        self.table_model.set_running_balance_loader(self._service.get_running_balances)
+        self.table_model.set_unusual_expense_loader(self._service.get_unusual_expense)
         table.setSelectionBehavior(table.SelectionBehavior.SelectRows)
         table.setSelectionMode(table.SelectionMode.SingleSelection)
         table.setEditTriggers(table.EditTrigger.NoEditTriggers)
@@ -154,21 +226,29 @@ class MainWindow(QMainWindow):
     def _configure_buttons(self) -> None:
         self.edit_button.setEnabled(False)
         self.delete_button.setEnabled(False)
+        if self._service.is_read_only:
+            self.add_button.setEnabled(False)
+            self.import_button.setEnabled(False)
         if not self.table_model.rowCount() > 0:
             self.filter_button.setEnabled(False)
             self.report_button.setEnabled(False)
+            self.export_button.setEnabled(False)
 
         self.add_button.setIcon(ADD_ICON)
         self.edit_button.setIcon(EDIT_ICON)
         self.delete_button.setIcon(DELETE_ICON)
         self.filter_button.setIcon(FILTER_ICON)
         self.report_button.setIcon(REPORT_ICON)
+        self.import_button.setIcon(IMPORT_ICON)
+        self.export_button.setIcon(EXPORT_ICON)
 
         self.add_button.clicked.connect(self._on_add_transaction_clicked)
         self.edit_button.clicked.connect(self._on_edit_transaction_clicked)
         self.delete_button.clicked.connect(self._on_delete_transaction_clicked)
         self.filter_button.clicked.connect(self._on_filter_transactions_clicked)
         self.report_button.clicked.connect(self._on_generate_report_clicked)
+        self.import_button.clicked.connect(self._on_import_csv_clicked)
+        self.export_button.clicked.connect(self._on_export_clicked)
 
         buttons = (
             self.add_button,
@@ -176,6 +256,8 @@ class MainWindow(QMainWindow):
             self.delete_button,
             self.filter_button,
             self.report_button,
+            self.import_button,
+            self.export_button,
         )
 
         for button in buttons:
@@ -184,35 +266,51 @@ class MainWindow(QMainWindow):
             button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
             button.setIconSize(QSize(32, 32))
 
+    def _configure_search(self) -> None:
+        self.search_line.setPlaceholderText("Buscar por descrição ou categoria...")
+        self.search_line.setClearButtonEnabled(True)
+        self.search_line.setTextMargins(5, 2, 5, 2)
+        self.search_line.setEnabled(self.table_model.rowCount() > 0)
+
+        # Debounce: a busca só roda quando o usuário para de digitar por SEARCH_DEBOUNCE_MS
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._on_search_timeout)
+        self.search_line.textChanged.connect(self._search_timer.start)
+
     def _configure_labels(self) -> None:
         self.title_label.setObjectName("titleLabel")
         self.no_table_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        # Grava o snapshot e o cubo adiados pelas inclusões antes de encerrar
+        self._service.close()
+        super().closeEvent(event)
+
     # Slots principais -----------------------------------------------------------------
     def _on_add_transaction_clicked(self) -> None:
-        new_transaction_window = TransactionFormWindow(mode=DialogMode.CREATEMODE)
+        new_transaction_window = TransactionFormWindow(
+            mode=DialogMode.CREATEMODE,
+            description_suggestions=self._service.suggest_descriptions,
+        )
         new_transaction_window.exec()
         input_list = new_transaction_window.user_input_list
         try:
+            unusual_expense_count = 0
             for user_input in input_list:
-                self._service.add_transaction(user_input)
-
-            if input_list:
-                self.status_bar.showMessage("Transação adicionada com sucesso!")
+                if self._service.add_transaction(user_input) is not None:
+                    unusual_expense_count += 1
 
-                if self.table.isHidden():
-                    self.table.show()
-                self.no_table_label.hide()
-                self.table_model.set_transaction_list(
-                    self._service.get_all_transactions()
+            if unusual_expense_count:
+                self.status_bar.showMessage(
+                    "Transação adicionada com sucesso! Despesas fora do padrão da "
+                    f"categoria: {unusual_expense_count}"
                 )
-                self.card_layout.addWidget(self.table)
-
-                if not self.filter_button.isEnabled():
-                    self.filter_button.setEnabled(True)
+            elif input_list:
+                self.status_bar.showMessage("Transação adicionada com sucesso!")
 
-                if not self.report_button.isEnabled():
-                    self.report_button.setEnabled(True)
+            if input_list:
+                self._show_transaction_table()
         except ValueError as e:
             error_window = self._configure_error_window(e)
             error_window.setWindowIcon(WINDOW_ICON)
@@ -225,7 +323,9 @@ class MainWindow(QMainWindow):
         transaction = self._service.get_transaction_by_id(transaction_id)
 
         edit_transaction_window = TransactionFormWindow(
-            mode=DialogMode.EDITMODE, transaction=transaction
+            mode=DialogMode.EDITMODE,
+            transaction=transaction,
+            description_suggestions=self._service.suggest_descriptions,
         )
         edit_transaction_window.exec()
         input_dict = edit_transaction_window.user_input_dict
@@ -244,7 +344,7 @@ class MainWindow(QMainWindow):
                 error_window = self._configure_error_window(e)
                 error_window.exec()
 
-            self.table_model.set_transaction_list(self._service.get_all_transactions())
+            self._set_table_query()
 
     def _on_delete_transaction_clicked(self) -> None:
         transaction_id = self._get_transaction_id()
@@ -265,14 +365,13 @@ class MainWindow(QMainWindow):
         if confirmation == QMessageBox.StandardButton.Yes:
             try:
                 self._service.del_transaction(transaction_id)
-                self.table_model.set_transaction_list(
-                    self._service.get_all_transactions()
-                )
+                self._set_table_query()
                 self._disable_buttons()
                 self.status_bar.showMessage("Transação excluída com sucesso!")
-                if self.table_model.rowCount() < 1:
+                if not self._service.query(limit=1).transactions:
                     self.filter_button.setEnabled(False)
                     self.report_button.setEnabled(False)
+                    self.export_button.setEnabled(False)
                     self.table.hide()
                     self.card_layout.addWidget(self.no_table_label)
                     self.card_layout.setStretchFactor(self.no_table_label, 1)
@@ -290,79 +389,258 @@ class MainWindow(QMainWindow):
         result = filter_window.exec()
 
         if result == TransactionFilterWindow.DialogCode.Accepted:
-            transaction_list = self._service.get_all_transactions()
-
             self._disable_buttons()
             if filter_window.clear_filters:
-                self.table_model.set_transaction_list(transaction_list)
+                self._set_table_query()
                 if self.table_model.rowCount() > 0:
                     self.report_button.setEnabled(True)
+                    self.export_button.setEnabled(True)
                 self.status_bar.showMessage("Filtros limpos!")
 
             else:
                 filter_criteria = filter_window.filter_criteria
                 sorting_criteria = filter_window.sorting_criteria
-
-                if (
-                    filter_criteria.min_amount is not None
-                    or filter_criteria.max_amount is not None
-                ):
-                    transaction_list = self._service.filter_by_amount_range(
-                        transaction_list,
+                sort_fields = {
+                    SortingFieldCode.ID: SortField.ID,
+                    SortingFieldCode.AMOUNT: SortField.AMOUNT,
+                    SortingFieldCode.DATE: SortField.DATE,
+                }
+
+                try:
+                    criteria = self._service.build_query_criteria(
                         filter_criteria.min_amount,
                         filter_criteria.max_amount,
-                    )
-
-                if (
-                    filter_criteria.start_date is not None
-                    or filter_criteria.end_date is not None
-                ):
-                    transaction_list = self._service.filter_by_date_range(
-                        transaction_list,
                         filter_criteria.start_date,
                         filter_criteria.end_date,
+                        filter_criteria.type,
+                        filter_criteria.category,
+                        filter_criteria.description,
                     )
-
-                if filter_criteria.type is not None:
-                    transaction_list = self._service.filter_by_type(
-                        filter_criteria.type, transaction_list
+                    sort = self._service.build_query_sort(
+                        sort_fields[sorting_criteria.field], sorting_criteria.order
                     )
+                except ValueError as e:
+                    error_window = self._configure_error_window(e)
+                    error_window.setWindowIcon(WINDOW_ICON)
+                    error_window.exec()
+                    return
+
+                self._set_table_query(criteria, sort)
+                has_rows = self.table_model.rowCount() > 0
+                self.report_button.setEnabled(has_rows)
+                self.export_button.setEnabled(has_rows)
+                self.status_bar.showMessage("Filtros aplicados com sucesso!")
 
-                if filter_criteria.category is not None:
-                    transaction_list = self._service.filter_by_category(
-                        filter_criteria.category, transaction_list
-                    )
+    def _on_generate_report_clicked(self) -> None:
+        displayed_criteria = self._get_displayed_criteria()
+        if displayed_criteria.is_date_range_only:
+            # Mesmas transações de um filtro por datas (ou de nenhum filtro): a lista não é
+            # montada; somas e série mensal vêm do cubo de agregados e as datas, do índice
+            filter_start_date = displayed_criteria.start_date
+            filter_end_date = displayed_criteria.end_date
+            self._service.update_statistics_for_date_range(
+                filter_start_date, filter_end_date
+            )
+            start_date, end_date = self._service.get_date_range_ends(
+                filter_start_date, filter_end_date
+            )
+            monthly_series = self._service.aggregate_time_series_for_date_range(
+                filter_start_date, filter_end_date, SeriesGroup.TYPE
+            )
+            get_report_transactions = self._iter_date_range_transactions
+        else:
+            if self._service.is_approximate_statistics:
+                # A amostra é feita em fluxo: a lista não é montada, e cada parte do
+                # relatório percorre a consulta de novo
+                get_report_transactions = self._iter_displayed_transactions
+            else:
+                transaction_list = list(self._iter_displayed_transactions())
 
-                if sorting_criteria.field == SortingFieldCode.ID:
-                    transaction_list = self._service.sort_by_id(
-                        sorting_criteria.order, transaction_list
-                    )
+                def get_report_transactions() -> list[Transaction]:
+                    return transaction_list
 
-                elif sorting_criteria.field == SortingFieldCode.AMOUNT:
-                    transaction_list = self._service.sort_by_amount(
-                        sorting_criteria.order, transaction_list
-                    )
+            self._service.update_statistics(get_report_transactions())
+            start_date = self._service.get_min_date(get_report_transactions())
+            end_date = self._service.get_max_date(get_report_transactions())
+            monthly_series = self._service.aggregate_time_series(
+                get_report_transactions(), TimeBucket.MONTH, SeriesGroup.TYPE
+            )
 
-                elif sorting_criteria.field == SortingFieldCode.DATE:
-                    transaction_list = self._service.sort_by_date(
-                        sorting_criteria.order, transaction_list
-                    )
+        statistics = self._service.get_statistics()
+        accumulated_balance = self._service.get_balance_as_of(end_date)
+        largest_expenses = self._service.top_k(
+            LARGEST_EXPENSES_COUNT, get_report_transactions(), "despesa"
+        )
+        top_descriptions = self._service.get_top_descriptions(
+            TOP_DESCRIPTIONS_COUNT, get_report_transactions()
+        )
+        rolling_windows = self._service.get_rolling_windows(get_report_transactions())
+        unusual_expenses = self._service.get_unusual_expenses(
+            get_report_transactions()
+        )[:UNUSUAL_EXPENSES_COUNT]
+
+        report_window = ReportWindow(
+            statistics,
+            start_date,
+            end_date,
+            largest_expenses,
+            monthly_series,
+            accumulated_balance,
+            top_descriptions,
+            rolling_windows,
+            unusual_expenses,
+        )
+        report_window.exec()
 
-                self.table_model.set_transaction_list(transaction_list)
-                if self.table_model.rowCount() < 1:
-                    self.report_button.setEnabled(False)
-                self.status_bar.showMessage("Filtros aplicados com sucesso!")
+    def _on_import_csv_clicked(self) -> None:
+        """Importa o CSV em uma thread separada; o diálogo modal impede alterar o livro enquanto isso."""
+        import_window = CsvImportWindow()
+        result = import_window.exec()
+        if result != CsvImportWindow.DialogCode.Accepted:
+            return
 
-    def _on_generate_report_clicked(self) -> None:
-        transaction_list = self.table_model.get_transaction_list()
-        self._service.update_statistics(transaction_list)
-        statistics = self._service.get_statistics()
-        start_date = self._service.get_min_date(transaction_list)
-        end_date = self._service.get_max_date(transaction_list)
+        # O total de linhas só é conhecido ao fim da leitura: o progresso fica indeterminado
+        self._import_progress = QProgressDialog(
+            "Importando transações...", None, 0, 0, self
+        )
+        self._import_progress.setWindowTitle("Importar CSV")
+        self._import_progress.setWindowIcon(WINDOW_ICON)
+        self._import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress.setMinimumDuration(300)
+        self._import_progress.setAutoClose(False)
+        self._import_progress.setAutoReset(False)
+
+        self._import_thread = QThread(self)
+        self._import_worker = ImportWorker(
+            self._service, import_window.file_path, import_window.column_mapping
+        )
+        self._import_worker.moveToThread(self._import_thread)
+
+        self._import_thread.started.connect(self._import_worker.run)
+        self._import_worker.progress.connect(self._on_import_progress)
+        self._import_worker.finished.connect(self._on_import_finished)
+        self._import_worker.failed.connect(self._on_import_failed)
+
+        self.import_button.setEnabled(False)
+        self._import_thread.start()
+
+    def _on_import_progress(self, imported_count: int) -> None:
+        self._import_progress.setLabelText(
+            f"Importando transações... {imported_count} incluída(s)."
+        )
+
+    def _on_import_finished(self, report: ImportReport) -> None:
+        self._finish_import()
+        if report.imported_count > 0:
+            self._show_transaction_table()
+        self._disable_buttons()
+        self.status_bar.showMessage(
+            f"{report.imported_count} transação(ões) importada(s)."
+        )
 
-        report_window = ReportWindow(statistics, start_date, end_date)
+        report_window = self._configure_import_report_window(report)
         report_window.exec()
 
+    def _on_import_failed(self, message: str) -> None:
+        self._finish_import()
+        # Lotes já incluídos antes do erro continuam no livro
+        self._set_table_query()
+        if self.table_model.rowCount() > 0:
+            self._show_transaction_table()
+        self._disable_buttons()
+        error_window = self._configure_error_window(message)
+        error_window.setWindowIcon(WINDOW_ICON)
+        error_window.exec()
+
+    def _finish_import(self) -> None:
+        self._import_progress.close()
+        self._import_thread.quit()
+        self._import_thread.wait()
+        self._import_worker.deleteLater()
+        self._import_thread.deleteLater()
+        self._import_worker = None
+        self._import_thread = None
+        self.import_button.setEnabled(True)
+
+    def _on_export_clicked(self) -> None:
+        """Exporta a lista exibida na tabela (com filtros e ordenação) em uma thread separada."""
+        format_filters = {
+            "CSV (*.csv)": ExportFormat.CSV,
+            "JSON Lines (*.jsonl)": ExportFormat.JSONL,
+            "Markdown (*.md)": ExportFormat.MARKDOWN,
+        }
+        file_name, selected_filter = QFileDialog.getSaveFileName(
+            self, "Exportar Lista", "transacoes.csv", ";;".join(format_filters)
+        )
+        if not file_name:
+            return
+
+        export_format = format_filters.get(selected_filter, ExportFormat.CSV)
+        file_path = Path(file_name)
+        if not file_path.suffix:
+            file_path = file_path.with_suffix(f".{export_format.value}")
+
+        # Com páginas ainda não carregadas o total é desconhecido: o progresso fica indeterminado
+        total = 0 if self.table_model.canFetchMore() else self.table_model.rowCount()
+        self._export_file_path = file_path
+        self._export_progress = QProgressDialog(
+            "Exportando transações...", "Cancelar", 0, total, self
+        )
+        self._export_progress.setWindowTitle("Exportar Lista")
+        self._export_progress.setWindowIcon(WINDOW_ICON)
+        self._export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._export_progress.setMinimumDuration(300)
+        self._export_progress.setAutoClose(False)
+        self._export_progress.setAutoReset(False)
+
+        self._export_thread = QThread(self)
+        self._export_worker = ExportWorker(
+            self._service, self._iter_displayed_transactions(), file_path, export_format
+        )
+        self._export_worker.moveToThread(self._export_thread)
+
+        self._export_thread.started.connect(self._export_worker.run)
+        self._export_worker.progress.connect(self._export_progress.setValue)
+        self._export_worker.finished.connect(self._on_export_finished)
+        self._export_worker.failed.connect(self._on_export_failed)
+        # Conexão direta: o worker está ocupado em run(), então um sinal enfileirado
+        # só seria entregue ao final da exportação.
+        self._export_progress.canceled.connect(
+            self._export_worker.cancel, Qt.ConnectionType.DirectConnection
+        )
+
+        self.export_button.setEnabled(False)
+        self._export_thread.start()
+
+    def _on_export_finished(self, exported_count: int) -> None:
+        cancelled = self._export_worker.is_cancelled
+        self._finish_export()
+        if cancelled:
+            self.status_bar.showMessage("Exportação cancelada.")
+        else:
+            self.status_bar.showMessage(
+                f"{exported_count} transação(ões) exportada(s) para "
+                f"{self._export_file_path.name}."
+            )
+
+    def _on_export_failed(self, message: str) -> None:
+        self._finish_export()
+        error_window = self._configure_error_window(
+            f"Não foi possível exportar a lista: {message}"
+        )
+        error_window.setWindowIcon(WINDOW_ICON)
+        error_window.exec()
+
+    def _finish_export(self) -> None:
+        self._export_progress.close()
+        self._export_thread.quit()
+        self._export_thread.wait()
+        self._export_worker.deleteLater()
+        self._export_thread.deleteLater()
+        self._export_worker = None
+        self._export_thread = None
+        self.export_button.setEnabled(self.table_model.rowCount() > 0)
+
     # Métodos utilitários --------------------------------------------------------------
     def _get_transaction_id(self) -> Transaction:
         selected_rows = self.table.selectionModel().selectedRows()
@@ -372,6 +650,72 @@ class MainWindow(QMainWindow):
         self.edit_button.setEnabled(False)
         self.delete_button.setEnabled(False)
 
+    def _show_transaction_table(self) -> None:
+        if self.table.isHidden():
+            self.table.show()
+        self.no_table_label.hide()
+        self._set_table_query()
+        self.card_layout.addWidget(self.table)
+
+        self.filter_button.setEnabled(True)
+        self.report_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+
+    def _configure_import_report_window(self, report: ImportReport) -> QMessageBox:
+        report_window = QMessageBox()
+        report_window.setWindowTitle("Resultado da Importação")
+        report_window.setWindowIcon(WINDOW_ICON)
+        report_window.setText(
+            f"Transações importadas: {report.imported_count}\n"
+            f"Linhas rejeitadas: {report.error_count}\n"
+            f"Duplicadas ignoradas: {report.duplicate_count}\n"
+            f"Possíveis duplicadas importadas: {report.near_duplicate_count}"
+        )
+        details = [
+            f"Linha {error.line_number}: {error.message}" for error in report.errors
+        ]
+        details.extend(
+            f"Linha {row.line_number} ({row.description}): {row.reason}"
+            for row in report.duplicates + report.near_duplicates
+        )
+        if details:
+            report_window.setIcon(QMessageBox.Icon.Warning)
+            report_window.setDetailedText("\n".join(details))
+        else:
+            report_window.setIcon(QMessageBox.Icon.Information)
+
+        return report_window
+
+    def _confirm_ignored_lines(self) -> None:
+        ignored_line_count = self._service.ignored_line_count
+        if not ignored_line_count:
+            return
+
+        confirmation_window = QMessageBox(self)
+        confirmation_window.setText(
+            f"{ignored_line_count} linha(s) do arquivo de dados estão corrompidas ou "
+            "inválidas e foram ignoradas. Excluir ou editar transações regrava o arquivo "
+            "e as apaga.\n\nDescartar essas linhas? Uma cópia do arquivo será mantida."
+        )
+        confirmation_window.setIcon(QMessageBox.Icon.Warning)
+        confirmation_window.setWindowIcon(WINDOW_ICON)
+        confirmation_window.setWindowTitle("Linhas Ignoradas")
+        confirmation_window.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        confirmation_window.setButtonText(QMessageBox.StandardButton.Yes, "Sim")
+        confirmation_window.setButtonText(QMessageBox.StandardButton.No, "Não")
+
+        if confirmation_window.exec() == QMessageBox.StandardButton.Yes:
+            backup_path = self._service.discard_ignored_lines()
+            self.status_bar.showMessage(
+                f"Cópia do arquivo original gravada em {backup_path}"
+            )
+        else:
+            self.status_bar.showMessage(
+                "Linhas ignoradas mantidas: exclusões e edições ficam bloqueadas."
+            )
+
     def _configure_error_window(self, error) -> QMessageBox:
         error_window = QMessageBox()
         error_window.setText(f"{error}")
@@ -380,6 +724,59 @@ class MainWindow(QMainWindow):
 
         return error_window
 
+    def _set_table_query(
+        self, criteria: QueryCriteria | None = None, sort: QuerySort | None = None
+    ) -> None:
+        """
+        Exibe o resultado da consulta na tabela, uma página por vez: as seguintes só são
+        buscadas quando a tabela é rolada até o fim (TableModel.fetchMore). Sem critérios,
+        exibe todas as transações por ordem de ID. A busca digitada, se houver, é somada
+        aos critérios (ver _get_displayed_criteria).
+        """
+        self._query_criteria = criteria or QueryCriteria()
+        self._query_sort = sort or QuerySort()
+        self.table_model.set_page_loader(self._load_page)
+        self._enable_search_line()
+
+    def _get_displayed_criteria(self) -> QueryCriteria:
+        """Critérios dos filtros aplicados, mais a busca digitada."""
+        return replace(self._query_criteria, search=self.search_line.text() or None)
+
+    def _load_page(self, after_key: str | None) -> QueryPage:
+        return self._service.query(
+            self._get_displayed_criteria(), self._query_sort, PAGE_SIZE, after_key
+        )
+
+    def _enable_search_line(self) -> None:
+        # Com uma busca sem resultados, o campo continua habilitado para que ela seja desfeita
+        self.search_line.setEnabled(
+            bool(self.search_line.text()) or self.table_model.rowCount() > 0
+        )
+
+    def _iter_date_range_transactions(self) -> Iterable[Transaction] | None:
+        """
+        Transações do filtro por datas, lidas em fluxo do índice de datas. Sem datas, None:
+        rankings e janelas móveis vêm dos índices mantidos a cada inclusão.
+        """
+        start_date = self._query_criteria.start_date
+        end_date = self._query_criteria.end_date
+        if start_date is None and end_date is None:
+            return None
+
+        return self._service.iter_transactions_by_date_range(start_date, end_date)
+
+    def _iter_displayed_transactions(self) -> Iterable[Transaction]:
+        """
+        Transações exibidas, com filtros, ordenação e busca. Se ainda há páginas não
+        carregadas, a consulta é percorrida de novo em fluxo, sem carregá-las na tabela.
+        """
+        if self.table_model.canFetchMore():
+            return self._service.iter_query(
+                self._get_displayed_criteria(), self._query_sort
+            )
+
+        return self.table_model.get_transaction_list()
+
     # Slots utilitários ----------------------------------------------------------------
     def _on_table_selection_changed(self, *_args) -> None:
         self._enable_edit_button()
@@ -388,10 +785,26 @@ class MainWindow(QMainWindow):
         self._update_statusbar_with_row_values()
 
     def _enable_edit_button(self) -> None:
-        self.edit_button.setEnabled(self.table.selectionModel().hasSelection())
+        self.edit_button.setEnabled(
+            self.table.selectionModel().hasSelection()
+            and not self._service.is_read_only
+        )
 
     def _enable_delete_button(self) -> None:
-        self.delete_button.setEnabled(self.table.selectionModel().hasSelection())
+        self.delete_button.setEnabled(
+            self.table.selectionModel().hasSelection()
+            and not self._service.is_read_only
+        )
+
+    def _on_search_timeout(self) -> None:
+        # Só a primeira página da busca é consultada; as demais, ao rolar a tabela
+        self._disable_buttons()
+        self.table_model.update_page_loader(self._load_page)
+        self._enable_search_line()
+
+        has_rows = self.table_model.rowCount() > 0
+        self.report_button.setEnabled(has_rows)
+        self.export_button.setEnabled(has_rows and self._export_thread is None)
 
     def _update_statusbar_with_row_values(self) -> None:
         selected_rows = self.table.selectionModel().selectedRows()
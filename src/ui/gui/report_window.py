@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import date
 
 from PySide6.QtWidgets import (
@@ -15,9 +16,16 @@ from PySide6.QtWidgets import (
     QTabWidget,
 )
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor
 
 import src.ui.formatter as formatter
+from src.models.transaction import Transaction
+from src.models.enums import TransactionType
 from src.service.transaction_statistics import TransactionStatistics
+from src.service.time_series import TimeSeries
+from src.models.heavy_hitters import TopDescriptions, DescriptionTotal
+from src.models.rolling_window import RollingWindows
+from src.models.unusual_expenses import UnusualExpense
 from src.utils.constants import WINDOW_ICON
 
 
@@ -27,12 +35,24 @@ class ReportWindow(QDialog):
         statistics: TransactionStatistics,
         start_date: date,
         end_date: date,
+        largest_expenses: list[Transaction] | None = None,
+        monthly_series: TimeSeries | None = None,
+        accumulated_balance: int | float | None = None,
+        top_descriptions: TopDescriptions | None = None,
+        rolling_windows: RollingWindows | None = None,
+        unusual_expenses: list[UnusualExpense] | None = None,
         parent: QWidget = None,
     ):
         super().__init__(parent)
         self._statistics: TransactionStatistics = statistics
         self._start_date: date = start_date
         self._end_date: date = end_date
+        self._largest_expenses: list[Transaction] = largest_expenses or []
+        self._monthly_series: TimeSeries | None = monthly_series
+        self._accumulated_balance: int | float | None = accumulated_balance
+        self._top_descriptions: TopDescriptions = top_descriptions or TopDescriptions()
+        self._rolling_windows: RollingWindows | None = rolling_windows
+        self._unusual_expenses: list[UnusualExpense] = unusual_expenses or []
 
         # Layouts ----------------------------------------------------------------------
         self._main_layout = QVBoxLayout()
@@ -43,6 +63,11 @@ class ReportWindow(QDialog):
         self._expense_overview_layout = QVBoxLayout()
         self._income_breakdown_layout = QVBoxLayout()
         self._expense_breakdown_layout = QVBoxLayout()
+        self._largest_expenses_layout = QVBoxLayout()
+        self._unusual_expenses_layout = QVBoxLayout()
+        self._monthly_layout = QVBoxLayout()
+        self._top_descriptions_layout = QVBoxLayout()
+        self._rolling_windows_layout = QVBoxLayout()
 
         # Frame ------------------------------------------------------------------------
         self._main_card = QFrame()
@@ -56,6 +81,11 @@ class ReportWindow(QDialog):
         self._expense_overview_box = QGroupBox("Despesas")
         self._income_breakdown_box = QGroupBox("Breakdown por Categorias de Receita")
         self._expense_breakdown_box = QGroupBox("Breakdown por Categorias de Despesa")
+        self._largest_expenses_box = QGroupBox("Maiores Despesas")
+        self._unusual_expenses_box = QGroupBox("Despesas Fora do Padrão da Categoria")
+        self._monthly_box = QGroupBox("Evolução Mensal")
+        self._top_descriptions_box = QGroupBox("Principais Descrições de Despesa")
+        self._rolling_windows_box = QGroupBox("Janelas Móveis")
 
         # QLabels ----------------------------------------------------------------------
         self._title_label = QLabel("Relatório de Transações")
@@ -68,6 +98,12 @@ class ReportWindow(QDialog):
         # QTableWidgets ----------------------------------------------------------------
         self._income_breakdown_table = QTableWidget()
         self._expense_breakdown_table = QTableWidget()
+        self._largest_expenses_table = QTableWidget()
+        self._unusual_expenses_table = QTableWidget()
+        self._monthly_table = QTableWidget()
+        self._top_descriptions_by_amount_table = QTableWidget()
+        self._top_descriptions_by_count_table = QTableWidget()
+        self._rolling_windows_table = QTableWidget()
 
         self._setup_UI()
 
@@ -101,12 +137,45 @@ class ReportWindow(QDialog):
         self._expense_breakdown_layout.addWidget(self._expense_breakdown_table)
         self._expense_breakdown_box.setLayout(self._expense_breakdown_layout)
 
+        self._largest_expenses_layout.addWidget(self._largest_expenses_table)
+        self._largest_expenses_box.setLayout(self._largest_expenses_layout)
+
+        self._unusual_expenses_layout.addWidget(self._unusual_expenses_table)
+        self._unusual_expenses_box.setLayout(self._unusual_expenses_layout)
+
+        self._monthly_layout.addWidget(self._monthly_table)
+        self._monthly_box.setLayout(self._monthly_layout)
+
+        self._top_descriptions_layout.addWidget(self._top_descriptions_by_amount_table)
+        self._top_descriptions_layout.addWidget(self._top_descriptions_by_count_table)
+        self._top_descriptions_box.setLayout(self._top_descriptions_layout)
+
+        self._rolling_windows_layout.addWidget(self._rolling_windows_table)
+        self._rolling_windows_box.setLayout(self._rolling_windows_layout)
+
         if self._statistics.income_transaction_count:
             self._breakdown_tabs.addTab(self._income_breakdown_box, "Receitas")
 
         if self._statistics.expense_transaction_count:
             self._breakdown_tabs.addTab(self._expense_breakdown_box, "Despesas")
 
+        if self._largest_expenses:
+            self._breakdown_tabs.addTab(self._largest_expenses_box, "Maiores Despesas")
+
+        if self._unusual_expenses:
+            self._breakdown_tabs.addTab(self._unusual_expenses_box, "Fora do Padrão")
+
+        if self._has_monthly_comparison():
+            self._breakdown_tabs.addTab(self._monthly_box, "Evolução Mensal")
+
+        if self._has_rolling_windows():
+            self._breakdown_tabs.addTab(self._rolling_windows_box, "Janelas Móveis")
+
+        if self._top_descriptions.by_amount:
+            self._breakdown_tabs.addTab(
+                self._top_descriptions_box, "Principais Descrições"
+            )
+
         self._card_layout.addWidget(
             self._title_label, alignment=Qt.AlignmentFlag.AlignHCenter
         )
@@ -151,6 +220,18 @@ class ReportWindow(QDialog):
             f"Transações: {self._statistics.transaction_count} | "
             f"Saldo: {formatted_balance}"
         )
+        if self._statistics.approximate_quantiles:
+            general_overview_text += "\n" + formatter.format_approximation_note(
+                self._statistics.quantile_sample_size,
+                self._statistics.quantile_rank_error,
+            )
+        if self._accumulated_balance is not None:
+            formatted_accumulated_balance = formatter.format_currency_for_ptbr(
+                self._accumulated_balance
+            )
+            general_overview_text += (
+                f"\nSaldo acumulado até {end_date_str}: {formatted_accumulated_balance}"
+            )
 
         income_overview_text = self._get_income_overview_text()
 
@@ -165,8 +246,22 @@ class ReportWindow(QDialog):
     def _config_tables(self) -> None:
         self._config_income_table()
         self._config_expense_table()
-
-        for table in (self._income_breakdown_table, self._expense_breakdown_table):
+        self._config_largest_expenses_table()
+        self._config_unusual_expenses_table()
+        self._config_monthly_table()
+        self._config_rolling_windows_table()
+        self._config_top_descriptions_tables()
+
+        for table in (
+            self._income_breakdown_table,
+            self._expense_breakdown_table,
+            self._largest_expenses_table,
+            self._unusual_expenses_table,
+            self._monthly_table,
+            self._rolling_windows_table,
+            self._top_descriptions_by_amount_table,
+            self._top_descriptions_by_count_table,
+        ):
             header = table.horizontalHeader()
             header.setHighlightSections(False)
             header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
@@ -211,6 +306,7 @@ class ReportWindow(QDialog):
         income_category_with_most_transactions = formatter.format_category(
             self._statistics.income_category_with_most_transactions
         )
+        median_income = self._format_quantile("median_income")
 
         return (
             f"Transações: {self._statistics.income_transaction_count}\n"
@@ -224,11 +320,7 @@ class ReportWindow(QDialog):
                     self._statistics.average_income
                     )
             }\n"
-            f"Mediana: {
-                formatter.format_currency_for_ptbr(
-                    self._statistics.median_income
-                )
-            }\n"
+            f"Mediana: {median_income}\n"
             f"Maior valor: {
                 formatter.format_currency_for_ptbr(
                     self._statistics.highest_income_amount
@@ -250,6 +342,9 @@ class ReportWindow(QDialog):
         expense_category_with_most_transactions = formatter.format_category(
             self._statistics.expense_category_with_most_transactions
         )
+        median_expense = self._format_quantile("median_expense")
+        percentile_90_expense = self._format_quantile("percentile_90_expense")
+        percentile_99_expense = self._format_quantile("percentile_99_expense")
 
         return (
             f"Transações: {self._statistics.expense_transaction_count}\n"
@@ -259,9 +354,9 @@ class ReportWindow(QDialog):
             f"Média: {
                 formatter.format_currency_for_ptbr(self._statistics.average_expense)
             }\n"
-            f"Mediana: {
-                formatter.format_currency_for_ptbr(self._statistics.median_expense)
-            }\n"
+            f"Mediana: {median_expense}\n"
+            f"Percentil 90: {percentile_90_expense}\n"
+            f"Percentil 99: {percentile_99_expense}\n"
             f"Maior valor: {
                 formatter.format_currency_for_ptbr(
                     self._statistics.highest_expense_amount
@@ -275,6 +370,13 @@ class ReportWindow(QDialog):
             }"
         )
 
+    def _format_quantile(self, field_name: str) -> str:
+        """Mediana ou percentil; no modo aproximado, com o intervalo da estimativa."""
+        return formatter.format_quantile(
+            getattr(self._statistics, field_name),
+            self._statistics.quantile_bounds.get(field_name),
+        )
+
     def _config_income_table(self) -> None:
         if not self._statistics.income_transaction_count:
             return
@@ -348,3 +450,229 @@ class ReportWindow(QDialog):
             table.setItem(row, 2, QTableWidgetItem(count_percentage_str))
             table.setItem(row, 3, QTableWidgetItem(amount_percentage_str))
             table.setItem(row, 4, QTableWidgetItem(total_str))
+
+    def _config_largest_expenses_table(self) -> None:
+        if not self._largest_expenses:
+            return
+
+        table = self._largest_expenses_table
+
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Data", "Categoria", "Descrição", "Valor"])
+        table.setRowCount(len(self._largest_expenses))
+
+        for row, transaction in enumerate(self._largest_expenses):
+            amount_item = QTableWidgetItem(
+                formatter.format_currency_for_ptbr(transaction.amount)
+            )
+            amount_item.setTextAlignment(
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            )
+
+            table.setItem(
+                row,
+                0,
+                QTableWidgetItem(formatter.format_date(transaction.transaction_date)),
+            )
+            table.setItem(
+                row,
+                1,
+                QTableWidgetItem(formatter.format_category(transaction.category)),
+            )
+            table.setItem(row, 2, QTableWidgetItem(transaction.description))
+            table.setItem(row, 3, amount_item)
+
+    def _has_rolling_windows(self) -> bool:
+        rolling_windows = self._rolling_windows
+        return (
+            rolling_windows is not None
+            and len(rolling_windows.get_series(rolling_windows.window_days[0])) > 0
+        )
+
+    def _config_rolling_windows_table(self) -> None:
+        if not self._has_rolling_windows():
+            return
+
+        table = self._rolling_windows_table
+        window_days = self._rolling_windows.window_days
+        last_day = self._rolling_windows.get_series(window_days[0]).last_day
+        self._rolling_windows_box.setTitle(
+            f"Janelas Móveis (até {formatter.format_date(last_day)})"
+        )
+
+        table.setColumnCount(7)
+        table.setHorizontalHeaderLabels(
+            [
+                "Janela",
+                "Receitas",
+                "Despesas",
+                "Janela anterior",
+                "Variação",
+                "Maior gasto",
+                "Terminada em",
+            ]
+        )
+        table.setRowCount(len(window_days))
+
+        for row, days in enumerate(window_days):
+            series = self._rolling_windows.get_series(days)
+            previous_expenses = series.get_previous_expenses()
+            expense_change = series.get_expense_change()
+            peak_day, peak_expenses = series.get_peak_expenses()
+
+            previous_str = (
+                "-"
+                if previous_expenses is None
+                else formatter.format_currency_for_ptbr(previous_expenses)
+            )
+            change_str = "-" if expense_change is None else f"{expense_change:+.1f}%"
+
+            table.setItem(row, 0, QTableWidgetItem(f"{days} dias"))
+            table.setItem(
+                row,
+                1,
+                QTableWidgetItem(
+                    formatter.format_currency_for_ptbr(series.incomes[-1])
+                ),
+            )
+            table.setItem(
+                row,
+                2,
+                QTableWidgetItem(
+                    formatter.format_currency_for_ptbr(series.expenses[-1])
+                ),
+            )
+            table.setItem(row, 3, QTableWidgetItem(previous_str))
+            table.setItem(row, 4, QTableWidgetItem(change_str))
+            table.setItem(
+                row,
+                5,
+                QTableWidgetItem(formatter.format_currency_for_ptbr(peak_expenses)),
+            )
+            table.setItem(row, 6, QTableWidgetItem(formatter.format_date(peak_day)))
+
+    def _config_top_descriptions_tables(self) -> None:
+        # Estimativas com margem de erro: o valor real é até "Erro máx." menor
+        self._fill_top_descriptions_table(
+            self._top_descriptions_by_amount_table,
+            ["Descrição", "Total", "Erro máx."],
+            self._top_descriptions.by_amount,
+            formatter.format_currency_for_ptbr,
+        )
+        self._fill_top_descriptions_table(
+            self._top_descriptions_by_count_table,
+            ["Descrição", "Transações", "Erro máx."],
+            self._top_descriptions.by_count,
+            str,
+        )
+
+    def _fill_top_descriptions_table(
+        self,
+        table: QTableWidget,
+        header_labels: list[str],
+        description_totals: list[DescriptionTotal],
+        format_value: Callable[[int | float], str],
+    ) -> None:
+        table.setColumnCount(3)
+        table.setHorizontalHeaderLabels(header_labels)
+        table.setRowCount(len(description_totals))
+
+        for row, description_total in enumerate(description_totals):
+            error = description_total.error
+            estimate_item = QTableWidgetItem(format_value(description_total.estimate))
+            error_item = QTableWidgetItem(format_value(error) if error else "-")
+            for item in (estimate_item, error_item):
+                item.setTextAlignment(
+                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                )
+
+            table.setItem(row, 0, QTableWidgetItem(description_total.description))
+            table.setItem(row, 1, estimate_item)
+            table.setItem(row, 2, error_item)
+
+    def _config_unusual_expenses_table(self) -> None:
+        if not self._unusual_expenses:
+            return
+
+        table = self._unusual_expenses_table
+
+        table.setColumnCount(6)
+        table.setHorizontalHeaderLabels(
+            ["Data", "Categoria", "Descrição", "Valor", "Típico", "Desvios"]
+        )
+        table.setRowCount(len(self._unusual_expenses))
+
+        for row, unusual_expense in enumerate(self._unusual_expenses):
+            transaction = unusual_expense.transaction
+            amount_item = QTableWidgetItem(
+                formatter.format_currency_for_ptbr(transaction.amount)
+            )
+            amount_item.setForeground(QBrush(QColor("#ff3b30")))
+            typical_item = QTableWidgetItem(
+                formatter.format_currency_for_ptbr(unusual_expense.typical_amount)
+            )
+            score_item = QTableWidgetItem(f"{unusual_expense.score:.1f}")
+            for item in (amount_item, typical_item, score_item):
+                item.setTextAlignment(
+                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                )
+
+            table.setItem(
+                row,
+                0,
+                QTableWidgetItem(formatter.format_date(transaction.transaction_date)),
+            )
+            table.setItem(
+                row,
+                1,
+                QTableWidgetItem(formatter.format_category(transaction.category)),
+            )
+            table.setItem(row, 2, QTableWidgetItem(transaction.description))
+            table.setItem(row, 3, amount_item)
+            table.setItem(row, 4, typical_item)
+            table.setItem(row, 5, score_item)
+
+    def _has_monthly_comparison(self) -> bool:
+        # Com um único mês não há o que comparar
+        series = self._monthly_series
+        return series is not None and len(series.periods) > 1
+
+    def _config_monthly_table(self) -> None:
+        if not self._has_monthly_comparison():
+            return
+
+        table = self._monthly_table
+        series = self._monthly_series
+
+        table.setColumnCount(5)
+        table.setHorizontalHeaderLabels(
+            ["Mês", "Receitas", "Despesas", "Saldo", "Despesas vs. mês anterior"]
+        )
+        table.setRowCount(len(series.periods))
+
+        incomes = series.get_totals(TransactionType.INCOME)
+        expenses = series.get_totals(TransactionType.EXPENSE)
+        expense_changes = series.get_changes(TransactionType.EXPENSE)
+        for row, month in enumerate(series.periods):
+            balance = incomes[row] - expenses[row]
+            expense_change = expense_changes[row]
+
+            balance_item = QTableWidgetItem(formatter.format_currency_for_ptbr(balance))
+            balance_item.setForeground(
+                QBrush(QColor("#4cd964" if balance >= 0 else "#ff9533"))
+            )
+            change_str = "-" if expense_change is None else f"{expense_change:+.1f}%"
+
+            table.setItem(row, 0, QTableWidgetItem(formatter.format_month(month)))
+            table.setItem(
+                row,
+                1,
+                QTableWidgetItem(formatter.format_currency_for_ptbr(incomes[row])),
+            )
+            table.setItem(
+                row,
+                2,
+                QTableWidgetItem(formatter.format_currency_for_ptbr(expenses[row])),
+            )
+            table.setItem(row, 3, balance_item)
+            table.setItem(row, 4, QTableWidgetItem(change_str))
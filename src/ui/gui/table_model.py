@@ -4,6 +4,8 @@ from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, QObject
 from PySide6.QtGui import QColor, QBrush
 
 from src.models.transaction import Transaction, TransactionType
+from src.models.query import QueryPage
+from src.models.unusual_expenses import UnusualExpense
 import src.ui.formatter as formatter
 
 
@@ -15,6 +17,21 @@ class TableModel(QAbstractTableModel):
     ):
         super().__init__(parent)
         self._transaction_list: list[Transaction] = transaction_list or []
+        # Consulta paginada (ver set_page_loader): as próximas páginas são buscadas sob demanda
+        self._page_loader: Callable[[str | None], QueryPage] | None = None
+        self._next_key: str | None = None
+        # Saldos acumulados das linhas carregadas, por ID; calculados quando as linhas entram no
+        # modelo (ver set_running_balance_loader), e não durante a pintura
+        self._running_balance_loader: (
+            Callable[[list[Transaction]], list[float | None]] | None
+        ) = None
+        self._running_balances: dict[int, float | None] = {}
+        # Despesas fora do padrão da categoria entre as linhas carregadas, por ID (ver
+        # set_unusual_expense_loader)
+        self._unusual_expense_loader: Callable[[int], UnusualExpense | None] | None = (
+            None
+        )
+        self._unusual_expenses: dict[int, UnusualExpense] = {}
         self._column_names: list[str] = [
             "Id",
             "Data",
@@ -22,6 +39,7 @@ class TableModel(QAbstractTableModel):
             "Categoria",
             "Descrição",
             "Valor",
+            "Saldo acumulado",
         ]
         self._column_descriptions: dict[str, Callable[[Transaction], Any]] = {
             "Id": lambda t: t.id,
@@ -30,6 +48,7 @@ class TableModel(QAbstractTableModel):
             "Categoria": lambda t: formatter.format_category(t.category),
             "Descrição": lambda t: t.description,
             "Valor": lambda t: formatter.format_currency_for_ptbr(t.amount),
+            "Saldo acumulado": self._format_running_balance,
         }
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
@@ -53,13 +72,30 @@ class TableModel(QAbstractTableModel):
             if index.column() == 0:  # Coluna "Id"
                 return Qt.AlignmentFlag.AlignCenter
 
-            elif index.column() == 5:  # Coluna "Valor"
+            elif index.column() in (5, 6):  # Colunas "Valor" e "Saldo acumulado"
                 return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
 
             else:
                 return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
 
+        if role == Qt.ItemDataRole.ToolTipRole:
+            unusual_expense = self._unusual_expenses.get(transaction.id)
+            if unusual_expense is not None:
+                typical_amount = formatter.format_currency_for_ptbr(
+                    unusual_expense.typical_amount
+                )
+                return f"Despesa fora do padrão da categoria (típico: {typical_amount})"
+
         if role == Qt.ItemDataRole.ForegroundRole:
+            if index.column() == 6:  # Coluna "Saldo acumulado"
+                running_balance = self._running_balances.get(transaction.id)
+                if running_balance is None:
+                    return None
+                return QBrush(QColor("#4cd964" if running_balance >= 0 else "#ff9533"))
+
+            if transaction.id in self._unusual_expenses:
+                return QBrush(QColor("#ff3b30"))
+
             if index.column() == 5:  # Coluna "Valor"
                 if transaction.transaction_type == TransactionType.EXPENSE:
                     return QBrush(QColor("#ff9533"))
@@ -83,7 +119,7 @@ class TableModel(QAbstractTableModel):
                 if section == 0:  # Coluna "Id"
                     return Qt.AlignmentFlag.AlignCenter
 
-                elif section == 5:  # Coluna "Valor"
+                elif section in (5, 6):  # Colunas "Valor" e "Saldo acumulado"
                     return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
 
                 else:
@@ -91,10 +127,189 @@ class TableModel(QAbstractTableModel):
 
         return None
 
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._next_key is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Chamado pela view ao rolar até o fim: acrescenta a próxima página da consulta."""
+        if not self.canFetchMore(parent):
+            return
+
+        page = self._page_loader(self._next_key)
+        self._next_key = page.next_key
+        if not page.transactions:
+            return
+
+        self._cache_row_values(page.transactions)
+        first_row = len(self._transaction_list)
+        self.beginInsertRows(
+            QModelIndex(), first_row, first_row + len(page.transactions) - 1
+        )
+        self._transaction_list.extend(page.transactions)
+        self.endInsertRows()
+
+    def set_page_loader(self, page_loader: Callable[[str | None], QueryPage]) -> None:
+        """
+        Exibe o resultado de uma consulta paginada. page_loader recebe o token da página
+        anterior (None para a primeira) e retorna a página seguinte.
+        """
+        self._reset_to_page(page_loader, page_loader(None))
+
+    def update_page_loader(
+        self, page_loader: Callable[[str | None], QueryPage]
+    ) -> None:
+        """
+        Como set_page_loader, mas se o resultado atual e o novo cabem em uma página cada,
+        aplica só as diferenças (ver update_transaction_list), preservando a rolagem
+        (ex: busca enquanto digita).
+        """
+        first_page = page_loader(None)
+        if self._next_key is not None or first_page.next_key is not None:
+            self._reset_to_page(page_loader, first_page)
+            return
+
+        self.update_transaction_list(first_page.transactions)
+        self._page_loader = page_loader
+
     def set_transaction_list(self, new_transaction_list: list[Transaction]) -> None:
+        self._clear_row_values()
+        self._cache_row_values(new_transaction_list)
         self.beginResetModel()
         self._transaction_list = new_transaction_list
+        self._page_loader = None
+        self._next_key = None
         self.endResetModel()
 
+    def update_transaction_list(self, new_transaction_list: list[Transaction]) -> None:
+        """
+        Troca a lista emitindo apenas remoções e inserções de linhas, sem resetar o modelo,
+        o que preserva a rolagem e evita redesenhar a tabela inteira.
+
+        Vale quando as duas listas mantêm a mesma ordem relativa (ex: dois resultados de busca
+        sobre a mesma lista base); caso contrário, recorre a set_transaction_list.
+        """
+        if not isinstance(self._transaction_list, list) or not isinstance(
+            new_transaction_list, list
+        ):
+            # Visões de arquivos somente leitura não são alteráveis no lugar
+            self.set_transaction_list(new_transaction_list)
+            return
+
+        # A lista atual pode ser a mesma recebida de fora (set_transaction_list); ela é alterada no lugar
+        self._transaction_list = self._transaction_list.copy()
+        new_ids = {transaction.id for transaction in new_transaction_list}
+        old_ids = {transaction.id for transaction in self._transaction_list}
+        kept_transactions = [t for t in self._transaction_list if t.id in new_ids]
+        if kept_transactions != [t for t in new_transaction_list if t.id in old_ids]:
+            self.set_transaction_list(new_transaction_list)
+            return
+
+        # Remoções de trás para frente, em blocos contíguos, para não deslocar as linhas ainda não tratadas
+        row = len(self._transaction_list) - 1
+        while row >= 0:
+            if self._transaction_list[row].id in new_ids:
+                row -= 1
+                continue
+
+            last_row = row
+            while row >= 0 and self._transaction_list[row].id not in new_ids:
+                row -= 1
+
+            self.beginRemoveRows(QModelIndex(), row + 1, last_row)
+            del self._transaction_list[row + 1 : last_row + 1]
+            self.endRemoveRows()
+
+        # Inserções em ordem: após as remoções, a lista é a nova lista sem as linhas que faltam inserir
+        row = 0
+        while row < len(new_transaction_list):
+            if new_transaction_list[row].id in old_ids:
+                row += 1
+                continue
+
+            first_row = row
+            while row < len(new_transaction_list) and (
+                new_transaction_list[row].id not in old_ids
+            ):
+                row += 1
+
+            inserted_transactions = new_transaction_list[first_row:row]
+            self._cache_row_values(inserted_transactions)
+            self.beginInsertRows(QModelIndex(), first_row, row - 1)
+            self._transaction_list[first_row:first_row] = inserted_transactions
+            self.endInsertRows()
+
+    def set_running_balance_loader(
+        self, running_balance_loader: Callable[[list[Transaction]], list[float | None]]
+    ) -> None:
+        """
+        running_balance_loader recebe transações e retorna o saldo acumulado de cada uma.
+        É chamado só para as linhas que entram no modelo, com todas as de uma vez.
+        """
+        self._running_balance_loader = running_balance_loader
+        self._running_balances.clear()
+        self._cache_running_balances(self._transaction_list)
+        if self.rowCount() > 0:
+            self.dataChanged.emit(self.index(0, 6), self.index(self.rowCount() - 1, 6))
+
+    def set_unusual_expense_loader(
+        self, unusual_expense_loader: Callable[[int], UnusualExpense | None]
+    ) -> None:
+        """
+        unusual_expense_loader recebe o ID de uma transação e retorna o alerta de despesa
+        fora do padrão, se houver; as linhas marcadas são destacadas.
+        """
+        self._unusual_expense_loader = unusual_expense_loader
+        self._unusual_expenses.clear()
+        self._cache_unusual_expenses(self._transaction_list)
+        if self.rowCount() > 0:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.rowCount() - 1, self.columnCount() - 1),
+            )
+
     def get_transaction_list(self) -> list[Transaction]:
         return self._transaction_list.copy()
+
+    # Métodos utilitários --------------------------------------------------------------
+    def _reset_to_page(
+        self, page_loader: Callable[[str | None], QueryPage], first_page: QueryPage
+    ) -> None:
+        self._clear_row_values()
+        self._cache_row_values(first_page.transactions)
+        self.beginResetModel()
+        self._transaction_list = first_page.transactions
+        self._page_loader = page_loader
+        self._next_key = first_page.next_key
+        self.endResetModel()
+
+    def _clear_row_values(self) -> None:
+        self._running_balances.clear()
+        self._unusual_expenses.clear()
+
+    def _cache_row_values(self, transaction_list: list[Transaction]) -> None:
+        self._cache_running_balances(transaction_list)
+        self._cache_unusual_expenses(transaction_list)
+
+    def _cache_unusual_expenses(self, transaction_list: list[Transaction]) -> None:
+        if self._unusual_expense_loader is None:
+            return
+
+        for transaction in transaction_list:
+            unusual_expense = self._unusual_expense_loader(transaction.id)
+            if unusual_expense is not None:
+                self._unusual_expenses[transaction.id] = unusual_expense
+
+    def _cache_running_balances(self, transaction_list: list[Transaction]) -> None:
+        if self._running_balance_loader is None:
+            return
+
+        running_balances = self._running_balance_loader(transaction_list)
+        for transaction, running_balance in zip(transaction_list, running_balances):
+            self._running_balances[transaction.id] = running_balance
+
+    def _format_running_balance(self, transaction: Transaction) -> str:
+        running_balance = self._running_balances.get(transaction.id)
+        if running_balance is None:
+            return "-"
+
+        return formatter.format_currency_for_ptbr(running_balance)
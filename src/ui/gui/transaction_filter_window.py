@@ -62,6 +62,8 @@ class FilterCriteria:
 
     category: str | None = None
 
+    description: str | None = None
+
 
 class TransactionFilterWindow(QDialog):
     def __init__(self, parent: QWidget = None):
@@ -108,6 +110,8 @@ class TransactionFilterWindow(QDialog):
         self._start_date = QLineEdit()
         self._end_date = QLineEdit()
 
+        self._description = QLineEdit()
+
         # Combo Boxes ------------------------------------------------------------------
         self._type_combobox = QComboBox()
         self._category_combobox = QComboBox()
@@ -136,6 +140,8 @@ class TransactionFilterWindow(QDialog):
 
         self._category_label = QLabel("Categoria: ")
 
+        self._description_label = QLabel("Descrição: ")
+
         self._setup_user_interface()
 
     @property
@@ -182,11 +188,13 @@ class TransactionFilterWindow(QDialog):
         self._max_amount.setTextMargins(5, 2, 5, 2)
         self._start_date.setTextMargins(5, 2, 5, 2)
         self._end_date.setTextMargins(5, 2, 5, 2)
+        self._description.setTextMargins(5, 2, 5, 2)
 
         self._min_amount.setPlaceholderText("ex: 1.234,50 ou 1234.50")
         self._max_amount.setPlaceholderText("ex: 1.234,50 ou 1234.50")
         self._start_date.setPlaceholderText("dd/mm/aaaa")
         self._end_date.setPlaceholderText("dd/mm/aaaa")
+        self._description.setPlaceholderText("ex: mercado, posto")
 
     def _config_comboboxes(self) -> None:
         self._type_combobox.addItem("")
@@ -239,6 +247,8 @@ class TransactionFilterWindow(QDialog):
 
         self._form_layout.addRow(self._category_label, self._category_combobox)
 
+        self._form_layout.addRow(self._description_label, self._description)
+
         self._buttons_layout.addStretch()
         self._buttons_layout.addWidget(self._confirm_button)
         self._buttons_layout.addWidget(self._reset_button)
@@ -317,6 +327,8 @@ class TransactionFilterWindow(QDialog):
 
         self._filter_criteria.category = self._category_combobox.currentText() or None
 
+        self._filter_criteria.description = self._description.text().strip() or None
+
     def _build_sorting_criteria(self) -> None:
         self.sorting_criteria.field = self.field_map.get(
             self._sort_field_group.checkedId(), self.sorting_criteria.field
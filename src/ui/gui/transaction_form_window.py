@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import date
 from copy import deepcopy
 from enum import Enum
@@ -15,8 +15,9 @@ from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QListView,
+    QCompleter,
 )
-from PySide6.QtCore import QRegularExpression, Qt
+from PySide6.QtCore import QRegularExpression, Qt, QStringListModel
 from PySide6.QtGui import QRegularExpressionValidator
 
 from src.utils.constants import (
@@ -43,11 +44,15 @@ class TransactionFormWindow(QDialog):
         parent: QWidget = None,
         mode: DialogMode = DialogMode.CREATEMODE,
         transaction: Transaction = None,
+        description_suggestions: Callable[[str], list[str]] | None = None,
     ):
         super().__init__(parent)
         if transaction is not None:
             self._transaction = transaction
 
+        # Função que devolve as descrições já usadas para um prefixo (autocompletar)
+        self._description_suggestions = description_suggestions
+
         self._main_layout = QVBoxLayout()
 
         self._main_card = QFrame()
@@ -62,6 +67,10 @@ class TransactionFormWindow(QDialog):
         self._date_line = QLineEdit()
         self._description_line = QLineEdit()
 
+        # Autocompletar da descrição ---------------------------------------------------
+        self._description_completer = QCompleter(self)
+        self._description_completer_model = QStringListModel(self)
+
         # Dropdown de categorias e tipos -----------------------------------------------
         self._type_combobox = QComboBox()
         self._category_combobox = QComboBox()
@@ -159,6 +168,21 @@ class TransactionFormWindow(QDialog):
         self._date_line.setPlaceholderText("dd/mm/aaaa")
         self._description_line.setPlaceholderText("Campo opcional")
 
+        if self._description_suggestions is not None:
+            self._config_description_completer()
+
+    def _config_description_completer(self) -> None:
+        # As sugestões já chegam filtradas e ordenadas por frequência; o QCompleter só as exibe.
+        self._description_completer.setModel(self._description_completer_model)
+        self._description_completer.setCaseSensitivity(
+            Qt.CaseSensitivity.CaseInsensitive
+        )
+        self._description_completer.setCompletionMode(
+            QCompleter.CompletionMode.UnfilteredPopupCompletion
+        )
+        self._description_line.setCompleter(self._description_completer)
+        self._description_line.textEdited.connect(self._on_description_edited)
+
     def _config_combobox(self, mode) -> None:
         self._type_combobox.addItems(
             formatter.capitalize_dict_values(TRANSACTION_TYPE_TABLE).values()
@@ -251,6 +275,14 @@ class TransactionFormWindow(QDialog):
         self._user_input_dict.update(str_dict)
         self.destroy()
 
+    def _on_description_edited(self, text: str) -> None:
+        suggestions = self._description_suggestions(text.lstrip())
+        self._description_completer_model.setStringList(suggestions)
+        if suggestions:
+            self._description_completer.complete()
+        else:
+            self._description_completer.popup().hide()
+
     def _on_type_selection_changed(self, *_args) -> None:
         self._category_combobox.clear()
         self._category_combobox.addItems(self._get_category_combobox_items())
@@ -47,6 +47,9 @@ TRANSACTION_TYPE_TABLE: dict[str, str] = {"1": "receita", "2": "despesa"}
 
 # Outras constantes
 DATE_FORMAT = "%d/%m/%Y"
+LARGEST_EXPENSES_COUNT = 10  # Linhas da seção "Maiores despesas" dos relatórios
+TOP_DESCRIPTIONS_COUNT = 10  # Linhas de cada ranking da seção "Principais descrições" dos relatórios
+UNUSUAL_EXPENSES_COUNT = 10  # Linhas da seção "Despesas fora do padrão" dos relatórios
 
 APP_TITLE = """
  ####### ### #     #  #####  ####### #     # #######
@@ -69,4 +72,6 @@ EDIT_ICON = QIcon(str(ICONS_DIR / "edit_fincontroller.svg"))
 DELETE_ICON = QIcon(str(ICONS_DIR / "delete_fincontroller.svg"))
 FILTER_ICON = QIcon(str(ICONS_DIR / "filter_fincontroller.svg"))
 REPORT_ICON = QIcon(str(ICONS_DIR / "docs_fincontroller.svg"))
+IMPORT_ICON = QIcon(str(ICONS_DIR / "import_fincontroller.svg"))
+EXPORT_ICON = QIcon(str(ICONS_DIR / "export_fincontroller.svg"))
 WINDOW_ICON = QIcon(str(ICONS_DIR / "app_icon_fincontroller.svg"))